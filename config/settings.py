@@ -1,14 +1,53 @@
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import Field, SecretStr
+from pydantic import BaseModel, Field, SecretStr, create_model, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 CONFIG_DIR = Path(__file__).resolve().parent
 
 
+class RouteProfile(BaseModel):
+    """Network routing rules applied to UI browser contexts."""
+
+    block_resource_types: list[str] = Field(
+        default_factory=list, description="Playwright resource types to abort (image, font...)"
+    )
+    block_url_patterns: list[str] = Field(
+        default_factory=list, description="URL globs to abort (e.g. *google-analytics.com*)"
+    )
+    stub_hosts: list[str] = Field(
+        default_factory=list, description="Hosts (and subdomains) answered with empty stubs"
+    )
+    cache_static: bool = Field(default=False, description="Serve static assets from local cache")
+    cache_ttl: int = Field(default=3600, description="Seconds a cached asset stays fresh")
+
+
+ANALYTICS_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*mc.yandex.ru*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*sentry.io*",
+]
+
+ROUTE_PROFILES = {
+    "off": RouteProfile(),
+    "lean": RouteProfile(
+        block_resource_types=["image", "media", "font"],
+        block_url_patterns=ANALYTICS_URL_PATTERNS,
+        stub_hosts=["fonts.googleapis.com", "fonts.gstatic.com"],
+        cache_static=True,
+    ),
+    "cached": RouteProfile(block_url_patterns=ANALYTICS_URL_PATTERNS, cache_static=True),
+}
+
+
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
 
@@ -31,7 +70,93 @@ class Settings(BaseSettings):
         default="chromium", description="Browser for UI tests"
     )
     headless: bool = Field(default=True, description="Run browser in headless mode")
+    browser_mode: Literal["launch", "shared"] = Field(
+        default="launch",
+        description="Launch browser per worker or share one Chromium per machine",
+    )
     slow_mo: int = Field(default=0, description="Slow down browser actions by ms")
+    context_pool_size: int = Field(
+        default=2, description="Max idle browser contexts reused per worker (0 disables pool)"
+    )
+    context_max_uses: int = Field(
+        default=50, description="Tests after which a pooled browser context is recycled"
+    )
+
+    # UI network routing
+    ui_route_profile: str = Field(
+        default="off", description="Routing profile applied to UI contexts"
+    )
+    ui_route_profiles: dict[str, RouteProfile] = Field(
+        default_factory=lambda: dict(ROUTE_PROFILES),
+        description="Available routing profiles (JSON in env, merged over built-ins)",
+    )
+
+    # UI failure artifacts
+    screenshot_format: Literal["png", "jpeg"] = Field(
+        default="jpeg", description="Format of failure screenshots"
+    )
+    screenshot_quality: int = Field(default=70, description="JPEG quality of screenshots (0-100)")
+    screenshot_full_page: bool = Field(
+        default=False, description="Capture full scrollable page instead of viewport"
+    )
+    trace_mode: Literal["off", "on_failure", "on_rerun"] = Field(
+        default="off", description="Keep Playwright trace of failed tests or of reruns only"
+    )
+    video_mode: Literal["off", "on_failure", "on_rerun"] = Field(
+        default="off", description="Keep video of failed tests or record reruns only"
+    )
+    artifact_max_mb: int = Field(default=20, description="Size cap per attached artifact (MB)")
+
+    # UI visual regression
+    visual_baseline_dir: Path = Field(
+        default=BASE_DIR / "testdata" / "visual",
+        description="Directory with baseline screenshots, one subdirectory per browser",
+    )
+    visual_update: bool = Field(
+        default=False, description="Overwrite baselines with new screenshots"
+    )
+    visual_max_diff_ratio: float = Field(
+        default=0.001, description="Allowed share of changed pixels"
+    )
+    visual_pixel_tolerance: int = Field(
+        default=16, description="Per-channel difference not counted as a change"
+    )
+    visual_max_phash_distance: int | None = Field(
+        default=None, description="Allowed perceptual hash distance (unset: not checked)"
+    )
+
+    # UI page performance metrics
+    perf_metrics: bool = Field(
+        default=False, description="Measure page timings when page objects open or load"
+    )
+    perf_cdp: bool = Field(default=True, description="Add CDP performance metrics (Chromium)")
+    perf_budget_mode: Literal["warn", "fail"] = Field(
+        default="warn", description="Log page budget violations or fail the test"
+    )
+
+    # UI HAR record/replay
+    ui_har_mode: Literal["off", "record", "replay"] = Field(
+        default="off", description="Record backend traffic of UI tests or replay it"
+    )
+    ui_har_dir: Path = Field(
+        default=BASE_DIR / "testdata" / "har", description="Directory with per-test HAR files"
+    )
+    ui_har_url_filter: str = Field(
+        default="", description="URL glob recorded/replayed (default: API_URL requests)"
+    )
+    ui_har_strict: bool = Field(
+        default=False, description="Fail UI tests issuing requests missing from their HAR"
+    )
+
+    # UI authentication
+    ui_auth_mode: Literal["form", "storage_state"] = Field(
+        default="form",
+        description="Authenticate UI pages via login form or API token injection",
+    )
+    ui_token_storage: Literal["local_storage", "cookie"] = Field(
+        default="local_storage", description="Where the web app keeps its auth token"
+    )
+    ui_token_key: str = Field(default="token", description="Storage key of the auth token")
 
     # Timeouts (in milliseconds)
     default_timeout: int = Field(default=15000, description="Default timeout for UI actions")
@@ -52,18 +177,86 @@ class Settings(BaseSettings):
         default="/api/public/registration", description="Auth register path"
     )
     auth_token_field: str = Field(default="jwt-token", description="JWT token field name")
+    token_cache_shared: bool = Field(
+        default=True, description="Share cached tokens between xdist workers via file lock"
+    )
+    token_refresh_margin: int = Field(
+        default=60, description="Refresh cached token this many seconds before expiry"
+    )
 
     # Logging
     log_sensitive: bool = Field(default=False, description="Allow logging sensitive data")
+    log_level: str = Field(default="INFO", description="Console log level")
+    log_enqueue: bool = Field(
+        default=True, description="Write logs through a background queue (non-blocking)"
+    )
+    log_failed_only: bool = Field(
+        default=False, description="Buffer console logs and emit them only for failed tests"
+    )
+
+    # Test data
+    user_pool_size: int = Field(default=4, description="Max idle pooled users per worker")
+    test_data_seed: int | None = Field(
+        default=None, description="Base seed of generated test data (random if unset)"
+    )
+    cleanup_workers: int = Field(default=4, description="Max concurrent cleanups per test")
+    sweep_orphans: bool = Field(
+        default=True, description="Delete resources journaled by earlier crashed runs"
+    )
+    sweep_min_age_seconds: float = Field(
+        default=900, description="Sweep only journals untouched for this long"
+    )
 
     # Parallel execution
     workers: int = Field(default=4, description="Number of parallel workers")
 
+    @field_validator("ui_route_profiles")
+    @classmethod
+    def _merge_route_profiles(cls, value: dict[str, RouteProfile]) -> dict[str, RouteProfile]:
+        return {**ROUTE_PROFILES, **value}
+
+    @property
+    def route_profile(self) -> RouteProfile:
+        """Active UI routing profile."""
+        return self.ui_route_profiles[self.ui_route_profile]
+
+    @property
+    def har_url_filter(self) -> str:
+        """URL glob of requests recorded to and replayed from HAR."""
+        return self.ui_har_url_filter or f"{self.api_url.rstrip('/')}/**"
+
     @property
     def api_timeout_seconds(self) -> float:
         """API timeout in seconds for httpx."""
         return self.api_timeout / 1000
 
+    def snapshot(self) -> dict[str, Any]:
+        """Dump settings, secrets included, as JSON-compatible values.
+
+        ``from_snapshot()`` rebuilds equal settings in another process
+        (e.g. an xdist worker) without reading env files.
+        """
+        data = self.model_dump(mode="json")
+        for name in type(self).model_fields:
+            value = getattr(self, name)
+            if isinstance(value, SecretStr):
+                data[name] = value.get_secret_value()
+        return data
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> "Settings":
+        """Rebuild settings from ``snapshot()`` values.
+
+        Values are validated against field types by a plain model: settings
+        sources (env files, environment) are not even constructed.
+        """
+        validated = _snapshot_model().model_validate(snapshot)
+        return cls.model_construct(**dict(validated))
+
+    def with_overrides(self, **overrides: Any) -> "Settings":
+        """Copy settings with validated overrides (e.g. from CLI options)."""
+        return self.from_snapshot({**self.snapshot(), **overrides})
+
     def validate_runtime(self) -> None:
         """Validate required runtime configuration."""
         if not self.api_url:
@@ -76,6 +269,17 @@ class Settings(BaseSettings):
             raise ValueError("AUTH_REGISTER_PATH must start with '/'")
         if not self.auth_token_field:
             raise ValueError("AUTH_TOKEN_FIELD is required")
+        if self.ui_route_profile not in self.ui_route_profiles:
+            raise ValueError(f"UI_ROUTE_PROFILE must be one of {sorted(self.ui_route_profiles)}")
+
+
+@lru_cache
+def _snapshot_model() -> type[BaseModel]:
+    """Plain model with the fields of ``Settings``."""
+    fields: dict[str, Any] = {
+        name: (field.annotation, field) for name, field in Settings.model_fields.items()
+    }
+    return create_model("SettingsSnapshot", **fields)
 
 
 @lru_cache
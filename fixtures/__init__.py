@@ -0,0 +1,6 @@
+import pytest
+
+from config.settings import Settings
+
+# Settings resolved once per process by tests/conftest.py (workers rebuild them from a snapshot)
+SETTINGS_KEY = pytest.StashKey[Settings]()
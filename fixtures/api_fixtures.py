@@ -1,13 +1,25 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
 
 from config.settings import Settings
+from fixtures import SETTINGS_KEY
+from src.api.aio.sdk import AsyncApiContext
 from src.api.client import APIClient
 from src.api.endpoints.auth import AuthAPI
 from src.api.endpoints.users import UsersAPI
 from src.api.sdk import ApiContext
 from src.utils.auth_helper import AuthHelper
+from src.utils.token_cache import TOKEN_CACHE_DIR, TokenCache
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove shared token file once all workers have finished."""
+    if hasattr(config, "workerinput"):
+        return
+    settings = config.stash.get(SETTINGS_KEY, None)
+    if settings is not None and settings.token_cache_shared:
+        TokenCache(shared_dir=TOKEN_CACHE_DIR).clear_shared()
 
 
 @pytest.fixture
@@ -31,16 +43,38 @@ def api_context(settings: Settings) -> Generator[ApiContext, None, None]:
 
 
 @pytest.fixture
-def auth_helper(settings: Settings, api_client: APIClient) -> AuthHelper:
+async def async_api_context(settings: Settings) -> AsyncGenerator[AsyncApiContext, None]:
+    """Create async API context; use from ``async def`` tests."""
+    context = AsyncApiContext(settings)
+    yield context
+    await context.aclose()
+
+
+@pytest.fixture(scope="session")
+def token_cache(settings: Settings) -> TokenCache:
+    """Create token cache shared by all auth helpers of the session.
+
+    Returns:
+        Token cache instance.
+    """
+    return TokenCache(
+        refresh_margin=settings.token_refresh_margin,
+        shared_dir=TOKEN_CACHE_DIR if settings.token_cache_shared else None,
+    )
+
+
+@pytest.fixture
+def auth_helper(settings: Settings, api_client: APIClient, token_cache: TokenCache) -> AuthHelper:
     """Create auth helper with API client.
 
     Args:
         api_client: API client fixture.
+        token_cache: Token cache fixture.
 
     Returns:
         Auth helper instance.
     """
-    return AuthHelper(settings, api_client)
+    return AuthHelper(settings, api_client, token_cache=token_cache)
 
 
 @pytest.fixture
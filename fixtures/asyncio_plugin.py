@@ -0,0 +1,91 @@
+"""Run ``async def`` tests and fixtures on one event loop per xdist worker.
+
+Async fixtures of any scope and async tests share the loop, so a
+session-scoped async client can be awaited from every async test.
+"""
+
+import functools
+import inspect
+from asyncio import Runner
+from collections.abc import AsyncGenerator, Callable, Coroutine, Generator
+from typing import Any, TypeVar
+
+import pytest
+
+R = TypeVar("R")
+
+RUNNER_KEY = pytest.StashKey[Runner]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Create event loop runner of this process (the loop itself starts on first use)."""
+    config.stash[RUNNER_KEY] = Runner()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Close event loop after session-scoped async fixtures were torn down."""
+    runner = config.stash.get(RUNNER_KEY, None)
+    if runner is not None:
+        runner.close()
+
+
+def run(config: pytest.Config, coroutine: Coroutine[Any, Any, R]) -> R:
+    """Run coroutine on the loop of this process, e.g. from a sync fixture."""
+    return config.stash[RUNNER_KEY].run(coroutine)
+
+
+async def _next(generator: AsyncGenerator[R, None]) -> R:
+    return await anext(generator)
+
+
+def _sync_fixture(func: Callable[..., Any], runner: Runner) -> Callable[..., Any]:
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        def generator_fixture(*args: Any, **kwargs: Any) -> Generator[Any, None, None]:
+            generator = func(*args, **kwargs)
+            yield runner.run(_next(generator))
+            try:
+                runner.run(_next(generator))
+            except StopAsyncIteration:
+                return
+            raise ValueError(f"Async fixture {func.__name__} yielded more than once")
+
+        return generator_fixture
+
+    @functools.wraps(func)
+    def fixture(*args: Any, **kwargs: Any) -> Any:
+        return runner.run(func(*args, **kwargs))
+
+    return fixture
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_fixture_setup(fixturedef: pytest.FixtureDef[Any], request: pytest.FixtureRequest) -> Any:
+    """Set up async fixtures through a sync wrapper driving the shared loop."""
+    original = func = fixturedef.func
+    if not (inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func)):
+        return (yield)
+    if (
+        request.instance is not None
+        and inspect.ismethod(func)
+        and isinstance(request.instance, type(func.__self__))
+    ):
+        # Fixture method of the test class: pytest binds it to the collection-time instance
+        func = func.__func__.__get__(request.instance)
+    fixturedef.func = _sync_fixture(func, request.config.stash[RUNNER_KEY])  # type: ignore[misc]
+    try:
+        return (yield)
+    finally:
+        fixturedef.func = original  # type: ignore[misc]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> bool | None:
+    """Run ``async def`` test on the shared loop."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    funcargs = pyfuncitem.funcargs
+    testargs = {arg: funcargs[arg] for arg in pyfuncitem._fixtureinfo.argnames}
+    pyfuncitem.config.stash[RUNNER_KEY].run(pyfuncitem.obj(**testargs))
+    return True
@@ -1,6 +1,9 @@
+from typing import Any
+
 import pytest
 
 from src.api.models.users import UserCreate
+from testdata.datasets import DatasetRecord
 from testdata.factories.user_factory import UserFactory
 
 
@@ -21,7 +24,7 @@ def user_data_batch() -> list[UserCreate]:
     Returns:
         List of user creation data.
     """
-    return [UserFactory.build_create() for _ in range(5)]
+    return UserFactory.build_batch(5)
 
 
 @pytest.fixture
@@ -52,3 +55,17 @@ def test_password() -> str:
         Random password.
     """
     return UserFactory.build_password()
+
+
+@pytest.fixture
+def data_record(request: pytest.FixtureRequest) -> dict[str, Any]:
+    """Load dataset record of a test parametrized with ``dataset_params``.
+
+    Args:
+        request: Pytest request with the record reference as param.
+
+    Returns:
+        Parsed record.
+    """
+    record: DatasetRecord = request.param
+    return record.load()
@@ -1,12 +1,68 @@
+import uuid
 from collections.abc import Generator
+from pathlib import Path
+from typing import Any
 
 import allure
 import pytest
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Video,
+    sync_playwright,
+)
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from config.settings import Settings
+from fixtures import SETTINGS_KEY
+from fixtures.asyncio_plugin import RUNNER_KEY
+from src.api.client import APIClient
+from src.ui.aio.session import AsyncBrowserSession
+from src.ui.auth_state import StorageStateProvider, apply_storage_state
+from src.ui.browser_server import BrowserProvider, SharedBrowserServer
+from src.ui.context_pool import ContextPool
+from src.ui.har import HarIndex, HarReplayer, har_path_for
 from src.ui.pages.dashboard_page import DashboardPage
 from src.ui.pages.login_page import LoginPage
+from src.ui.perf import PerfRecorder, set_perf_recorder, write_summary
+from src.ui.routing import RouteHandler, build_route_handler
+from src.ui.visual import VisualBaselines, set_visual_baselines
+from src.utils.artifacts import ArtifactWriter, set_artifact_writer
+from src.utils.auth_helper import AuthHelper
+from src.utils.logger import logger
+from src.utils.token_cache import TokenCache
+
+# Id of this test run; shared browser servers started by its workers record it as owner
+RUN_ID_KEY = pytest.StashKey[str]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Draw run id on the controller; xdist workers receive it in their input."""
+    config.stash[RUN_ID_KEY] = getattr(config, "workerinput", {}).get("run_id") or uuid.uuid4().hex
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node: Any) -> None:
+    """Hand run id to an xdist worker (controller only)."""
+    node.workerinput["run_id"] = node.config.stash[RUN_ID_KEY]
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Stop shared browser this run started and summarize page metrics once workers finished."""
+    if hasattr(config, "workerinput"):
+        return
+    write_summary()
+    if SharedBrowserServer.supported and config.stash[SETTINGS_KEY].browser_mode == "shared":
+        # Servers started standalone or by a concurrent run are left running
+        SharedBrowserServer().stop(owner=config.stash[RUN_ID_KEY])
+
+
+CONTEXT_OPTIONS: dict[str, Any] = {
+    "viewport": {"width": 1920, "height": 1080},
+    "ignore_https_errors": True,
+}
 
 
 @pytest.fixture(scope="session")
@@ -21,49 +77,372 @@ def playwright_instance() -> Generator[Playwright, None, None]:
 
 
 @pytest.fixture(scope="session")
-def browser(settings: Settings, playwright_instance: Playwright) -> Generator[Browser, None, None]:
-    """Launch browser based on settings.
+def browser_provider(
+    settings: Settings, playwright_instance: Playwright, pytestconfig: pytest.Config
+) -> Generator[BrowserProvider, None, None]:
+    """Provide connected browser, reconnecting after a browser crash.
+
+    With ``BROWSER_MODE=shared`` all workers of the machine attach to one
+    Chromium server instead of launching a browser each.
 
     Args:
         playwright_instance: Playwright fixture.
 
     Yields:
-        Browser instance.
+        Browser provider.
     """
     browser_type = getattr(playwright_instance, settings.browser)
-    browser = browser_type.launch(
-        headless=settings.headless,
-        slow_mo=settings.slow_mo,
+
+    def _launch() -> Browser:
+        browser: Browser = browser_type.launch(
+            headless=settings.headless,
+            slow_mo=settings.slow_mo,
+        )
+        return browser
+
+    connect = _launch
+    if settings.browser_mode == "shared":
+        if settings.browser != "chromium" or not SharedBrowserServer.supported:
+            logger.warning("Shared browser needs Chromium on POSIX, launching per worker")
+        else:
+            server = SharedBrowserServer(
+                headless=settings.headless, owner=pytestconfig.stash[RUN_ID_KEY]
+            )
+
+            def _attach() -> Browser:
+                return playwright_instance.chromium.connect_over_cdp(
+                    server.endpoint(), slow_mo=settings.slow_mo
+                )
+
+            connect = _attach
+
+    provider = BrowserProvider(connect)
+    yield provider
+    provider.close()
+
+
+@pytest.fixture(scope="session")
+def browser(browser_provider: BrowserProvider) -> Browser:
+    """Get browser based on settings.
+
+    Args:
+        browser_provider: Browser provider fixture.
+
+    Returns:
+        Browser instance.
+    """
+    return browser_provider.get()
+
+
+@pytest.fixture(scope="session")
+def route_handler(settings: Settings) -> RouteHandler | None:
+    """Build route handler for active routing profile (``UI_ROUTE_PROFILE``).
+
+    Returns:
+        Route handler, or None when profile routes nothing.
+    """
+    return build_route_handler(settings.route_profile)
+
+
+def _prepare_context(context: BrowserContext, route_handler: RouteHandler | None) -> None:
+    if route_handler is not None:
+        route_handler.apply(context)
+
+
+@pytest.fixture(scope="session")
+def context_pool(
+    settings: Settings,
+    browser_provider: BrowserProvider,
+    route_handler: RouteHandler | None,
+) -> Generator[ContextPool, None, None]:
+    """Pool of warm browser contexts for this worker.
+
+    Args:
+        browser_provider: Browser provider fixture.
+        route_handler: Route handler fixture.
+
+    Yields:
+        Context pool.
+    """
+
+    def _new_context() -> BrowserContext:
+        context = browser_provider.get().new_context(**CONTEXT_OPTIONS)
+        context.set_default_timeout(settings.default_timeout)
+        return context
+
+    pool = ContextPool(
+        _new_context,
+        max_size=settings.context_pool_size,
+        max_uses=settings.context_max_uses,
+        prepare=lambda context: _prepare_context(context, route_handler),
     )
-    yield browser
-    browser.close()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def artifact_writer(settings: Settings) -> Generator[ArtifactWriter, None, None]:
+    """Provide writer attaching failure artifacts off the test thread.
+
+    Args:
+        settings: Settings with artifact policy.
+
+    Yields:
+        Artifact writer.
+    """
+    writer = ArtifactWriter.from_settings(settings)
+    set_artifact_writer(writer)
+    yield writer
+    writer.close()
+    set_artifact_writer(None)
+
+
+@pytest.fixture(scope="session")
+def perf_recorder(settings: Settings) -> Generator[PerfRecorder | None, None, None]:
+    """Provide page metrics recorder when ``PERF_METRICS`` is on.
+
+    Args:
+        settings: Settings with performance options.
+
+    Yields:
+        Recorder, or None if page metrics are off.
+    """
+    if not settings.perf_metrics:
+        yield None
+        return
+    recorder = PerfRecorder.from_settings(settings)
+    set_perf_recorder(recorder)
+    yield recorder
+    recorder.close()
+    set_perf_recorder(None)
+
+
+@pytest.fixture(scope="session")
+def visual_baselines(settings: Settings) -> Generator[VisualBaselines, None, None]:
+    """Provide baseline store for ``BasePage.assert_matches_baseline``.
+
+    Args:
+        settings: Settings with visual comparison options.
+
+    Yields:
+        Visual baseline store.
+    """
+    baselines = VisualBaselines.from_settings(settings)
+    set_visual_baselines(baselines)
+    yield baselines
+    set_visual_baselines(None)
+
+
+def _records(mode: str, request: pytest.FixtureRequest) -> bool:
+    """Check if trace/video artifact policy records this test run."""
+    if mode == "on_failure":
+        return True
+    # Without pytest-rerunfailures execution_count is never set
+    return mode == "on_rerun" and getattr(request.node, "execution_count", 1) > 1
+
+
+def _test_failed(request: pytest.FixtureRequest) -> bool:
+    return request.node.rep_call.failed if hasattr(request.node, "rep_call") else True
 
 
 @pytest.fixture
-def context(settings: Settings, browser: Browser) -> Generator[BrowserContext, None, None]:
+def context(
+    settings: Settings,
+    browser_provider: BrowserProvider,
+    route_handler: RouteHandler | None,
+    artifact_writer: ArtifactWriter,
+    tmp_path: Path,
+    request: pytest.FixtureRequest,
+) -> Generator[BrowserContext, None, None]:
     """Create browser context for test isolation.
 
+    Contexts are taken from the warm pool unless ``CONTEXT_POOL_SIZE=0``;
+    the context of a failed test is closed rather than reused. With
+    ``UI_HAR_MODE`` backend traffic is recorded to, or replayed from, the
+    test's own HAR file. ``TRACE_MODE`` and ``VIDEO_MODE`` decide which
+    runs are traced or recorded; artifacts are kept only for failed tests
+    (or every rerun with ``on_rerun``).
+
     Args:
-        browser: Browser fixture.
+        browser_provider: Browser provider fixture.
+        route_handler: Route handler fixture.
+        artifact_writer: Artifact writer fixture.
+        tmp_path: Per-test directory for trace and video files.
+        request: Pytest request for test info.
 
     Yields:
         Browser context.
     """
-    context = browser.new_context(
-        viewport={"width": 1920, "height": 1080},
-        ignore_https_errors=True,
+    har_path = har_path_for(settings.ui_har_dir, request.node.nodeid)
+    record_video = _records(settings.video_mode, request)
+    pool: ContextPool | None = None
+    if settings.ui_har_mode == "record" or record_video:
+        # HAR and video are creation-time options: such contexts are never pooled
+        options: dict[str, Any] = dict(CONTEXT_OPTIONS)
+        if settings.ui_har_mode == "record":
+            har_path.parent.mkdir(parents=True, exist_ok=True)
+            options.update(
+                record_har_path=har_path,
+                record_har_url_filter=settings.har_url_filter,
+                record_har_content="embed",
+                record_har_mode="minimal",
+            )
+        if record_video:
+            options["record_video_dir"] = tmp_path / "video"
+        context = browser_provider.get().new_context(**options)
+        context.set_default_timeout(settings.default_timeout)
+        _prepare_context(context, route_handler)
+    elif settings.context_pool_size <= 0:
+        context = browser_provider.get().new_context(**CONTEXT_OPTIONS)
+        context.set_default_timeout(settings.default_timeout)
+        _prepare_context(context, route_handler)
+    else:
+        pool = request.getfixturevalue("context_pool")
+        context = pool.checkout()
+
+    replayer = (
+        _replay_har(settings, context, har_path) if settings.ui_har_mode == "replay" else None
     )
+    traced = _records(settings.trace_mode, request)
+    if traced:
+        context.tracing.start(screenshots=True, snapshots=True)
+    videos: list[Video] = []
+    if record_video:
+
+        def collect_video(page: Page) -> None:
+            if page.video is not None:
+                videos.append(page.video)
+
+        context.on("page", collect_video)
+    yield context
+
+    failed = _test_failed(request)
+    name = request.node.name
+    if traced:
+        if failed or settings.trace_mode == "on_rerun":
+            trace_path = tmp_path / "trace.zip"
+            context.tracing.stop(path=trace_path)
+            artifact_writer.attach_file(trace_path, f"trace_{name}", allure.attachment_type.ZIP)
+        else:
+            context.tracing.stop()
+    if pool is None:
+        context.close()
+    else:
+        pool.checkin(context, discard=failed)
+    # Video files are complete only once the context is closed
+    for index, video in enumerate(videos):
+        video_path = Path(video.path())
+        if failed or settings.video_mode == "on_rerun":
+            artifact_writer.attach_file(
+                video_path, f"video_{name}_{index}", allure.attachment_type.WEBM
+            )
+        else:
+            video_path.unlink(missing_ok=True)
+    if replayer is not None and replayer.misses:
+        pytest.fail(f"Requests missing from {har_path.name}: {replayer.misses}", pytrace=False)
+
+
+def _replay_har(settings: Settings, context: BrowserContext, har_path: Path) -> HarReplayer | None:
+    if not har_path.exists():
+        if settings.ui_har_strict:
+            pytest.fail(f"No HAR recorded for this test: {har_path}", pytrace=False)
+        logger.warning(f"No HAR recorded at {har_path}, using live backend")
+        return None
+    replayer = HarReplayer(HarIndex.load(har_path), strict=settings.ui_har_strict)
+    # Added after profile routes, so it is consulted first
+    context.route(settings.har_url_filter, replayer)
+    return replayer
+
+
+@pytest.fixture(scope="session")
+def ui_storage_state(
+    settings: Settings, token_cache: TokenCache
+) -> Generator[StorageStateProvider, None, None]:
+    """Provide test user storage state, logged in via API once per worker.
+
+    Args:
+        token_cache: Token cache fixture.
+
+    Yields:
+        Storage state provider.
+    """
+    client = APIClient(settings=settings)
+    yield StorageStateProvider(settings, AuthHelper(settings, client, token_cache=token_cache))
+    client.close()
+
+
+@pytest.fixture
+def authenticated_context(
+    settings: Settings,
+    browser_provider: BrowserProvider,
+    route_handler: RouteHandler | None,
+    ui_storage_state: StorageStateProvider,
+) -> Generator[BrowserContext, None, None]:
+    """Create browser context already authenticated as test user.
+
+    Args:
+        browser_provider: Browser provider fixture.
+        route_handler: Route handler fixture.
+        ui_storage_state: Storage state provider fixture.
+
+    Yields:
+        Authenticated browser context.
+    """
+    options = {**CONTEXT_OPTIONS, "storage_state": ui_storage_state.get()}
+    context = browser_provider.get().new_context(**options)
     context.set_default_timeout(settings.default_timeout)
+    _prepare_context(context, route_handler)
     yield context
     context.close()
 
 
+@pytest.fixture(scope="session")
+def async_browser_session(
+    settings: Settings, request: pytest.FixtureRequest
+) -> Generator[AsyncBrowserSession, None, None]:
+    """Async browser on the event loop of this worker, shared with ``async def`` tests.
+
+    Yields:
+        Async browser session.
+    """
+    session = AsyncBrowserSession(
+        settings, context_options=CONTEXT_OPTIONS, runner=request.config.stash[RUNNER_KEY]
+    )
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def async_ui(
+    async_browser_session: AsyncBrowserSession,
+) -> Generator[AsyncBrowserSession, None, None]:
+    """Run several async pages or contexts concurrently within one test.
+
+    Args:
+        async_browser_session: Async browser session fixture.
+
+    Yields:
+        Async browser session; contexts left open by the test are closed.
+    """
+    yield async_browser_session
+    async_browser_session.close_contexts()
+
+
 @pytest.fixture
-def page(context: BrowserContext, request: pytest.FixtureRequest) -> Generator[Page, None, None]:
+def page(
+    context: BrowserContext,
+    artifact_writer: ArtifactWriter,
+    perf_recorder: PerfRecorder | None,
+    visual_baselines: VisualBaselines,
+    request: pytest.FixtureRequest,
+) -> Generator[Page, None, None]:
     """Create page with screenshot on failure.
 
     Args:
         context: Browser context fixture.
+        artifact_writer: Artifact writer fixture.
+        perf_recorder: Page metrics recorder used by page objects.
+        visual_baselines: Baseline store used by page objects.
         request: Pytest request for test info.
 
     Yields:
@@ -74,11 +453,10 @@ def page(context: BrowserContext, request: pytest.FixtureRequest) -> Generator[P
 
     # Screenshot on failure
     if request.node.rep_call.failed if hasattr(request.node, "rep_call") else False:
-        screenshot = page.screenshot()
-        allure.attach(
-            screenshot,
-            name=f"screenshot_{request.node.name}",
-            attachment_type=allure.attachment_type.PNG,
+        artifact_writer.attach_bytes(
+            page.screenshot(**artifact_writer.screenshot_options),
+            f"screenshot_{request.node.name}",
+            artifact_writer.screenshot_type,
         )
 
     page.close()
@@ -111,20 +489,47 @@ def dashboard_page(settings: Settings, page: Page) -> DashboardPage:
 
 
 @pytest.fixture
-def authenticated_page(settings: Settings, page: Page, login_page: LoginPage) -> Page:
+def authenticated_page(
+    settings: Settings,
+    context: BrowserContext,
+    page: Page,
+    login_page: LoginPage,
+    request: pytest.FixtureRequest,
+) -> Page:
     """Create page with authenticated user.
 
+    In ``storage_state`` mode the API token is injected into the context and
+    the dashboard is opened directly; ``form`` mode drives the login form.
+
     Args:
+        context: Browser context fixture.
         page: Page fixture.
         login_page: Login page fixture.
+        request: Pytest request for lazy fixture access.
 
     Returns:
         Authenticated page.
     """
+    if settings.ui_auth_mode == "storage_state":
+        provider: StorageStateProvider = request.getfixturevalue("ui_storage_state")
+        apply_storage_state(context, provider.get())
+        try:
+            DashboardPage(page, settings.base_url).open()
+        except PlaywrightTimeoutError as exc:
+            if LoginPage.url_path in page.url or page.locator(LoginPage.EMAIL_INPUT).count():
+                raise AssertionError(
+                    "Injected API token did not authenticate the UI: app redirected to login. "
+                    f"Check UI_TOKEN_STORAGE={settings.ui_token_storage} and "
+                    f"UI_TOKEN_KEY={settings.ui_token_key}, or use UI_AUTH_MODE=form"
+                ) from exc
+            raise
+        return page
+
     login_page.open()
     login_page.login(
         settings.test_user_email,
         settings.test_user_password.get_secret_value(),
     )
-    page.wait_for_url(f"*{DashboardPage.url_path}*")
+    page.wait_for_url(f"*{DashboardPage.url_path}*", wait_until="commit")
+    DashboardPage(page, settings.base_url).wait_for_load()
     return page
@@ -1,4 +1,5 @@
 from src.api.client import APIClient
+from src.api.middleware import ApiRequest, Middleware
 from src.api.sdk import ApiContext
 
-__all__ = ["APIClient", "ApiContext"]
+__all__ = ["APIClient", "ApiContext", "ApiRequest", "Middleware"]
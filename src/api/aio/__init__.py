@@ -0,0 +1,4 @@
+from src.api.aio.client import AsyncAPIClient
+from src.api.aio.sdk import AsyncApiContext
+
+__all__ = ["AsyncAPIClient", "AsyncApiContext"]
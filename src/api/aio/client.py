@@ -0,0 +1,220 @@
+from typing import Any
+
+import httpx
+
+from config.settings import Settings
+from src.api.middleware import (
+    ApiRequest,
+    AsyncAllureStepMiddleware,
+    AsyncMiddleware,
+    AuthMiddleware,
+    LoggingMiddleware,
+    Middleware,
+    build_async_chain,
+)
+from src.utils.logger import logger
+
+
+class AsyncAPIClient:
+    """Async HTTP client for API testing on ``httpx.AsyncClient``.
+
+    Mirrors ``APIClient``; requests awaited concurrently share one connection pool.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        base_url: str | None = None,
+        timeout: float | None = None,
+        headers: dict[str, str] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize async API client.
+
+        Args:
+            base_url: Base URL for API requests. Defaults to settings.api_url.
+            timeout: Request timeout in seconds. Defaults to settings.api_timeout_seconds.
+            headers: Default headers for all requests.
+            transport: Optional httpx transport (e.g. MockTransport for offline runs).
+        """
+        self._settings = settings
+        self.base_url = base_url or settings.api_url
+        self.timeout = timeout or settings.api_timeout_seconds
+        self._default_headers = headers or {}
+        self._token: str | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._transport = transport
+        self._middlewares: list[Middleware | AsyncMiddleware] = [
+            AsyncAllureStepMiddleware(),
+            LoggingMiddleware(log_sensitive=settings.log_sensitive),
+            AuthMiddleware(lambda: self._token, self._default_headers),
+        ]
+        self._handler = build_async_chain(self._middlewares, self._send)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get or create HTTP client instance."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                headers=self._default_headers,
+                transport=self._transport,
+            )
+        return self._client
+
+    def set_token(self, token: str) -> None:
+        """Set authorization token for subsequent requests.
+
+        Args:
+            token: JWT or OAuth token.
+        """
+        self._token = token
+        logger.debug("Token set")
+
+    def clear_token(self) -> None:
+        """Clear authorization token."""
+        self._token = None
+        logger.debug("Token cleared")
+
+    @property
+    def middlewares(self) -> tuple[Middleware | AsyncMiddleware, ...]:
+        """Get registered middlewares, outermost first."""
+        return tuple(self._middlewares)
+
+    def add_middleware(
+        self, middleware: Middleware | AsyncMiddleware, index: int | None = None
+    ) -> None:
+        """Register middleware in the request chain.
+
+        Args:
+            middleware: Async middleware, or sync middleware with request/response hooks only.
+            index: Position in chain (0 is outermost). Appends innermost by default.
+        """
+        if index is None:
+            self._middlewares.append(middleware)
+        else:
+            self._middlewares.insert(index, middleware)
+        self._handler = build_async_chain(self._middlewares, self._send)
+
+    def remove_middleware(self, middleware: Middleware | AsyncMiddleware) -> None:
+        """Unregister middleware from the request chain.
+
+        Args:
+            middleware: Previously registered middleware instance.
+        """
+        self._middlewares.remove(middleware)
+        self._handler = build_async_chain(self._middlewares, self._send)
+
+    async def _send(self, request: ApiRequest) -> httpx.Response:
+        """Send request with underlying HTTP client (end of middleware chain)."""
+        return await self.client.request(
+            request.method,
+            request.url,
+            params=request.params,
+            json=request.json,
+            data=request.data,
+            headers=request.headers,
+        )
+
+    async def get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send GET request.
+
+        Args:
+            url: Request URL (relative to base_url).
+            params: Query parameters.
+            headers: Additional headers.
+
+        Returns:
+            HTTP response.
+        """
+        return await self._handler(ApiRequest("GET", url, params=params, headers=headers))
+
+    async def post(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send POST request.
+
+        Args:
+            url: Request URL (relative to base_url).
+            json: JSON body.
+            data: Form data.
+            headers: Additional headers.
+
+        Returns:
+            HTTP response.
+        """
+        return await self._handler(ApiRequest("POST", url, json=json, data=data, headers=headers))
+
+    async def put(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send PUT request.
+
+        Args:
+            url: Request URL (relative to base_url).
+            json: JSON body.
+            headers: Additional headers.
+
+        Returns:
+            HTTP response.
+        """
+        return await self._handler(ApiRequest("PUT", url, json=json, headers=headers))
+
+    async def patch(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send PATCH request.
+
+        Args:
+            url: Request URL (relative to base_url).
+            json: JSON body.
+            headers: Additional headers.
+
+        Returns:
+            HTTP response.
+        """
+        return await self._handler(ApiRequest("PATCH", url, json=json, headers=headers))
+
+    async def delete(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send DELETE request.
+
+        Args:
+            url: Request URL (relative to base_url).
+            headers: Additional headers.
+
+        Returns:
+            HTTP response.
+        """
+        return await self._handler(ApiRequest("DELETE", url, headers=headers))
+
+    async def aclose(self) -> None:
+        """Close HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+            logger.debug("Async API client closed")
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,31 @@
+import httpx
+
+from config.settings import Settings
+from src.api.aio.client import AsyncAPIClient
+from src.api.aio.services import AsyncAccountService, AsyncAuthService, AsyncHealthService
+from src.api.contracts.registry import ContractRegistry, build_default_registry
+
+
+class AsyncApiContext:
+    """Async API SDK context holding client and services."""
+
+    def __init__(
+        self, settings: Settings, transport: httpx.AsyncBaseTransport | None = None
+    ) -> None:
+        self.settings = settings
+        self.client = AsyncAPIClient(settings=settings, transport=transport)
+        self.contracts: ContractRegistry = build_default_registry(settings)
+        self.services = AsyncApiServices(self)
+
+    async def aclose(self) -> None:
+        """Close underlying HTTP client."""
+        await self.client.aclose()
+
+
+class AsyncApiServices:
+    """High-level async services for tests."""
+
+    def __init__(self, context: AsyncApiContext) -> None:
+        self.auth = AsyncAuthService(context.client, context.settings, context.contracts)
+        self.health = AsyncHealthService(context.client, context.contracts)
+        self.account = AsyncAccountService(context.client, context.contracts)
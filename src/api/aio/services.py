@@ -0,0 +1,112 @@
+from typing import Any, cast
+
+import allure
+
+from config.settings import Settings
+from src.api.aio.client import AsyncAPIClient
+from src.api.contracts.registry import ContractRegistry
+from src.api.models.auth import LoginCredentials, UserProfileCreateRequest
+
+
+def _bearer(token: str | None) -> dict[str, str] | None:
+    # Per-request header: concurrent calls on one client may use different tokens
+    return {"Authorization": f"Bearer {token}"} if token else None
+
+
+class AsyncAuthService:
+    """Async auth service with contract validation."""
+
+    def __init__(
+        self,
+        client: AsyncAPIClient,
+        settings: Settings,
+        contracts: ContractRegistry,
+    ) -> None:
+        self._client = client
+        self._settings = settings
+        self._contracts = contracts
+
+    async def login(self, email: str, password: str) -> str:
+        """Authenticate user and return JWT token."""
+        with allure.step(f"Login with email: {email}"):
+            request = LoginCredentials(email=email, password=password)
+            response = await self._client.post(
+                self._settings.auth_login_path, json=request.model_dump()
+            )
+            response.raise_for_status()
+            payload = cast(dict[str, Any], response.json())
+            self._contracts.validate("POST", self._settings.auth_login_path, payload)
+            return self._extract_token(payload)
+
+    async def register(
+        self,
+        email: str,
+        password: str,
+        first_name: str,
+        last_name: str,
+        date_of_birth: str,
+    ) -> str:
+        """Register user and return JWT token."""
+        with allure.step(f"Register user with email: {email}"):
+            request = UserProfileCreateRequest(
+                email=email,
+                password=password,
+                first_name=first_name,
+                last_name=last_name,
+                date_of_birth=date_of_birth,
+            )
+            response = await self._client.post(
+                self._settings.auth_register_path,
+                json=request.model_dump(by_alias=True),
+            )
+            response.raise_for_status()
+            payload = cast(dict[str, Any], response.json())
+            self._contracts.validate("POST", self._settings.auth_register_path, payload)
+            return self._extract_token(payload)
+
+    def _extract_token(self, payload: dict[str, object]) -> str:
+        token_field = self._settings.auth_token_field
+        raw_token = payload.get(token_field)
+        if not isinstance(raw_token, str) or not raw_token:
+            raise ValueError(f"Token field '{token_field}' not found in response")
+        return raw_token
+
+
+class AsyncHealthService:
+    """Async health check service with contract validation."""
+
+    def __init__(self, client: AsyncAPIClient, contracts: ContractRegistry) -> None:
+        self._client = client
+        self._contracts = contracts
+
+    async def public_health(self) -> str:
+        response = await self._client.get("/api/public/health")
+        response.raise_for_status()
+        body = response.text.strip()
+        self._contracts.validate("GET", "/api/public/health", body)
+        return body
+
+    async def secured_health(self, token: str) -> str:
+        response = await self._client.get("/api/secured/health", headers=_bearer(token))
+        response.raise_for_status()
+        body = response.text.strip()
+        self._contracts.validate("GET", "/api/secured/health", body)
+        return body
+
+
+class AsyncAccountService:
+    """Async account service with contract validation."""
+
+    def __init__(self, client: AsyncAPIClient, contracts: ContractRegistry) -> None:
+        self._client = client
+        self._contracts = contracts
+
+    async def delete_current(self, token: str | None = None) -> None:
+        """Delete current account.
+
+        Args:
+            token: Token of account to delete. Defaults to client token.
+        """
+        response = await self._client.delete("/api/secured/account/delete", headers=_bearer(token))
+        response.raise_for_status()
+        self._contracts.validate("DELETE", "/api/secured/account/delete", response.text)
@@ -1,10 +1,16 @@
 from typing import Any
 
-import allure
 import httpx
 
 from config.settings import Settings
-from src.utils.helpers import sanitize_payload, sanitize_text
+from src.api.middleware import (
+    AllureStepMiddleware,
+    ApiRequest,
+    AuthMiddleware,
+    LoggingMiddleware,
+    Middleware,
+    build_chain,
+)
 from src.utils.logger import logger
 
 
@@ -17,6 +23,7 @@ class APIClient:
         base_url: str | None = None,
         timeout: float | None = None,
         headers: dict[str, str] | None = None,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         """Initialize API client.
 
@@ -24,6 +31,7 @@ class APIClient:
             base_url: Base URL for API requests. Defaults to settings.api_url.
             timeout: Request timeout in seconds. Defaults to settings.api_timeout_seconds.
             headers: Default headers for all requests.
+            transport: Optional httpx transport (e.g. MockTransport for offline runs).
         """
         self._settings = settings
         self.base_url = base_url or settings.api_url
@@ -31,7 +39,13 @@ class APIClient:
         self._default_headers = headers or {}
         self._token: str | None = None
         self._client: httpx.Client | None = None
-        self._log_sensitive = settings.log_sensitive
+        self._transport = transport
+        self._middlewares: list[Middleware] = [
+            AllureStepMiddleware(),
+            LoggingMiddleware(log_sensitive=settings.log_sensitive),
+            AuthMiddleware(lambda: self._token, self._default_headers),
+        ]
+        self._handler = build_chain(self._middlewares, self._send)
 
     @property
     def client(self) -> httpx.Client:
@@ -41,6 +55,7 @@ class APIClient:
                 base_url=self.base_url,
                 timeout=self.timeout,
                 headers=self._default_headers,
+                transport=self._transport,
             )
         return self._client
 
@@ -58,43 +73,44 @@ class APIClient:
         self._token = None
         logger.debug("Token cleared")
 
-    def _get_headers(self, headers: dict[str, str] | None = None) -> dict[str, str]:
-        """Merge default headers with request-specific headers.
+    @property
+    def middlewares(self) -> tuple[Middleware, ...]:
+        """Get registered middlewares, outermost first."""
+        return tuple(self._middlewares)
+
+    def add_middleware(self, middleware: Middleware, index: int | None = None) -> None:
+        """Register middleware in the request chain.
 
         Args:
-            headers: Request-specific headers.
+            middleware: Middleware instance.
+            index: Position in chain (0 is outermost). Appends innermost by default.
+        """
+        if index is None:
+            self._middlewares.append(middleware)
+        else:
+            self._middlewares.insert(index, middleware)
+        self._handler = build_chain(self._middlewares, self._send)
 
-        Returns:
-            Merged headers dictionary.
+    def remove_middleware(self, middleware: Middleware) -> None:
+        """Unregister middleware from the request chain.
+
+        Args:
+            middleware: Previously registered middleware instance.
         """
-        result = self._default_headers.copy()
-        if self._token:
-            result["Authorization"] = f"Bearer {self._token}"
-        if headers:
-            result.update(headers)
-        return result
-
-    def _log_request(self, method: str, url: str, **kwargs: Any) -> None:
-        """Log request details."""
-        logger.info(f"Request: {method} {url}")
-        if not self._log_sensitive:
-            return
-        if kwargs.get("json"):
-            logger.debug(f"Body: {sanitize_payload(kwargs['json'])}")
-        if kwargs.get("data"):
-            logger.debug(f"Body: {sanitize_payload(kwargs['data'])}")
-        if kwargs.get("params"):
-            logger.debug(f"Params: {sanitize_payload(kwargs['params'])}")
-
-    def _log_response(self, response: httpx.Response) -> None:
-        """Log response details."""
-        logger.info(f"Response: {response.status_code} {response.reason_phrase}")
-        if not self._log_sensitive:
-            return
-        safe_text = sanitize_text(response.text)
-        logger.debug(f"Response body: {safe_text[:500]}")
-
-    @allure.step("GET {url}")
+        self._middlewares.remove(middleware)
+        self._handler = build_chain(self._middlewares, self._send)
+
+    def _send(self, request: ApiRequest) -> httpx.Response:
+        """Send request with underlying HTTP client (end of middleware chain)."""
+        return self.client.request(
+            request.method,
+            request.url,
+            params=request.params,
+            json=request.json,
+            data=request.data,
+            headers=request.headers,
+        )
+
     def get(
         self,
         url: str,
@@ -111,12 +127,8 @@ class APIClient:
         Returns:
             HTTP response.
         """
-        self._log_request("GET", url, params=params)
-        response = self.client.get(url, params=params, headers=self._get_headers(headers))
-        self._log_response(response)
-        return response
+        return self._handler(ApiRequest("GET", url, params=params, headers=headers))
 
-    @allure.step("POST {url}")
     def post(
         self,
         url: str,
@@ -135,12 +147,8 @@ class APIClient:
         Returns:
             HTTP response.
         """
-        self._log_request("POST", url, json=json, data=data)
-        response = self.client.post(url, json=json, data=data, headers=self._get_headers(headers))
-        self._log_response(response)
-        return response
+        return self._handler(ApiRequest("POST", url, json=json, data=data, headers=headers))
 
-    @allure.step("PUT {url}")
     def put(
         self,
         url: str,
@@ -157,12 +165,8 @@ class APIClient:
         Returns:
             HTTP response.
         """
-        self._log_request("PUT", url, json=json)
-        response = self.client.put(url, json=json, headers=self._get_headers(headers))
-        self._log_response(response)
-        return response
+        return self._handler(ApiRequest("PUT", url, json=json, headers=headers))
 
-    @allure.step("PATCH {url}")
     def patch(
         self,
         url: str,
@@ -179,12 +183,8 @@ class APIClient:
         Returns:
             HTTP response.
         """
-        self._log_request("PATCH", url, json=json)
-        response = self.client.patch(url, json=json, headers=self._get_headers(headers))
-        self._log_response(response)
-        return response
+        return self._handler(ApiRequest("PATCH", url, json=json, headers=headers))
 
-    @allure.step("DELETE {url}")
     def delete(
         self,
         url: str,
@@ -199,10 +199,7 @@ class APIClient:
         Returns:
             HTTP response.
         """
-        self._log_request("DELETE", url)
-        response = self.client.delete(url, headers=self._get_headers(headers))
-        self._log_response(response)
-        return response
+        return self._handler(ApiRequest("DELETE", url, headers=headers))
 
     def close(self) -> None:
         """Close HTTP client."""
@@ -0,0 +1,269 @@
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import allure
+import httpx
+
+from src.utils.helpers import sanitize_payload, sanitize_text_prefix
+from src.utils.logger import logger
+
+
+@dataclass(slots=True)
+class ApiRequest:
+    """Outgoing request passed through the middleware chain."""
+
+    method: str
+    url: str
+    params: dict[str, Any] | None = None
+    json: dict[str, Any] | None = None
+    data: dict[str, Any] | None = None
+    headers: dict[str, str] | None = None
+    extensions: dict[str, Any] = field(default_factory=dict)
+
+
+Handler = Callable[[ApiRequest], httpx.Response]
+AsyncHandler = Callable[[ApiRequest], Awaitable[httpx.Response]]
+
+
+class Middleware:
+    """Base middleware with request/response interceptor hooks.
+
+    Override ``process_request``/``process_response`` for simple interceptors,
+    or ``__call__`` to wrap the rest of the chain (retries, caching, fault injection).
+    """
+
+    def process_request(self, request: ApiRequest) -> None:
+        """Inspect or mutate request before it is sent."""
+
+    def process_response(self, request: ApiRequest, response: httpx.Response) -> httpx.Response:
+        """Inspect or replace response before it is returned."""
+        return response
+
+    def __call__(self, request: ApiRequest, call_next: Handler) -> httpx.Response:
+        self.process_request(request)
+        response = call_next(request)
+        return self.process_response(request, response)
+
+
+class AsyncMiddleware:
+    """Base middleware for the async client.
+
+    Hook-only ``Middleware`` subclasses (logging, auth) work in async chains
+    as they are; middlewares wrapping the rest of the chain need an async
+    ``__call__`` and derive from this class.
+    """
+
+    def process_request(self, request: ApiRequest) -> None:
+        """Inspect or mutate request before it is sent."""
+
+    def process_response(self, request: ApiRequest, response: httpx.Response) -> httpx.Response:
+        """Inspect or replace response before it is returned."""
+        return response
+
+    async def __call__(self, request: ApiRequest, call_next: AsyncHandler) -> httpx.Response:
+        self.process_request(request)
+        response = await call_next(request)
+        return self.process_response(request, response)
+
+
+class AllureStepMiddleware(Middleware):
+    """Wrap each request into an Allure step."""
+
+    def __call__(self, request: ApiRequest, call_next: Handler) -> httpx.Response:
+        with allure.step(f"{request.method} {request.url}"):
+            return call_next(request)
+
+
+class AsyncAllureStepMiddleware(AsyncMiddleware):
+    """Wrap each request of the async client into an Allure step."""
+
+    async def __call__(self, request: ApiRequest, call_next: AsyncHandler) -> httpx.Response:
+        with allure.step(f"{request.method} {request.url}"):
+            return await call_next(request)
+
+
+class LoggingMiddleware(Middleware):
+    """Log requests and responses, sanitizing bodies when enabled.
+
+    Messages are formatted lazily by loguru, so nothing is built for levels
+    without an active sink.
+    """
+
+    body_limit = 500
+
+    def __init__(self, log_sensitive: bool = False) -> None:
+        """Initialize logging middleware.
+
+        Args:
+            log_sensitive: Log sanitized request/response bodies.
+        """
+        self._log_sensitive = log_sensitive
+
+    def process_request(self, request: ApiRequest) -> None:
+        logger.info("Request: {} {}", request.method, request.url)
+        if not self._log_sensitive:
+            return
+        lazy = logger.opt(lazy=True)
+        if request.json:
+            lazy.debug("Body: {}", lambda: sanitize_payload(request.json))
+        if request.data:
+            lazy.debug("Body: {}", lambda: sanitize_payload(request.data))
+        if request.params:
+            lazy.debug("Params: {}", lambda: sanitize_payload(request.params))
+
+    def process_response(self, request: ApiRequest, response: httpx.Response) -> httpx.Response:
+        logger.info("Response: {} {}", response.status_code, response.reason_phrase)
+        if self._log_sensitive:
+            logger.opt(lazy=True).debug(
+                "Response body: {}",
+                lambda: sanitize_text_prefix(
+                    response.content, self.body_limit, response.encoding or "utf-8"
+                ),
+            )
+        return response
+
+
+class AuthMiddleware(Middleware):
+    """Inject bearer token and default headers into requests."""
+
+    def __init__(
+        self,
+        token_provider: Callable[[], str | None],
+        default_headers: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize auth middleware.
+
+        Args:
+            token_provider: Callable returning current token or None.
+            default_headers: Headers applied before request-specific ones.
+        """
+        self._token_provider = token_provider
+        self._default_headers = default_headers or {}
+
+    def process_request(self, request: ApiRequest) -> None:
+        headers = self._default_headers.copy()
+        token = self._token_provider()
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        if request.headers:
+            headers.update(request.headers)
+        request.headers = headers
+
+
+class TimingMiddleware(Middleware):
+    """Measure time spent in the inner chain and store it in request extensions."""
+
+    def __call__(self, request: ApiRequest, call_next: Handler) -> httpx.Response:
+        started = time.perf_counter()
+        response = call_next(request)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        request.extensions["elapsed_ms"] = elapsed_ms
+        logger.debug("{} {} took {:.1f} ms", request.method, request.url, elapsed_ms)
+        return response
+
+
+class RetryMiddleware(Middleware):
+    """Retry requests on transport errors and selected status codes."""
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: float = 0.5,
+        statuses: Iterable[int] = (502, 503, 504),
+    ) -> None:
+        """Initialize retry middleware.
+
+        Args:
+            attempts: Total number of attempts including the first one.
+            backoff: Base delay in seconds, doubled after each attempt.
+            statuses: Response status codes that trigger a retry.
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be >= 1")
+        self._attempts = attempts
+        self._backoff = backoff
+        self._statuses = frozenset(statuses)
+
+    def __call__(self, request: ApiRequest, call_next: Handler) -> httpx.Response:
+        for attempt in range(1, self._attempts):
+            try:
+                response = call_next(request)
+            except httpx.TransportError as exc:
+                logger.warning(f"Retrying {request.method} {request.url} after error: {exc}")
+            else:
+                if response.status_code not in self._statuses:
+                    return response
+                response.close()
+                logger.warning(
+                    f"Retrying {request.method} {request.url} after {response.status_code}"
+                )
+            time.sleep(self._backoff * 2 ** (attempt - 1))
+        return call_next(request)
+
+
+def build_chain(middlewares: Iterable[Middleware], terminal: Handler) -> Handler:
+    """Compose middlewares around terminal handler.
+
+    The first middleware is the outermost one. Composition happens once per
+    chain change, so dispatching a request costs one call per middleware.
+
+    Args:
+        middlewares: Ordered middlewares.
+        terminal: Handler that actually sends the request.
+
+    Returns:
+        Composed handler.
+    """
+    handler = terminal
+    for middleware in reversed(list(middlewares)):
+        handler = _bind(middleware, handler)
+    return handler
+
+
+def _bind(middleware: Middleware, call_next: Handler) -> Handler:
+    def handler(request: ApiRequest) -> httpx.Response:
+        return middleware(request, call_next)
+
+    return handler
+
+
+def build_async_chain(
+    middlewares: Iterable[Middleware | AsyncMiddleware], terminal: AsyncHandler
+) -> AsyncHandler:
+    """Compose middlewares around terminal handler of the async client.
+
+    Args:
+        middlewares: Ordered middlewares; sync ones may only use request/response hooks.
+        terminal: Coroutine function that actually sends the request.
+
+    Returns:
+        Composed handler.
+
+    Raises:
+        TypeError: If a sync middleware overrides ``__call__``.
+    """
+    handler = terminal
+    for middleware in reversed(list(middlewares)):
+        handler = _bind_async(middleware, handler)
+    return handler
+
+
+def _bind_async(middleware: Middleware | AsyncMiddleware, call_next: AsyncHandler) -> AsyncHandler:
+    if isinstance(middleware, AsyncMiddleware):
+
+        async def handler(request: ApiRequest) -> httpx.Response:
+            return await middleware(request, call_next)
+
+        return handler
+
+    if type(middleware).__call__ is not Middleware.__call__:
+        raise TypeError(f"{type(middleware).__name__} wraps the chain synchronously")
+
+    async def hooks(request: ApiRequest) -> httpx.Response:
+        middleware.process_request(request)
+        response = await call_next(request)
+        return middleware.process_response(request, response)
+
+    return hooks
@@ -9,7 +9,14 @@ class AccountService:
         self._client = client
         self._contracts = contracts
 
-    def delete_current(self) -> None:
-        response = self._client.delete("/api/secured/account/delete")
+    def delete_current(self, token: str | None = None) -> None:
+        """Delete current account.
+
+        Args:
+            token: Token of account to delete. Defaults to client token.
+                Passed per request, so one client can delete many accounts concurrently.
+        """
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        response = self._client.delete("/api/secured/account/delete", headers=headers)
         response.raise_for_status()
         self._contracts.validate("DELETE", "/api/secured/account/delete", response.text)
@@ -0,0 +1,14 @@
+from src.ui.aio.base_page import AsyncBasePage
+from src.ui.aio.components import AsyncHeader, AsyncSidebar
+from src.ui.aio.dashboard_page import AsyncDashboardPage
+from src.ui.aio.login_page import AsyncLoginPage
+from src.ui.aio.session import AsyncBrowserSession
+
+__all__ = [
+    "AsyncBasePage",
+    "AsyncBrowserSession",
+    "AsyncDashboardPage",
+    "AsyncHeader",
+    "AsyncLoginPage",
+    "AsyncSidebar",
+]
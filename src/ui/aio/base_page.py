@@ -0,0 +1,160 @@
+import asyncio
+from typing import Literal, TypeVar
+
+from playwright.async_api import Locator, Page, expect
+
+from src.ui.aio.element_query import query_elements
+from src.ui.aio.readiness import arm, wait
+from src.ui.element_query import ElementState
+from src.ui.readiness import LoadState, LoadStateName, ReadinessCondition
+from src.utils.logger import logger
+
+T = TypeVar("T", bound="AsyncBasePage")
+
+
+class AsyncBasePage:
+    """Base page object on ``playwright.async_api``.
+
+    Mirrors ``BasePage``: same methods, awaited. Several pages can be driven
+    concurrently from one event loop (``asyncio.gather``). Allure steps are
+    not recorded: the Allure step stack is per thread, not per task.
+    """
+
+    url_path: str = ""
+    readiness: tuple[ReadinessCondition, ...] = (LoadState("load"),)
+
+    def __init__(self, page: Page, base_url: str) -> None:
+        """Initialize async base page.
+
+        Args:
+            page: Async Playwright page instance.
+            base_url: Base URL for UI tests.
+        """
+        self.page = page
+        self.base_url = base_url
+        self._locators: dict[str, Locator] = {}
+
+    def locator(self, selector: str) -> Locator:
+        """Get locator for selector, cached per page object."""
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
+
+    async def query_elements(
+        self, selectors: dict[str, str], attributes: tuple[str, ...] = ()
+    ) -> dict[str, ElementState]:
+        """Read state of many elements in one browser round trip.
+
+        Args:
+            selectors: Name -> element selector.
+            attributes: Attribute names read for every element.
+
+        Returns:
+            Name -> element state.
+        """
+        return await query_elements(self.page, selectors, attributes, self.locator)
+
+    @property
+    def url(self) -> str:
+        """Get full page URL."""
+        return f"{self.base_url}{self.url_path}"
+
+    async def open(self: T) -> T:
+        """Open page by URL and wait until it is ready.
+
+        Returns:
+            Self for chaining.
+        """
+        logger.info(f"Opening page: {self.url}")
+        waiters = [arm(condition, self.page) for condition in self.readiness]
+        await self.page.goto(self.url, wait_until="commit")
+        await asyncio.gather(*(waiter() for waiter in waiters))
+        return self
+
+    async def wait_for_load(self: T, state: LoadStateName | None = None) -> T:
+        """Wait until page is ready.
+
+        Args:
+            state: Wait for this load state instead of page readiness conditions.
+
+        Returns:
+            Self for chaining.
+        """
+        if state is not None:
+            await self.page.wait_for_load_state(state)
+            return self
+        await asyncio.gather(
+            *(
+                wait(condition, self.page)
+                for condition in self.readiness
+                if not condition.navigation_only
+            )
+        )
+        return self
+
+    async def get_title(self) -> str:
+        """Get page title."""
+        return await self.page.title()
+
+    def get_current_url(self) -> str:
+        """Get current page URL."""
+        return self.page.url
+
+    async def take_screenshot(self) -> bytes:
+        """Take screenshot of current page."""
+        return await self.page.screenshot()
+
+    async def click(self, selector: str) -> None:
+        """Click element by selector."""
+        logger.debug(f"Clicking element: {selector}")
+        await self.locator(selector).first.click()
+
+    async def fill(self, selector: str, value: str) -> None:
+        """Fill input field with value."""
+        logger.debug(f"Filling {selector} with value")
+        await self.locator(selector).first.fill(value)
+
+    async def get_text(self, selector: str) -> str:
+        """Get text content of element."""
+        return await self.locator(selector).first.inner_text()
+
+    async def is_visible(self, selector: str) -> bool:
+        """Check if element is visible."""
+        return await self.locator(selector).first.is_visible()
+
+    async def wait_for_element(
+        self,
+        selector: str,
+        state: Literal["attached", "detached", "hidden", "visible"] = "visible",
+    ) -> None:
+        """Wait for element to reach specified state."""
+        logger.debug(f"Waiting for {selector} to be {state}")
+        await self.locator(selector).first.wait_for(state=state)
+
+    async def assert_element_visible(self, selector: str) -> None:
+        """Assert element is visible."""
+        await expect(self.locator(selector)).to_be_visible()
+
+    async def assert_elements_visible(self, *selectors: str) -> dict[str, ElementState]:
+        """Assert elements are visible: one batched read, then wait for the rest concurrently.
+
+        Returns the states of the batched read, for further checks.
+        """
+        states = await self.query_elements(dict(zip(selectors, selectors, strict=True)))
+        await asyncio.gather(
+            *(
+                expect(self.locator(selector)).to_be_visible()
+                for selector, state in states.items()
+                if not state.visible
+            )
+        )
+        return states
+
+    async def assert_element_has_text(self, selector: str, text: str) -> None:
+        """Assert element contains text."""
+        await expect(self.locator(selector)).to_contain_text(text)
+
+    async def assert_url_contains(self, url_part: str) -> None:
+        """Assert current URL contains string."""
+        await expect(self.page).to_have_url(f"*{url_part}*")
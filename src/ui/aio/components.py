@@ -0,0 +1,103 @@
+from playwright.async_api import Locator, Page
+
+from src.ui.aio.element_query import query_elements
+from src.ui.components.header import Header
+from src.ui.components.sidebar import Sidebar
+from src.ui.element_query import ElementState
+
+
+class _AsyncComponent:
+    def __init__(self, page: Page) -> None:
+        """Initialize component.
+
+        Args:
+            page: Async Playwright page instance.
+        """
+        self.page = page
+        self._locators: dict[str, Locator] = {}
+
+    def _locator(self, selector: str) -> Locator:
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
+
+
+class AsyncHeader(_AsyncComponent):
+    """Async header component (selectors shared with ``Header``)."""
+
+    LOGO = Header.LOGO
+    NAVIGATION = Header.NAVIGATION
+    SEARCH_INPUT = Header.SEARCH_INPUT
+    USER_AVATAR = Header.USER_AVATAR
+
+    async def click_logo(self) -> None:
+        """Click logo to navigate to home."""
+        await self._locator(self.LOGO).first.click()
+
+    async def search(self, query: str) -> None:
+        """Enter search query."""
+        search_input = self._locator(self.SEARCH_INPUT).first
+        await search_input.fill(query)
+        await search_input.press("Enter")
+
+    async def click_user_avatar(self) -> None:
+        """Click user avatar to open menu."""
+        await self._locator(self.USER_AVATAR).first.click()
+
+    async def is_user_logged_in(self) -> bool:
+        """Check if user is logged in by avatar presence."""
+        return await self._locator(self.USER_AVATAR).first.is_visible()
+
+    async def get_state(self) -> dict[str, ElementState]:
+        """Read state of all header elements in one round trip."""
+        return await query_elements(
+            self.page,
+            {
+                "logo": self.LOGO,
+                "navigation": self.NAVIGATION,
+                "search_input": self.SEARCH_INPUT,
+                "user_avatar": self.USER_AVATAR,
+            },
+            locator=self._locator,
+        )
+
+
+class AsyncSidebar(_AsyncComponent):
+    """Async sidebar component (selectors shared with ``Sidebar``)."""
+
+    SIDEBAR_CONTAINER = Sidebar.SIDEBAR_CONTAINER
+    MENU_ITEM = Sidebar.MENU_ITEM
+    COLLAPSE_BUTTON = Sidebar.COLLAPSE_BUTTON
+    ACTIVE_ITEM = Sidebar.ACTIVE_ITEM
+
+    async def navigate_to(self, name: str) -> None:
+        """Click menu item by name."""
+        await self._locator(self.MENU_ITEM.format(name=name)).first.click()
+
+    async def toggle(self) -> None:
+        """Toggle sidebar collapse/expand."""
+        await self._locator(self.COLLAPSE_BUTTON).first.click()
+
+    async def is_collapsed(self) -> bool:
+        """Check if sidebar is collapsed."""
+        return "collapsed" in (
+            await self._locator(self.SIDEBAR_CONTAINER).get_attribute("class") or ""
+        )
+
+    async def get_active_menu_item(self) -> str:
+        """Get currently active menu item text."""
+        return await self._locator(self.ACTIVE_ITEM).first.inner_text()
+
+    async def is_visible(self) -> bool:
+        """Check if sidebar is visible."""
+        return await self._locator(self.SIDEBAR_CONTAINER).first.is_visible()
+
+    async def get_state(self) -> dict[str, ElementState]:
+        """Read sidebar state (visibility, class, active item) in one round trip."""
+        return await query_elements(
+            self.page,
+            {"container": self.SIDEBAR_CONTAINER, "active_item": self.ACTIVE_ITEM},
+            attributes=("class",),
+            locator=self._locator,
+        )
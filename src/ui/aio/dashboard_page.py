@@ -0,0 +1,52 @@
+from src.ui.aio.base_page import AsyncBasePage
+from src.ui.pages.dashboard_page import DashboardPage
+
+
+class AsyncDashboardPage(AsyncBasePage):
+    """Async dashboard page object (selectors and readiness shared with ``DashboardPage``)."""
+
+    url_path = DashboardPage.url_path
+    readiness = DashboardPage.readiness
+
+    WELCOME_MESSAGE = DashboardPage.WELCOME_MESSAGE
+    USER_MENU = DashboardPage.USER_MENU
+    LOGOUT_BUTTON = DashboardPage.LOGOUT_BUTTON
+    SIDEBAR = DashboardPage.SIDEBAR
+    MAIN_CONTENT = DashboardPage.MAIN_CONTENT
+    NOTIFICATIONS_ICON = DashboardPage.NOTIFICATIONS_ICON
+    SETTINGS_LINK = DashboardPage.SETTINGS_LINK
+
+    async def get_welcome_message(self) -> str:
+        """Get welcome message text."""
+        return await self.get_text(self.WELCOME_MESSAGE)
+
+    async def open_user_menu(self) -> "AsyncDashboardPage":
+        """Open user dropdown menu."""
+        await self.click(self.USER_MENU)
+        return self
+
+    async def logout(self) -> None:
+        """Logout from application via user menu."""
+        await self.open_user_menu()
+        await self.click(self.LOGOUT_BUTTON)
+
+    async def go_to_settings(self) -> None:
+        """Navigate to settings page."""
+        await self.click(self.SETTINGS_LINK)
+
+    async def open_notifications(self) -> "AsyncDashboardPage":
+        """Open notifications panel."""
+        await self.click(self.NOTIFICATIONS_ICON)
+        return self
+
+    async def is_sidebar_visible(self) -> bool:
+        """Check if sidebar is visible."""
+        return await self.is_visible(self.SIDEBAR)
+
+    async def assert_dashboard_loaded(self) -> None:
+        """Assert dashboard page is properly loaded."""
+        await self.assert_elements_visible(self.WELCOME_MESSAGE, self.USER_MENU, self.SIDEBAR)
+
+    async def assert_user_logged_in(self, username: str) -> None:
+        """Assert user is logged in with expected username."""
+        await self.assert_element_has_text(self.WELCOME_MESSAGE, username)
@@ -0,0 +1,39 @@
+from collections.abc import Callable, Mapping, Sequence
+
+from playwright.async_api import Locator, Page
+
+from src.ui.element_query import LOCATOR_SCRIPT, QUERY_SCRIPT, ElementState, state_from_raw
+
+
+async def query_elements(
+    page: Page,
+    selectors: Mapping[str, str],
+    attributes: Sequence[str] = (),
+    locator: Callable[[str], Locator] | None = None,
+) -> dict[str, ElementState]:
+    """Async ``src.ui.element_query.query_elements``: many elements, one ``evaluate``.
+
+    Args:
+        page: Async Playwright page.
+        selectors: Name -> selector of first matching element.
+        attributes: Attribute names read for every element.
+        locator: Locator factory (e.g. cached) used for non-CSS selectors.
+
+    Returns:
+        Name -> element state.
+    """
+    names = list(selectors)
+    raw = await page.evaluate(QUERY_SCRIPT, [[selectors[name] for name in names], list(attributes)])
+    states: dict[str, ElementState] = {}
+    for name, item in zip(names, raw, strict=True):
+        if item.get("error"):
+            states[name] = await _read_locator(
+                (locator or page.locator)(selectors[name]).first, attributes
+            )
+        else:
+            states[name] = state_from_raw(item)
+    return states
+
+
+async def _read_locator(locator: Locator, attributes: Sequence[str]) -> ElementState:
+    return state_from_raw(await locator.evaluate_all(LOCATOR_SCRIPT, list(attributes)))
@@ -0,0 +1,68 @@
+from playwright.async_api import expect
+
+from src.ui.aio.base_page import AsyncBasePage
+from src.ui.pages.login_page import LoginPage
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """Async login page object (selectors and readiness shared with ``LoginPage``)."""
+
+    url_path = LoginPage.url_path
+    readiness = LoginPage.readiness
+
+    EMAIL_INPUT = LoginPage.EMAIL_INPUT
+    PASSWORD_INPUT = LoginPage.PASSWORD_INPUT
+    LOGIN_BUTTON = LoginPage.LOGIN_BUTTON
+    LOGIN_BUTTON_LABEL = LoginPage.LOGIN_BUTTON_LABEL
+    ERROR_MESSAGE = LoginPage.ERROR_MESSAGE
+    REMEMBER_ME_CHECKBOX = LoginPage.REMEMBER_ME_CHECKBOX
+    FORGOT_PASSWORD_LINK = LoginPage.FORGOT_PASSWORD_LINK
+
+    async def enter_email(self, email: str) -> "AsyncLoginPage":
+        """Enter email in input field."""
+        await self.fill(self.EMAIL_INPUT, email)
+        return self
+
+    async def enter_password(self, password: str) -> "AsyncLoginPage":
+        """Enter password in input field."""
+        await self.fill(self.PASSWORD_INPUT, password)
+        return self
+
+    async def click_login_button(self) -> None:
+        """Click login button."""
+        await self.click(self.LOGIN_BUTTON)
+
+    async def login(self, email: str, password: str) -> None:
+        """Perform login with credentials."""
+        await self.enter_email(email)
+        await self.enter_password(password)
+        await self.click_login_button()
+
+    async def check_remember_me(self) -> "AsyncLoginPage":
+        """Check remember me checkbox."""
+        await self.locator(self.REMEMBER_ME_CHECKBOX).check()
+        return self
+
+    async def click_forgot_password(self) -> None:
+        """Click forgot password link."""
+        await self.click(self.FORGOT_PASSWORD_LINK)
+
+    async def get_error_message(self) -> str:
+        """Get error message text."""
+        return await self.get_text(self.ERROR_MESSAGE)
+
+    async def is_error_displayed(self) -> bool:
+        """Check if error message is displayed."""
+        return await self.is_visible(self.ERROR_MESSAGE)
+
+    async def assert_error_message(self, expected_text: str) -> None:
+        """Assert error message contains expected text."""
+        await self.assert_element_has_text(self.ERROR_MESSAGE, expected_text)
+
+    async def assert_login_page_loaded(self) -> None:
+        """Assert login page is properly loaded and the submit button is labelled."""
+        states = await self.assert_elements_visible(
+            self.EMAIL_INPUT, self.PASSWORD_INPUT, self.LOGIN_BUTTON
+        )
+        if states[self.LOGIN_BUTTON].text.strip() != self.LOGIN_BUTTON_LABEL:
+            await expect(self.locator(self.LOGIN_BUTTON)).to_have_text(self.LOGIN_BUTTON_LABEL)
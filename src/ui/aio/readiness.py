@@ -0,0 +1,66 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from playwright.async_api import Page, Response
+
+from src.ui.readiness import (
+    ApiResponse,
+    JsPredicate,
+    LoadState,
+    ReadinessCondition,
+    SelectorsVisible,
+)
+
+AsyncWaiter = Callable[[], Awaitable[None]]
+
+
+def arm(condition: ReadinessCondition, page: Page) -> AsyncWaiter:
+    """Start watching async page for readiness condition before navigation.
+
+    Page objects declare conditions once (see ``src.ui.readiness``); this
+    evaluates them on ``playwright.async_api`` pages.
+
+    Args:
+        condition: Readiness condition.
+        page: Async Playwright page.
+
+    Returns:
+        Coroutine function waiting until condition is met.
+    """
+    if isinstance(condition, ApiResponse):
+        matched: list[Response] = []
+
+        def _on_response(response: Response) -> None:
+            if condition.matches(response):  # type: ignore[arg-type]
+                matched.append(response)
+
+        page.on("response", _on_response)
+
+        async def _wait_response() -> None:
+            try:
+                if not matched:
+                    await page.wait_for_event("response", predicate=condition.matches)
+            finally:
+                page.remove_listener("response", _on_response)
+
+        return _wait_response
+    return lambda: wait(condition, page)
+
+
+async def wait(condition: ReadinessCondition, page: Page) -> None:
+    """Wait until condition is met on already loaded async page."""
+    if isinstance(condition, LoadState):
+        await page.wait_for_load_state(condition.state)
+    elif isinstance(condition, SelectorsVisible):
+        await asyncio.gather(
+            *(
+                page.locator(selector).first.wait_for(state=condition.state)
+                for selector in condition.selectors
+            )
+        )
+    elif isinstance(condition, JsPredicate):
+        await page.wait_for_function(condition.expression, arg=condition.arg)
+    elif isinstance(condition, ApiResponse):
+        await page.wait_for_event("response", predicate=condition.matches)
+    else:
+        raise TypeError(f"Unsupported readiness condition for async pages: {condition!r}")
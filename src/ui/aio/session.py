@@ -0,0 +1,130 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Coroutine
+from typing import Any, TypeVar
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+
+from config.settings import Settings
+from src.ui.browser_server import SharedBrowserServer
+from src.utils.logger import logger
+
+R = TypeVar("R")
+
+
+class AsyncBrowserSession:
+    """Async Playwright browser driven from a private event loop of the worker.
+
+    Sync tests submit coroutines with ``run()``; everything inside runs
+    concurrently on one loop, e.g. N users logging in at once::
+
+        async_ui.run(async_ui.gather(*(login(user) for user in users)))
+
+    ``async def`` tests await the session directly instead of calling ``run()``.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        context_options: dict[str, Any] | None = None,
+        runner: asyncio.Runner | None = None,
+    ) -> None:
+        """Initialize async browser session.
+
+        Args:
+            settings: Settings with browser options.
+            context_options: Options for every new context.
+            runner: Runner of the worker event loop, shared with ``async def`` tests.
+                A private one, closed with the session, is created if not given.
+        """
+        self._settings = settings
+        self._context_options = context_options or {}
+        self._owns_runner = runner is None
+        self._runner = runner or asyncio.Runner()
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._contexts: list[BrowserContext] = []
+
+    def run(self, awaitable: Coroutine[Any, Any, R]) -> R:
+        """Run coroutine on the session loop and return its result."""
+        return self._runner.run(awaitable)
+
+    @staticmethod
+    async def gather(*awaitables: Awaitable[R]) -> list[R]:
+        """Await all concurrently, in order of arguments."""
+        return list(await asyncio.gather(*awaitables))
+
+    async def browser(self) -> Browser:
+        """Get browser, launching or attaching to it on first use."""
+        if self._browser is None or not self._browser.is_connected():
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._connect(self._playwright)
+        return self._browser
+
+    async def new_context(self, **options: Any) -> BrowserContext:
+        """Create context closed by ``close_contexts()``.
+
+        Args:
+            options: Overrides of default context options (e.g. ``storage_state``).
+        """
+        browser = await self.browser()
+        context = await browser.new_context(**{**self._context_options, **options})
+        context.set_default_timeout(self._settings.default_timeout)
+        self._contexts.append(context)
+        return context
+
+    @contextlib.asynccontextmanager
+    async def new_page(self, **options: Any) -> AsyncIterator[Page]:
+        """Open page in its own context, closed on exit."""
+        context = await self.new_context(**options)
+        try:
+            yield await context.new_page()
+        finally:
+            await context.close()
+            self._contexts.remove(context)
+
+    def close_contexts(self) -> None:
+        """Close contexts left open by a test."""
+        contexts, self._contexts = self._contexts, []
+        if contexts:
+            self.run(self._close_all(contexts))
+
+    def close(self) -> None:
+        """Close contexts, browser and the event loop if the session owns it."""
+        self.close_contexts()
+        if self._playwright is not None:
+            self.run(self._shutdown())
+        if self._owns_runner:
+            self._runner.close()
+
+    async def _connect(self, playwright: Playwright) -> Browser:
+        settings = self._settings
+        shared = settings.browser_mode == "shared" and settings.browser == "chromium"
+        if shared and SharedBrowserServer.supported:
+            # Endpoint lookup may wait on the server lock: keep the loop responsive
+            server = SharedBrowserServer(headless=settings.headless)
+            endpoint = await asyncio.to_thread(server.endpoint)
+            return await playwright.chromium.connect_over_cdp(endpoint, slow_mo=settings.slow_mo)
+        browser_type = getattr(playwright, settings.browser)
+        browser: Browser = await browser_type.launch(
+            headless=settings.headless, slow_mo=settings.slow_mo
+        )
+        return browser
+
+    @staticmethod
+    async def _close_all(contexts: list[BrowserContext]) -> None:
+        results = await asyncio.gather(
+            *(context.close() for context in contexts), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug(f"Failed to close async context: {result}")
+
+    async def _shutdown(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = None
+        self._playwright = None
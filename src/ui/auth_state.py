@@ -0,0 +1,120 @@
+import threading
+from typing import Any
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Route
+
+from config.settings import Settings
+from src.utils.auth_helper import AuthHelper
+from src.utils.logger import logger
+
+StorageState = dict[str, Any]
+
+_SET_LOCAL_STORAGE_SCRIPT = """
+items => { for (const item of items) localStorage.setItem(item.name, item.value); }
+"""
+
+
+def _blank_document(route: Route) -> None:
+    route.fulfill(status=200, content_type="text/html", body="<html></html>")
+
+
+def run_on_origins(
+    context: BrowserContext, origins: list[str], script: str, arg: Any = None
+) -> None:
+    """Evaluate script on each origin of context without loading real pages.
+
+    Storage is scoped per origin, so a temporary page visits each origin with
+    a stub document served by routing (no network involved).
+
+    Args:
+        context: Browser context.
+        origins: Origins such as ``https://example.com``.
+        script: JS function evaluated on every origin.
+        arg: Argument passed to script.
+    """
+    page = context.new_page()
+    try:
+        page.route("**/*", _blank_document)
+        for origin in origins:
+            page.goto(origin)
+            page.evaluate(script, arg)
+    finally:
+        page.close()
+
+
+def build_storage_state(settings: Settings, token: str) -> StorageState:
+    """Build Playwright storage state holding auth token.
+
+    Args:
+        settings: Settings with ``base_url`` and UI token storage options.
+        token: Auth token.
+
+    Returns:
+        Storage state accepted by ``browser.new_context(storage_state=...)``.
+    """
+    parts = urlsplit(settings.base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    if settings.ui_token_storage == "cookie":
+        cookie = {
+            "name": settings.ui_token_key,
+            "value": token,
+            "domain": parts.hostname or "",
+            "path": "/",
+            "expires": -1,
+            "httpOnly": False,
+            "secure": parts.scheme == "https",
+            "sameSite": "Lax",
+        }
+        return {"cookies": [cookie], "origins": []}
+    local_storage = [{"name": settings.ui_token_key, "value": token}]
+    return {"cookies": [], "origins": [{"origin": origin, "localStorage": local_storage}]}
+
+
+def apply_storage_state(context: BrowserContext, state: StorageState) -> None:
+    """Inject storage state into already created context.
+
+    Unlike init scripts, injected cookies and storage can be cleared again,
+    so the context stays reusable.
+
+    Args:
+        context: Browser context.
+        state: Storage state (see ``build_storage_state``).
+    """
+    if state["cookies"]:
+        context.add_cookies(state["cookies"])
+    for origin in state["origins"]:
+        run_on_origins(
+            context, [origin["origin"]], _SET_LOCAL_STORAGE_SCRIPT, origin["localStorage"]
+        )
+
+
+class StorageStateProvider:
+    """Storage state of test user, logged in through the API once per worker.
+
+    The state is rebuilt whenever the auth helper returns a new token
+    (tokens are refreshed by its token cache shortly before expiry).
+    """
+
+    def __init__(self, settings: Settings, auth_helper: AuthHelper) -> None:
+        """Initialize storage state provider.
+
+        Args:
+            settings: Settings instance.
+            auth_helper: Auth helper, preferably backed by a token cache.
+        """
+        self._settings = settings
+        self._auth_helper = auth_helper
+        self._token: str | None = None
+        self._state: StorageState | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> StorageState:
+        """Get storage state with a valid token."""
+        with self._lock:
+            token = self._auth_helper.login_as_test_user()
+            if self._state is None or token != self._token:
+                logger.debug("Building UI storage state from API token")
+                self._state = build_storage_state(self._settings, token)
+                self._token = token
+            return self._state
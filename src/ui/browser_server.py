@@ -0,0 +1,263 @@
+"""Chromium shared by all xdist workers of one machine.
+
+The first worker starts a detached server process (``python -m
+src.ui.browser_server``) under a file lock; the others attach to the same
+browser over CDP. Run standalone to keep a browser warm between runs.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from src.utils.logger import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: shared browser is unavailable
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser
+
+SERVER_DIR = Path(__file__).resolve().parent.parent.parent / ".browser-server"
+PROJECT_DIR = SERVER_DIR.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def is_healthy(endpoint: str, timeout: float = 2) -> bool:
+    """Check that CDP endpoint of shared browser responds."""
+    try:
+        return httpx.get(f"{endpoint}/json/version", timeout=timeout).status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+class SharedBrowserServer:
+    """Handle to the per-machine browser server, started on demand."""
+
+    supported = fcntl is not None
+
+    def __init__(
+        self,
+        headless: bool = True,
+        state_dir: Path = SERVER_DIR,
+        start_timeout: float = 30,
+        idle_timeout: float = 300,
+        owner: str | None = None,
+    ) -> None:
+        """Initialize shared browser server handle.
+
+        Args:
+            headless: Launch browser in headless mode.
+            state_dir: Directory with server state, lock and log files.
+            start_timeout: Seconds to wait for a started server to respond.
+            idle_timeout: Seconds without open pages after which server exits.
+            owner: Id of the test run, recorded by servers this handle starts.
+        """
+        self._headless = headless
+        self._owner = owner
+        self._state_dir = state_dir
+        self._state_path = state_dir / "server.json"
+        self._start_timeout = start_timeout
+        self._idle_timeout = idle_timeout
+
+    def endpoint(self) -> str:
+        """Return CDP endpoint of a healthy server, starting or restarting it if needed."""
+        state = self._read_state()
+        if state and is_healthy(state["endpoint"]):
+            return str(state["endpoint"])
+        with self._lock():
+            # Another worker may have (re)started server while we waited for lock
+            state = self._read_state()
+            if state and is_healthy(state["endpoint"]):
+                return str(state["endpoint"])
+            if state:
+                logger.warning("Shared browser is not responding, restarting it")
+                self._kill(state)
+            return self._start()
+
+    def stop(self, owner: str | None = None) -> None:
+        """Stop server if it is running.
+
+        Args:
+            owner: Stop the server only if it was started by this test run.
+        """
+        if not self.supported:
+            return
+        with self._lock():
+            state = self._read_state()
+            if state and (owner is None or state.get("owner") == owner):
+                self._kill(state)
+                self._state_path.unlink(missing_ok=True)
+
+    def _start(self) -> str:
+        port = _free_port()
+        endpoint = f"http://127.0.0.1:{port}"
+        command = [
+            sys.executable,
+            "-m",
+            "src.ui.browser_server",
+            "--port",
+            str(port),
+            "--state-file",
+            str(self._state_path),
+            "--idle-timeout",
+            str(self._idle_timeout),
+        ]
+        if not self._headless:
+            command.append("--headed")
+        if self._owner is not None:
+            command.extend(["--owner", self._owner])
+        self._state_path.unlink(missing_ok=True)
+        with (self._state_dir / "server.log").open("a") as log_file:
+            subprocess.Popen(
+                command,
+                cwd=PROJECT_DIR,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,  # outlives the worker that started it
+            )
+        deadline = time.monotonic() + self._start_timeout
+        while time.monotonic() < deadline:
+            if self._read_state() and is_healthy(endpoint):
+                logger.info(f"Shared browser started at {endpoint}")
+                return endpoint
+            time.sleep(0.2)
+        raise RuntimeError(f"Shared browser did not start within {self._start_timeout}s")
+
+    @staticmethod
+    def _kill(state: dict[str, Any]) -> None:
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(state["pid"], signal.SIGTERM)
+        deadline = time.monotonic() + 5
+        while _pid_alive(state["pid"]) and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+    @contextlib.contextmanager
+    def _lock(self) -> Iterator[None]:
+        if fcntl is None:
+            raise RuntimeError("Shared browser requires fcntl (POSIX only)")
+        self._state_dir.mkdir(parents=True, exist_ok=True)
+        with (self._state_dir / "server.lock").open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_state(self) -> dict[str, Any] | None:
+        try:
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        return state if isinstance(state, dict) and _pid_alive(state.get("pid", 0)) else None
+
+
+class BrowserProvider:
+    """Connected browser of a worker, reconnected after the browser crashed."""
+
+    def __init__(self, connect: Callable[[], "Browser"], max_restarts: int = 3) -> None:
+        """Initialize browser provider.
+
+        Args:
+            connect: Launches or attaches to a browser.
+            max_restarts: Reconnects allowed per session before giving up.
+        """
+        self._connect = connect
+        self._max_restarts = max_restarts
+        self._restarts = 0
+        self._browser: Browser | None = None
+
+    def get(self) -> "Browser":
+        """Get connected browser."""
+        if self._browser is not None and not self._browser.is_connected():
+            if self._restarts >= self._max_restarts:
+                raise RuntimeError(f"Browser disconnected {self._restarts + 1} times, giving up")
+            self._restarts += 1
+            logger.warning(f"Browser disconnected, reconnecting ({self._restarts})")
+            self._browser = None
+        if self._browser is None:
+            self._browser = self._connect()
+        return self._browser
+
+    def close(self) -> None:
+        """Close own browser or, for a shared browser, detach from it."""
+        if self._browser is not None and self._browser.is_connected():
+            self._browser.close()
+        self._browser = None
+
+
+def _open_page_count(endpoint: str) -> int:
+    targets = httpx.get(f"{endpoint}/json/list", timeout=2).json()
+    return sum(1 for target in targets if target.get("type") == "page")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run browser server until stopped, crashed or idle."""
+    from playwright.sync_api import sync_playwright
+
+    parser = argparse.ArgumentParser(description="Shared Chromium for UI test workers")
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--state-file", type=Path, default=SERVER_DIR / "server.json")
+    parser.add_argument("--idle-timeout", type=float, default=300)
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--owner", help="Id of the test run that started the server")
+    args = parser.parse_args(argv)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    endpoint = f"http://127.0.0.1:{args.port}"
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(
+            headless=not args.headed,
+            args=[f"--remote-debugging-port={args.port}"],
+        )
+        args.state_file.parent.mkdir(parents=True, exist_ok=True)
+        args.state_file.write_text(
+            json.dumps({"pid": os.getpid(), "endpoint": endpoint, "owner": args.owner}),
+            encoding="utf-8",
+        )
+        idle_since = time.monotonic()
+        while not stop.wait(1):
+            try:
+                if _open_page_count(endpoint):
+                    idle_since = time.monotonic()
+            except (httpx.HTTPError, ValueError):
+                break  # browser crashed: workers restart server on next health check
+            if time.monotonic() - idle_since > args.idle_timeout:
+                break
+        with contextlib.suppress(Exception):
+            browser.close()
+
+
+if __name__ == "__main__":
+    main()
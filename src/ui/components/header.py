@@ -1,6 +1,8 @@
 import allure
 from playwright.sync_api import Page
 
+from src.ui.element_query import ElementState, LocatorCache, query_elements
+
 
 class Header:
     """Header component present on multiple pages."""
@@ -18,11 +20,12 @@ class Header:
             page: Playwright page instance.
         """
         self.page = page
+        self._locators = LocatorCache(page)
 
     @allure.step("Click logo")
     def click_logo(self) -> None:
         """Click logo to navigate to home."""
-        self.page.click(self.LOGO)
+        self._locators(self.LOGO).first.click()
 
     @allure.step("Search for: {query}")
     def search(self, query: str) -> None:
@@ -31,13 +34,14 @@ class Header:
         Args:
             query: Search query string.
         """
-        self.page.fill(self.SEARCH_INPUT, query)
-        self.page.press(self.SEARCH_INPUT, "Enter")
+        search_input = self._locators(self.SEARCH_INPUT).first
+        search_input.fill(query)
+        search_input.press("Enter")
 
     @allure.step("Click user avatar")
     def click_user_avatar(self) -> None:
         """Click user avatar to open menu."""
-        self.page.click(self.USER_AVATAR)
+        self._locators(self.USER_AVATAR).first.click()
 
     def is_user_logged_in(self) -> bool:
         """Check if user is logged in by avatar presence.
@@ -45,4 +49,21 @@ class Header:
         Returns:
             True if user avatar is visible.
         """
-        return bool(self.page.is_visible(self.USER_AVATAR))
+        return self._locators(self.USER_AVATAR).first.is_visible()
+
+    def get_state(self) -> dict[str, ElementState]:
+        """Read state of all header elements in one round trip.
+
+        Returns:
+            Element name (logo, navigation, search_input, user_avatar) -> state.
+        """
+        return query_elements(
+            self.page,
+            {
+                "logo": self.LOGO,
+                "navigation": self.NAVIGATION,
+                "search_input": self.SEARCH_INPUT,
+                "user_avatar": self.USER_AVATAR,
+            },
+            locators=self._locators,
+        )
@@ -1,6 +1,8 @@
 import allure
 from playwright.sync_api import Page
 
+from src.ui.element_query import ElementState, LocatorCache, query_elements
+
 
 class Sidebar:
     """Sidebar navigation component."""
@@ -18,6 +20,7 @@ class Sidebar:
             page: Playwright page instance.
         """
         self.page = page
+        self._locators = LocatorCache(page)
 
     @allure.step("Navigate to menu item: {name}")
     def navigate_to(self, name: str) -> None:
@@ -26,13 +29,12 @@ class Sidebar:
         Args:
             name: Menu item identifier.
         """
-        selector = self.MENU_ITEM.format(name=name)
-        self.page.click(selector)
+        self._locators(self.MENU_ITEM.format(name=name)).first.click()
 
     @allure.step("Toggle sidebar")
     def toggle(self) -> None:
         """Toggle sidebar collapse/expand."""
-        self.page.click(self.COLLAPSE_BUTTON)
+        self._locators(self.COLLAPSE_BUTTON).first.click()
 
     def is_collapsed(self) -> bool:
         """Check if sidebar is collapsed.
@@ -40,7 +42,7 @@ class Sidebar:
         Returns:
             True if sidebar is in collapsed state.
         """
-        sidebar = self.page.locator(self.SIDEBAR_CONTAINER)
+        sidebar = self._locators(self.SIDEBAR_CONTAINER)
         return "collapsed" in (sidebar.get_attribute("class") or "")
 
     def get_active_menu_item(self) -> str:
@@ -49,7 +51,7 @@ class Sidebar:
         Returns:
             Active menu item text.
         """
-        return str(self.page.inner_text(self.ACTIVE_ITEM))
+        return self._locators(self.ACTIVE_ITEM).first.inner_text()
 
     def is_visible(self) -> bool:
         """Check if sidebar is visible.
@@ -57,4 +59,17 @@ class Sidebar:
         Returns:
             True if sidebar is visible.
         """
-        return bool(self.page.is_visible(self.SIDEBAR_CONTAINER))
+        return self._locators(self.SIDEBAR_CONTAINER).first.is_visible()
+
+    def get_state(self) -> dict[str, ElementState]:
+        """Read sidebar state in one round trip.
+
+        Returns:
+            ``container`` (visibility, ``class`` attribute) and ``active_item`` (text) states.
+        """
+        return query_elements(
+            self.page,
+            {"container": self.SIDEBAR_CONTAINER, "active_item": self.ACTIVE_ITEM},
+            attributes=("class",),
+            locators=self._locators,
+        )
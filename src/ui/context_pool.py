@@ -0,0 +1,138 @@
+from collections.abc import Callable
+
+from playwright.sync_api import BrowserContext
+
+from src.ui.auth_state import run_on_origins
+from src.utils.logger import logger
+
+# Clears storage of the origin the page is on (IndexedDB where enumerable)
+_CLEAR_STORAGE_SCRIPT = """
+async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        for (const db of await indexedDB.databases()) indexedDB.deleteDatabase(db.name);
+    }
+}
+"""
+
+
+class ContextPool:
+    """Pool of warm browser contexts reused by tests of one session (xdist worker).
+
+    Returned contexts are reset (pages, cookies, storage, permissions, routes)
+    and checked for leftovers; a context found dirty is closed instead of reused.
+    Playwright sync objects are bound to one thread, so the pool is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], BrowserContext],
+        max_size: int = 2,
+        max_uses: int = 50,
+        prepare: Callable[[BrowserContext], None] | None = None,
+    ) -> None:
+        """Initialize context pool.
+
+        Args:
+            factory: Creates a new configured context.
+            prepare: Installs per-context setup (e.g. routes) on new and reset contexts.
+            max_size: Maximum number of idle contexts kept in pool.
+            max_uses: Tests after which a context is recycled (bounds memory growth).
+        """
+        self._factory = factory
+        self._prepare = prepare
+        self._max_size = max_size
+        self._max_uses = max_uses
+        self._idle: list[BrowserContext] = []
+        self._uses: dict[int, int] = {}
+        self._dirty: set[int] = set()
+
+    def checkout(self) -> BrowserContext:
+        """Take idle context from pool or create a new one."""
+        while self._idle:
+            context = self._idle.pop()
+            if context.browser is not None and context.browser.is_connected():
+                break
+            self._close(context)
+        else:
+            context = self._factory()
+            if self._prepare:
+                self._prepare(context)
+        self._uses[id(context)] = self._uses.get(id(context), 0) + 1
+        return context
+
+    def mark_dirty(self, context: BrowserContext) -> None:
+        """Mark context as not resettable (init scripts, exposed bindings).
+
+        Such state cannot be removed from a live context, so it is closed on checkin.
+        """
+        self._dirty.add(id(context))
+
+    def checkin(self, context: BrowserContext, discard: bool = False) -> None:
+        """Reset context and return it to pool.
+
+        Args:
+            context: Context taken with ``checkout()``.
+            discard: Close context instead of reusing it (e.g. test failed).
+        """
+        reusable = (
+            not discard
+            and id(context) not in self._dirty
+            and self._uses[id(context)] < self._max_uses
+            and len(self._idle) < self._max_size
+        )
+        if reusable:
+            try:
+                self._reset(context)
+                reusable = self._is_clean(context)
+                if reusable and self._prepare:
+                    self._prepare(context)
+            except Exception as exc:
+                logger.warning(f"Browser context reset failed, recycling: {exc}")
+                reusable = False
+        if reusable:
+            self._idle.append(context)
+            return
+        if not discard:
+            logger.debug("Recycling browser context")
+        self._close(context)
+
+    def close(self) -> None:
+        """Close all idle contexts."""
+        contexts, self._idle = self._idle, []
+        for context in contexts:
+            self._close(context)
+
+    def _close(self, context: BrowserContext) -> None:
+        self._uses.pop(id(context), None)
+        self._dirty.discard(id(context))
+        try:
+            context.close()
+        except Exception as exc:
+            logger.debug(f"Failed to close browser context: {exc}")
+
+    @staticmethod
+    def _reset(context: BrowserContext) -> None:
+        for page in context.pages:
+            page.close()
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_cookies()
+        context.clear_permissions()
+        context.set_extra_http_headers({})
+        context.set_geolocation(None)
+        context.set_offline(False)
+
+        origins = [origin["origin"] for origin in context.storage_state()["origins"]]
+        if origins:
+            run_on_origins(context, origins, _CLEAR_STORAGE_SCRIPT)
+
+    @staticmethod
+    def _is_clean(context: BrowserContext) -> bool:
+        """Isolation check: nothing from the previous test is left in context."""
+        if context.pages:
+            return False
+        state = context.storage_state()
+        return not state["cookies"] and not any(
+            origin["localStorage"] for origin in state["origins"]
+        )
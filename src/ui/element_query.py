@@ -0,0 +1,115 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from playwright.sync_api import Locator, Page
+
+# State of one element; matches Playwright's visibility rules
+# (non-empty box, not visibility:hidden)
+_DESCRIBE_SCRIPT = """
+(el, attributes) => {
+    if (!el) return {found: false};
+    const box = el.getBoundingClientRect();
+    return {
+        found: true,
+        visible: box.width > 0 && box.height > 0 && getComputedStyle(el).visibility !== "hidden",
+        text: el.innerText ?? el.textContent ?? "",
+        attributes: Object.fromEntries(attributes.map(name => [name, el.getAttribute(name)])),
+    };
+}
+"""
+
+# One round trip for many elements. Invalid CSS yields {error: true}.
+QUERY_SCRIPT = f"""
+([selectors, attributes]) => {{
+    const describe = {_DESCRIBE_SCRIPT.strip()};
+    return selectors.map(selector => {{
+        let el;
+        try {{
+            el = document.querySelector(selector);
+        }} catch (e) {{
+            return {{error: true}};
+        }}
+        return describe(el, attributes);
+    }});
+}}
+"""
+
+# One round trip for a selector only Playwright understands (XPath, pseudo-classes)
+LOCATOR_SCRIPT = f"(elements, attributes) => ({_DESCRIBE_SCRIPT.strip()})(elements[0], attributes)"
+
+
+@dataclass(frozen=True)
+class ElementState:
+    """Snapshot of element state read in a batch."""
+
+    found: bool = False
+    visible: bool = False
+    text: str = ""
+    attributes: dict[str, str | None] = field(default_factory=dict)
+
+
+class LocatorCache:
+    """Locators of one page resolved once and reused on every call."""
+
+    def __init__(self, page: Page) -> None:
+        """Initialize locator cache.
+
+        Args:
+            page: Playwright page instance.
+        """
+        self._page = page
+        self._locators: dict[str, Locator] = {}
+
+    def __call__(self, selector: str) -> Locator:
+        """Get cached locator for selector."""
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self._page.locator(selector)
+        return locator
+
+
+def query_elements(
+    page: Page,
+    selectors: Mapping[str, str],
+    attributes: Sequence[str] = (),
+    locators: LocatorCache | None = None,
+) -> dict[str, ElementState]:
+    """Read visibility, text and attributes of many elements in one ``evaluate``.
+
+    Selectors that are not plain CSS (XPath, Playwright pseudo-classes) are
+    read one by one through locators, one extra ``evaluate_all`` each.
+
+    Args:
+        page: Playwright page instance.
+        selectors: Name -> selector of first matching element.
+        attributes: Attribute names read for every element.
+        locators: Locator cache used for fallback reads.
+
+    Returns:
+        Name -> element state.
+    """
+    names = list(selectors)
+    raw = page.evaluate(QUERY_SCRIPT, [[selectors[name] for name in names], list(attributes)])
+    states: dict[str, ElementState] = {}
+    for name, item in zip(names, raw, strict=True):
+        if item.get("error"):
+            locator = (locators or page.locator)(selectors[name]).first
+            states[name] = _read_locator(locator, attributes)
+        else:
+            states[name] = state_from_raw(item)
+    return states
+
+
+def state_from_raw(item: dict[str, Any]) -> ElementState:
+    """Build element state from one ``QUERY_SCRIPT`` result item."""
+    return ElementState(
+        found=item["found"],
+        visible=item.get("visible", False),
+        text=item.get("text", ""),
+        attributes=item.get("attributes", {}),
+    )
+
+
+def _read_locator(locator: Locator, attributes: Sequence[str]) -> ElementState:
+    return state_from_raw(locator.evaluate_all(LOCATOR_SCRIPT, list(attributes)))
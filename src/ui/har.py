@@ -0,0 +1,158 @@
+import base64
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.utils.logger import logger
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Route
+
+_UNSAFE_NAME_RE = re.compile(r"[^\w.-]+")
+_SKIPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def har_path_for(har_dir: Path, nodeid: str) -> Path:
+    """Build HAR file path of a test from its node id."""
+    name = _UNSAFE_NAME_RE.sub("_", nodeid).strip("_")
+    return har_dir / f"{name}.har"
+
+
+def _normalize_url(url: str) -> str:
+    """Drop fragment and sort query, so parameter order does not break lookup."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+def _body_hash(body: bytes | str | None) -> str | None:
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode()
+    return hashlib.sha1(body).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class HarResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+@dataclass(frozen=True, slots=True)
+class _HarEntry:
+    body_hash: str | None
+    response: HarResponse
+
+
+class HarIndex:
+    """Recorded responses indexed by method and normalized URL.
+
+    Lookup is a dict access instead of a scan over all entries, so large
+    HAR files replay at constant cost per request.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Load and index HAR file.
+
+        Args:
+            path: HAR file with embedded content.
+        """
+        self.path = path
+        data = json.loads(path.read_text(encoding="utf-8"))
+        self._entries: dict[tuple[str, str], list[_HarEntry]] = {}
+        for raw in data["log"]["entries"]:
+            request = raw["request"]
+            key = (request["method"], _normalize_url(request["url"]))
+            entry = _HarEntry(
+                body_hash=_body_hash(request.get("postData", {}).get("text")),
+                response=self._parse_response(raw["response"], path.parent),
+            )
+            self._entries.setdefault(key, []).append(entry)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _load(path: Path, mtime: float) -> "HarIndex":
+        return HarIndex(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "HarIndex":
+        """Get index of HAR file, cached per worker until the file changes."""
+        return cls._load(path, path.stat().st_mtime)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def candidates(self, method: str, url: str, body: bytes | None) -> list[HarResponse]:
+        """Get recorded responses for request, in recording order.
+
+        Entries with a matching request body are preferred when there are any.
+        """
+        entries = self._entries.get((method, _normalize_url(url)), [])
+        if len(entries) > 1 and body:
+            body_hash = _body_hash(body)
+            same_body = [entry for entry in entries if entry.body_hash == body_hash]
+            if same_body:
+                entries = same_body
+        return [entry.response for entry in entries]
+
+    @staticmethod
+    def _parse_response(raw: dict[str, Any], har_dir: Path) -> HarResponse:
+        content = raw.get("content", {})
+        if "_file" in content:
+            body = (har_dir / content["_file"]).read_bytes()
+        elif content.get("encoding") == "base64":
+            body = base64.b64decode(content.get("text", ""))
+        else:
+            body = content.get("text", "").encode()
+        headers = {
+            header["name"]: header["value"]
+            for header in raw.get("headers", [])
+            if header["name"].lower() not in _SKIPPED_HEADERS
+        }
+        return HarResponse(status=raw["status"], headers=headers, body=body)
+
+
+class HarReplayer:
+    """Route handler serving requests from a HAR index.
+
+    Repeated requests (e.g. polling) get recorded responses in order, then the
+    last one. Unrecorded requests go to the network, or are aborted and
+    collected in ``misses`` in strict mode.
+    """
+
+    def __init__(self, index: HarIndex, strict: bool = False) -> None:
+        """Initialize HAR replayer.
+
+        Args:
+            index: Index of recorded HAR file.
+            strict: Abort requests that were not recorded.
+        """
+        self._index = index
+        self._strict = strict
+        self._calls: dict[tuple[str, str, str | None], int] = {}
+        self.misses: list[str] = []
+
+    def __call__(self, route: "Route") -> None:
+        request = route.request
+        body = request.post_data_buffer
+        responses = self._index.candidates(request.method, request.url, body)
+        if not responses:
+            if self._strict:
+                self.misses.append(f"{request.method} {request.url}")
+                route.abort("failed")
+            else:
+                logger.debug(f"Not in HAR, passing to network: {request.method} {request.url}")
+                route.fallback()
+            return
+        key = (request.method, request.url, _body_hash(body))
+        call = self._calls.get(key, 0)
+        self._calls[key] = call + 1
+        response = responses[min(call, len(responses) - 1)]
+        route.fulfill(status=response.status, headers=response.headers, body=response.body)
@@ -1,17 +1,33 @@
 from typing import Literal, TypeVar
 
 import allure
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, expect
 
+from src.ui.element_query import ElementState, LocatorCache, query_elements
+from src.ui.perf import Budget, get_perf_recorder
+from src.ui.readiness import LoadState, LoadStateName, ReadinessCondition
+from src.ui.visual import Region, get_visual_baselines
+from src.utils.artifacts import get_artifact_writer
 from src.utils.logger import logger
 
 T = TypeVar("T", bound="BasePage")
 
 
 class BasePage:
-    """Base page object with common methods."""
+    """Base page object with common methods.
+
+    Subclasses declare ``readiness``: conditions ``open()`` waits for before
+    returning. The default matches a plain ``goto`` (``load`` event).
+    With ``PERF_METRICS=true`` every ready page is measured against its
+    ``budgets``.
+    """
 
     url_path: str = ""
+    readiness: tuple[ReadinessCondition, ...] = (LoadState("load"),)
+    budgets: tuple[Budget, ...] = ()
+    # Dynamic content left out of visual comparison: masked selectors, pixel regions
+    visual_ignore: tuple[str, ...] = ()
+    visual_ignore_regions: tuple[Region, ...] = ()
 
     def __init__(self, page: Page, base_url: str) -> None:
         """Initialize base page.
@@ -22,6 +38,32 @@ class BasePage:
         """
         self.page = page
         self.base_url = base_url
+        self._locators = LocatorCache(page)
+
+    def locator(self, selector: str) -> Locator:
+        """Get locator for selector, cached per page object.
+
+        Args:
+            selector: Element selector.
+
+        Returns:
+            Locator reused on every call with the same selector.
+        """
+        return self._locators(selector)
+
+    def query_elements(
+        self, selectors: dict[str, str], attributes: tuple[str, ...] = ()
+    ) -> dict[str, ElementState]:
+        """Read state of many elements in one browser round trip.
+
+        Args:
+            selectors: Name -> element selector.
+            attributes: Attribute names read for every element.
+
+        Returns:
+            Name -> element state.
+        """
+        return query_elements(self.page, selectors, attributes, self._locators)
 
     @property
     def url(self) -> str:
@@ -29,24 +71,43 @@ class BasePage:
         return f"{self.base_url}{self.url_path}"
 
     def open(self: T) -> T:
-        """Open page by URL.
+        """Open page by URL and wait until it is ready.
 
         Returns:
             Self for chaining.
         """
         with allure.step(f"Open page: {self.url}"):
             logger.info(f"Opening page: {self.url}")
-            self.page.goto(self.url)
+            recorder = get_perf_recorder()
+            session = recorder.start(self.page) if recorder is not None else None
+            # Arm conditions first: they may watch responses fired during navigation
+            waiters = [condition.arm(self.page) for condition in self.readiness]
+            self.page.goto(self.url, wait_until="commit")
+            for waiter in waiters:
+                waiter(None)
+            if recorder is not None:
+                recorder.measure(self.page, type(self).__name__, self.budgets, session)
         return self
 
     @allure.step("Wait for page load")
-    def wait_for_load(self: T) -> T:
-        """Wait for page to fully load.
+    def wait_for_load(self: T, state: LoadStateName | None = None) -> T:
+        """Wait until page is ready, e.g. after navigating to it by a click.
+
+        Args:
+            state: Wait for this load state instead of page readiness conditions.
 
         Returns:
             Self for chaining.
         """
-        self.page.wait_for_load_state("networkidle")
+        if state is not None:
+            self.page.wait_for_load_state(state)
+        else:
+            for condition in self.readiness:
+                if not condition.navigation_only:
+                    condition.wait(self.page)
+        recorder = get_perf_recorder()
+        if recorder is not None:
+            recorder.measure(self.page, type(self).__name__, self.budgets)
         return self
 
     @allure.step("Get page title")
@@ -74,13 +135,58 @@ class BasePage:
         Args:
             name: Screenshot name for Allure report.
 
+        Format follows ``SCREENSHOT_FORMAT``; the attachment is written off
+        the test thread.
+
         Returns:
             Screenshot bytes.
         """
-        screenshot: bytes = self.page.screenshot()
-        allure.attach(screenshot, name=name, attachment_type=allure.attachment_type.PNG)
+        writer = get_artifact_writer()
+        if writer is None:
+            screenshot: bytes = self.page.screenshot()
+            allure.attach(screenshot, name=name, attachment_type=allure.attachment_type.PNG)
+            return screenshot
+        screenshot = self.page.screenshot(**writer.screenshot_options)
+        writer.attach_bytes(screenshot, name, writer.screenshot_type)
         return screenshot
 
+    @allure.step("Compare with visual baseline: {name}")
+    def assert_matches_baseline(self, name: str, full_page: bool = False) -> None:
+        """Assert page looks like its baseline screenshot.
+
+        Baselines are saved only with ``VISUAL_UPDATE=true``; a missing one fails.
+
+        Args:
+            name: Baseline name, unique per page state.
+            full_page: Capture full scrollable page instead of viewport.
+        """
+        baselines = get_visual_baselines()
+        if baselines is None:
+            raise RuntimeError("Visual baselines are set up by the page fixture")
+        screenshot = self.page.screenshot(
+            type="png",
+            full_page=full_page,
+            animations="disabled",
+            caret="hide",
+            mask=[self.locator(selector) for selector in self.visual_ignore],
+        )
+        result = baselines.compare(
+            f"{type(self).__name__}/{name}", screenshot, self.visual_ignore_regions
+        )
+        logger.debug(f"Visual check {result.name}: {result.reason}")
+        if result.passed:
+            return
+        writer = get_artifact_writer()
+        if writer is not None:
+            png = allure.attachment_type.PNG
+            expected = baselines.path_for(result.name)
+            if expected.exists():
+                writer.attach_file(expected, f"{name}_expected", png, move=False)
+            writer.attach_bytes(screenshot, f"{name}_actual", png)
+            if result.diff_png is not None:
+                writer.attach_bytes(result.diff_png, f"{name}_diff", png)
+        raise AssertionError(f"{result.name} differs from baseline: {result.reason}")
+
     @allure.step("Click element: {selector}")
     def click(self, selector: str) -> None:
         """Click element by selector.
@@ -89,7 +195,7 @@ class BasePage:
             selector: Element selector.
         """
         logger.debug(f"Clicking element: {selector}")
-        self.page.click(selector)
+        self.locator(selector).first.click()
 
     @allure.step("Fill input: {selector}")
     def fill(self, selector: str, value: str) -> None:
@@ -100,7 +206,7 @@ class BasePage:
             value: Value to fill.
         """
         logger.debug(f"Filling {selector} with value")
-        self.page.fill(selector, value)
+        self.locator(selector).first.fill(value)
 
     @allure.step("Get text from: {selector}")
     def get_text(self, selector: str) -> str:
@@ -112,7 +218,7 @@ class BasePage:
         Returns:
             Element text content.
         """
-        return str(self.page.inner_text(selector))
+        return self.locator(selector).first.inner_text()
 
     @allure.step("Check element is visible: {selector}")
     def is_visible(self, selector: str) -> bool:
@@ -124,7 +230,7 @@ class BasePage:
         Returns:
             True if element is visible.
         """
-        return bool(self.page.is_visible(selector))
+        return self.locator(selector).first.is_visible()
 
     @allure.step("Wait for element: {selector}")
     def wait_for_element(
@@ -139,7 +245,7 @@ class BasePage:
             state: Expected state (visible, hidden, attached, detached).
         """
         logger.debug(f"Waiting for {selector} to be {state}")
-        self.page.wait_for_selector(selector, state=state)
+        self.locator(selector).first.wait_for(state=state)
 
     @allure.step("Assert element is visible: {selector}")
     def assert_element_visible(self, selector: str) -> None:
@@ -148,7 +254,25 @@ class BasePage:
         Args:
             selector: Element selector.
         """
-        expect(self.page.locator(selector)).to_be_visible()
+        expect(self.locator(selector)).to_be_visible()
+
+    @allure.step("Assert elements are visible")
+    def assert_elements_visible(self, *selectors: str) -> dict[str, ElementState]:
+        """Assert elements are visible, reading all of them in one round trip.
+
+        Elements not yet visible are then awaited one by one with ``expect``.
+
+        Args:
+            selectors: Element selectors.
+
+        Returns:
+            Selector -> element state of the batched read, for further checks.
+        """
+        states = self.query_elements(dict(zip(selectors, selectors, strict=True)))
+        for selector, state in states.items():
+            if not state.visible:
+                expect(self.locator(selector)).to_be_visible()
+        return states
 
     @allure.step("Assert element has text: {text}")
     def assert_element_has_text(self, selector: str, text: str) -> None:
@@ -158,7 +282,7 @@ class BasePage:
             selector: Element selector.
             text: Expected text.
         """
-        expect(self.page.locator(selector)).to_contain_text(text)
+        expect(self.locator(selector)).to_contain_text(text)
 
     @allure.step("Assert URL contains: {url_part}")
     def assert_url_contains(self, url_part: str) -> None:
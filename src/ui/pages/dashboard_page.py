@@ -2,6 +2,8 @@ import allure
 from playwright.sync_api import Page
 
 from src.ui.pages.base_page import BasePage
+from src.ui.perf import Budget
+from src.ui.readiness import LoadState, SelectorsVisible
 
 
 class DashboardPage(BasePage):
@@ -18,6 +20,15 @@ class DashboardPage(BasePage):
     NOTIFICATIONS_ICON = "[data-testid='notifications']"
     SETTINGS_LINK = "[data-testid='settings-link']"
 
+    # Dashboard polls notifications, so networkidle would wait out the timeout
+    readiness = (
+        LoadState("domcontentloaded"),
+        SelectorsVisible(WELCOME_MESSAGE, USER_MENU),
+    )
+    budgets = (Budget("ready", 2000),)
+    # User name and unread count differ between test users
+    visual_ignore = (WELCOME_MESSAGE, NOTIFICATIONS_ICON)
+
     def __init__(self, page: Page, base_url: str) -> None:
         """Initialize dashboard page.
 
@@ -76,9 +87,7 @@ class DashboardPage(BasePage):
 
     def assert_dashboard_loaded(self) -> None:
         """Assert dashboard page is properly loaded."""
-        self.assert_element_visible(self.WELCOME_MESSAGE)
-        self.assert_element_visible(self.USER_MENU)
-        self.assert_element_visible(self.SIDEBAR)
+        self.assert_elements_visible(self.WELCOME_MESSAGE, self.USER_MENU, self.SIDEBAR)
 
     def assert_user_logged_in(self, username: str) -> None:
         """Assert user is logged in with expected username.
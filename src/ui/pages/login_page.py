@@ -1,7 +1,8 @@
 import allure
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 
 from src.ui.pages.base_page import BasePage
+from src.ui.readiness import LoadState, SelectorsVisible
 
 
 class LoginPage(BasePage):
@@ -10,13 +11,21 @@ class LoginPage(BasePage):
     url_path = "/login"
 
     # Selectors
-    EMAIL_INPUT = "//input[@name='email']"
-    PASSWORD_INPUT = "//input[@name='password']"
-    LOGIN_BUTTON = "//button[@type='submit' and normalize-space()='Sign in']"
+    EMAIL_INPUT = "input[name='email']"
+    PASSWORD_INPUT = "input[name='password']"
+    # Plain CSS, so batched reads resolve it with querySelector
+    LOGIN_BUTTON = "form button[type='submit']"
+    LOGIN_BUTTON_LABEL = "Sign in"
     ERROR_MESSAGE = "[data-testid='error-message']"
     REMEMBER_ME_CHECKBOX = "[data-testid='remember-me']"
     FORGOT_PASSWORD_LINK = "[data-testid='forgot-password']"
 
+    # Usable once the form is rendered, without waiting for images or late scripts
+    readiness = (
+        LoadState("domcontentloaded"),
+        SelectorsVisible(EMAIL_INPUT, PASSWORD_INPUT, LOGIN_BUTTON),
+    )
+
     def __init__(self, page: Page, base_url: str) -> None:
         """Initialize login page.
 
@@ -76,7 +85,7 @@ class LoginPage(BasePage):
         Returns:
             Self for chaining.
         """
-        self.page.locator(self.REMEMBER_ME_CHECKBOX).check()
+        self.locator(self.REMEMBER_ME_CHECKBOX).check()
         return self
 
     @allure.step("Click forgot password link")
@@ -109,7 +118,10 @@ class LoginPage(BasePage):
         self.assert_element_has_text(self.ERROR_MESSAGE, expected_text)
 
     def assert_login_page_loaded(self) -> None:
-        """Assert login page is properly loaded."""
-        self.assert_element_visible(self.EMAIL_INPUT)
-        self.assert_element_visible(self.PASSWORD_INPUT)
-        self.assert_element_visible(self.LOGIN_BUTTON)
+        """Assert login page is properly loaded and the submit button is labelled."""
+        states = self.assert_elements_visible(
+            self.EMAIL_INPUT, self.PASSWORD_INPUT, self.LOGIN_BUTTON
+        )
+        if states[self.LOGIN_BUTTON].text.strip() != self.LOGIN_BUTTON_LABEL:
+            # Label read in the batch may predate rendering: wait for it
+            expect(self.locator(self.LOGIN_BUTTON)).to_have_text(self.LOGIN_BUTTON_LABEL)
@@ -0,0 +1,268 @@
+import json
+import os
+import statistics
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Literal
+
+import allure
+from playwright.sync_api import CDPSession, Error, Page
+
+from src.utils.logger import LOG_DIR, logger
+
+if TYPE_CHECKING:
+    from config.settings import Settings
+
+PERF_DIR = LOG_DIR / "perf"
+SUMMARY_FILE = LOG_DIR / "perf-summary.json"
+
+# One round trip: timings are ms since navigation start of the current document.
+# Null when the page was reached by a client-side (SPA) navigation: the
+# navigation entry then belongs to an earlier page.
+_TIMING_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    if (!nav || nav.name.split("#")[0] !== location.href.split("#")[0]) return null;
+    const metrics = {
+        ttfb: nav.responseStart,
+        dom_content_loaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        transfer_kb: nav.transferSize / 1024,
+        ready: performance.now(),
+    };
+    for (const paint of performance.getEntriesByType("paint")) {
+        metrics[paint.name.replaceAll("-", "_")] = paint.startTime;
+    }
+    return metrics;
+}
+"""
+
+# CDP Performance.getMetrics durations are in seconds, heap size in bytes
+_CDP_METRICS = {
+    "ScriptDuration": ("script_ms", 1000),
+    "LayoutDuration": ("layout_ms", 1000),
+    "RecalcStyleDuration": ("recalc_style_ms", 1000),
+    "TaskDuration": ("task_ms", 1000),
+    "JSHeapUsedSize": ("js_heap_used_mb", 1 / (1024 * 1024)),
+}
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Upper limit for a page metric, e.g. ``Budget("ready", 2000)``.
+
+    Metric names are the keys of collected metrics: ``ttfb``,
+    ``dom_content_loaded``, ``load``, ``first_paint``,
+    ``first_contentful_paint``, ``ready`` (readiness conditions met),
+    and with CDP ``script_ms``, ``layout_ms``, ``task_ms``, ...
+    """
+
+    metric: str
+    limit: float
+
+    def check(self, metrics: dict[str, float]) -> str | None:
+        """Describe violation, or return None if metric is within budget (or missing)."""
+        value = metrics.get(self.metric)
+        if value is None or value <= self.limit:
+            return None
+        return f"{self.metric} {value:.0f} > {self.limit:.0f}"
+
+
+class BudgetExceededError(AssertionError):
+    """Page metrics exceed budgets declared by the page object."""
+
+
+class PerfRecorder:
+    """Collects page metrics of one process into a JSONL file.
+
+    Page objects call ``start()`` before navigating and ``measure()`` once
+    the page is ready. Every sample is attached to the Allure test;
+    ``write_summary()`` aggregates samples of all workers per page.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        cdp: bool = True,
+        budget_mode: Literal["warn", "fail"] = "warn",
+    ) -> None:
+        """Initialize recorder.
+
+        Args:
+            path: Samples file. Created on first sample.
+            cdp: Collect CDP performance metrics (Chromium only).
+            budget_mode: Log budget violations or fail the test.
+        """
+        self.path = path
+        self._cdp = cdp
+        self._budget_mode = budget_mode
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "PerfRecorder":
+        """Build recorder writing to the file of current process (xdist worker)."""
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        return cls(
+            PERF_DIR / f"perf.{worker}.{os.getpid()}.jsonl",
+            cdp=settings.perf_cdp and settings.browser == "chromium",
+            budget_mode=settings.perf_budget_mode,
+        )
+
+    def start(self, page: Page) -> CDPSession | None:
+        """Start CDP metrics collection before navigating (None without CDP)."""
+        if not self._cdp:
+            return None
+        try:
+            session = page.context.new_cdp_session(page)
+            session.send("Performance.enable")
+        except Error as e:
+            logger.debug(f"CDP performance metrics unavailable: {e}")
+            return None
+        return session
+
+    def measure(
+        self,
+        page: Page,
+        page_name: str,
+        budgets: tuple[Budget, ...] = (),
+        session: CDPSession | None = None,
+    ) -> dict[str, float] | None:
+        """Collect metrics of ready page, record them and check budgets.
+
+        Args:
+            page: Playwright page.
+            page_name: Page object name samples are grouped by.
+            budgets: Budgets of the page object.
+            session: CDP session returned by ``start()``.
+
+        Returns:
+            Metrics, or None if page was not reached by a document navigation.
+
+        Raises:
+            BudgetExceededError: Budget exceeded with ``PERF_BUDGET_MODE=fail``.
+        """
+        timings: dict[str, float] | None = page.evaluate(_TIMING_SCRIPT)
+        if session is not None:
+            if timings is not None:
+                timings.update(self._cdp_metrics(session))
+            session.detach()
+        if timings is None:
+            return None
+        # Events that have not happened yet are reported as 0
+        metrics = {name: round(value, 1) for name, value in timings.items() if value}
+        self._write({"page": page_name, "url": page.url, "metrics": metrics})
+        allure.attach(
+            json.dumps(metrics, indent=2),
+            name=f"perf_{page_name}",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+        violations = [v for v in (budget.check(metrics) for budget in budgets) if v]
+        if violations:
+            message = f"{page_name} over performance budget: {', '.join(violations)}"
+            if self._budget_mode == "fail":
+                raise BudgetExceededError(message)
+            logger.warning(message)
+        return metrics
+
+    def close(self) -> None:
+        """Close samples file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @staticmethod
+    def _cdp_metrics(session: CDPSession) -> dict[str, float]:
+        try:
+            response = session.send("Performance.getMetrics")
+        except Error as e:
+            logger.debug(f"Failed to read CDP metrics: {e}")
+            return {}
+        metrics: dict[str, float] = {}
+        for item in response["metrics"]:
+            if item["name"] in _CDP_METRICS:
+                name, scale = _CDP_METRICS[item["name"]]
+                metrics[name] = item["value"] * scale
+        return metrics
+
+    def _write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+
+def summarize(samples: list[dict[str, Any]]) -> dict[str, dict[str, dict[str, float]]]:
+    """Aggregate samples per page and metric.
+
+    Args:
+        samples: Records with ``page`` and ``metrics``.
+
+    Returns:
+        Page -> metric -> count, min, median, p95 and max.
+    """
+    values: dict[str, dict[str, list[float]]] = {}
+    for sample in samples:
+        page_values = values.setdefault(sample["page"], {})
+        for metric, value in sample["metrics"].items():
+            page_values.setdefault(metric, []).append(value)
+
+    summary: dict[str, dict[str, dict[str, float]]] = {}
+    for page_name, metrics in sorted(values.items()):
+        summary[page_name] = {}
+        for metric, series in sorted(metrics.items()):
+            series.sort()
+            summary[page_name][metric] = {
+                "count": len(series),
+                "min": series[0],
+                "median": round(statistics.median(series), 1),
+                "p95": series[round(0.95 * (len(series) - 1))],
+                "max": series[-1],
+            }
+    return summary
+
+
+def write_summary(perf_dir: Path = PERF_DIR, target: Path = SUMMARY_FILE) -> Path | None:
+    """Merge sample files of all workers into per-page aggregates.
+
+    Args:
+        perf_dir: Directory with sample files.
+        target: Summary JSON file.
+
+    Returns:
+        Summary path, or None if no page was measured.
+    """
+    paths = sorted(perf_dir.glob("perf.*.jsonl"))
+    if not paths:
+        return None
+    samples = [
+        json.loads(line)
+        for path in paths
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if line
+    ]
+    target.write_text(json.dumps(summarize(samples), indent=2), encoding="utf-8")
+    for path in paths:
+        path.unlink()
+    logger.info(f"Page performance summary: {target}")
+    return target
+
+
+_perf_recorder: PerfRecorder | None = None
+
+
+def get_perf_recorder() -> PerfRecorder | None:
+    """Get page metrics recorder (None unless ``PERF_METRICS`` is on)."""
+    return _perf_recorder
+
+
+def set_perf_recorder(recorder: PerfRecorder | None) -> None:
+    """Set page metrics recorder used by page objects."""
+    global _perf_recorder
+    _perf_recorder = recorder
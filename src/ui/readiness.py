@@ -0,0 +1,130 @@
+import fnmatch
+import functools
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any, Literal
+
+from playwright.sync_api import Page, Response
+
+LoadStateName = Literal["domcontentloaded", "load", "networkidle"]
+Waiter = Callable[[float | None], None]
+
+
+class ReadinessCondition(ABC):
+    """Condition a page must meet before it is usable.
+
+    ``arm()`` is called before navigation and returns a waiter called after
+    it, so conditions can observe events fired while the page loads.
+    """
+
+    # Condition only makes sense around a navigation (skipped by ``wait_for_load``)
+    navigation_only = False
+
+    def arm(self, page: Page) -> Waiter:
+        """Start watching page before navigation.
+
+        Args:
+            page: Playwright page.
+
+        Returns:
+            Function waiting (with optional timeout in ms) until condition is met.
+        """
+        return functools.partial(self.wait, page)
+
+    @abstractmethod
+    def wait(self, page: Page, timeout: float | None = None) -> None:
+        """Wait until condition is met on already loaded page."""
+
+
+class LoadState(ReadinessCondition):
+    """Page reached a load state (``networkidle`` suits pages without polling)."""
+
+    def __init__(self, state: LoadStateName = "load") -> None:
+        self.state: LoadStateName = state
+
+    def wait(self, page: Page, timeout: float | None = None) -> None:
+        page.wait_for_load_state(self.state, timeout=timeout)
+
+    def __repr__(self) -> str:
+        return f"LoadState({self.state!r})"
+
+
+class SelectorsVisible(ReadinessCondition):
+    """Key elements reached state (elements render in parallel, so cost is the slowest one)."""
+
+    def __init__(
+        self,
+        *selectors: str,
+        state: Literal["attached", "detached", "hidden", "visible"] = "visible",
+    ) -> None:
+        self.selectors = selectors
+        self.state = state
+
+    def wait(self, page: Page, timeout: float | None = None) -> None:
+        for selector in self.selectors:
+            page.locator(selector).first.wait_for(state=self.state, timeout=timeout)
+
+    def __repr__(self) -> str:
+        return f"SelectorsVisible{self.selectors!r}"
+
+
+class JsPredicate(ReadinessCondition):
+    """JS expression evaluated in page becomes truthy (e.g. ``() => window.appReady``)."""
+
+    def __init__(self, expression: str, arg: Any = None) -> None:
+        self.expression = expression
+        self.arg = arg
+
+    def wait(self, page: Page, timeout: float | None = None) -> None:
+        page.wait_for_function(self.expression, arg=self.arg, timeout=timeout)
+
+    def __repr__(self) -> str:
+        return f"JsPredicate({self.expression!r})"
+
+
+class ApiResponse(ReadinessCondition):
+    """Page received response from API endpoint, e.g. the data it renders."""
+
+    navigation_only = True
+
+    def __init__(self, url: str | re.Pattern[str], status: int | None = 200) -> None:
+        """Initialize API response condition.
+
+        Args:
+            url: URL glob (``*/api/profile*``) or compiled regex.
+            status: Expected status code. None accepts any.
+        """
+        self.url = url
+        self.status = status
+        self._pattern = re.compile(fnmatch.translate(url)) if isinstance(url, str) else url
+
+    def matches(self, response: Response) -> bool:
+        """Check whether response satisfies condition."""
+        if self.status is not None and response.status != self.status:
+            return False
+        return self._pattern.match(response.url) is not None
+
+    def arm(self, page: Page) -> Waiter:
+        matched: list[Response] = []
+
+        def _on_response(response: Response) -> None:
+            if self.matches(response):
+                matched.append(response)
+
+        page.on("response", _on_response)
+
+        def _wait(timeout: float | None = None) -> None:
+            try:
+                if not matched:
+                    page.wait_for_event("response", predicate=self.matches, timeout=timeout)
+            finally:
+                page.remove_listener("response", _on_response)
+
+        return _wait
+
+    def wait(self, page: Page, timeout: float | None = None) -> None:
+        page.wait_for_event("response", predicate=self.matches, timeout=timeout)
+
+    def __repr__(self) -> str:
+        return f"ApiResponse({self.url!r})"
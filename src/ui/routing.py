@@ -0,0 +1,182 @@
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Route
+
+from config.settings import RouteProfile
+from src.utils.logger import logger
+
+# Static responses are shared by workers and runs: keep the directory out of VCS
+ASSET_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / ".asset-cache"
+
+CACHEABLE_TYPES = frozenset({"stylesheet", "script", "font", "image"})
+
+_STUB_CONTENT_TYPES = {
+    "script": "application/javascript",
+    "stylesheet": "text/css",
+    "document": "text/html",
+    "xhr": "application/json",
+    "fetch": "application/json",
+}
+
+
+class StaticAssetCache:
+    """Disk cache of static responses shared by workers of one machine.
+
+    Recently used responses are also kept in memory (up to ``max_entries``),
+    expiring with the same TTL as their files.
+    """
+
+    def __init__(
+        self, cache_dir: Path = ASSET_CACHE_DIR, ttl: float = 3600, max_entries: int = 256
+    ) -> None:
+        """Initialize asset cache.
+
+        Args:
+            cache_dir: Directory with cached responses.
+            ttl: Seconds a cached response is served before it is fetched again.
+            max_entries: Responses kept in memory; least recently used are evicted.
+        """
+        self._dir = cache_dir
+        self._ttl = ttl
+        self._max_entries = max_entries
+        # URL -> (expiry time, headers, body), least recently used first
+        self._memory: dict[str, tuple[float, dict[str, str], bytes]] = {}
+
+    def get(self, url: str) -> tuple[dict[str, str], bytes] | None:
+        """Get cached headers and body of URL."""
+        entry = self._memory.pop(url, None)
+        if entry is not None:
+            expires_at, headers, body = entry
+            if time.time() < expires_at:
+                self._memory[url] = entry
+                return headers, body
+        body_path = self._path(url)
+        try:
+            expires_at = body_path.stat().st_mtime + self._ttl
+            if time.time() >= expires_at:
+                return None
+            headers = json.loads(body_path.with_suffix(".json").read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+        self._remember(url, expires_at, headers, body)
+        return headers, body
+
+    def put(self, url: str, headers: dict[str, str], body: bytes) -> None:
+        """Store response of URL (atomically, so concurrent workers never read torn files)."""
+        self._remember(url, time.time() + self._ttl, headers, body)
+        body_path = self._path(url)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        meta_path = body_path.with_suffix(".json")
+        meta_path.with_suffix(suffix).write_text(json.dumps(headers), encoding="utf-8")
+        os.replace(meta_path.with_suffix(suffix), meta_path)
+        body_path.with_suffix(suffix).write_bytes(body)
+        os.replace(body_path.with_suffix(suffix), body_path)
+
+    def _remember(self, url: str, expires_at: float, headers: dict[str, str], body: bytes) -> None:
+        self._memory.pop(url, None)
+        self._memory[url] = (expires_at, headers, body)
+        while len(self._memory) > self._max_entries:
+            del self._memory[next(iter(self._memory))]
+
+    def _path(self, url: str) -> Path:
+        return self._dir / f"{hashlib.sha256(url.encode()).hexdigest()}.body"
+
+
+class RouteHandler:
+    """Context route handler applying a routing profile.
+
+    Requests are, in order: aborted by resource type, stubbed for known
+    third-party hosts, aborted by URL pattern, served from the asset cache,
+    or passed on unchanged.
+    """
+
+    def __init__(self, profile: RouteProfile, cache: StaticAssetCache | None = None) -> None:
+        """Initialize route handler.
+
+        Args:
+            profile: Routing profile.
+            cache: Asset cache used when profile enables ``cache_static``.
+        """
+        self._block_types = frozenset(profile.block_resource_types)
+        self._stub_hosts = tuple(host.lower() for host in profile.stub_hosts)
+        # All globs in one regex: one match call per request
+        self._blocked_urls = (
+            re.compile("|".join(fnmatch.translate(p) for p in profile.block_url_patterns))
+            if profile.block_url_patterns
+            else None
+        )
+        self._cache = cache if profile.cache_static else None
+
+    def apply(self, context: BrowserContext) -> None:
+        """Route all requests of context through this handler."""
+        context.route("**/*", self)
+
+    def __call__(self, route: Route) -> None:
+        request = route.request
+        resource_type = request.resource_type
+        if resource_type in self._block_types:
+            route.abort("blockedbyclient")
+            return
+
+        url = request.url
+        host = (urlsplit(url).hostname or "").lower()
+        if self._stub_hosts and any(
+            host == stub or host.endswith(f".{stub}") for stub in self._stub_hosts
+        ):
+            content_type = _STUB_CONTENT_TYPES.get(resource_type, "text/plain")
+            body = "{}" if content_type == "application/json" else ""
+            route.fulfill(status=200, content_type=content_type, body=body)
+            return
+
+        if self._blocked_urls is not None and self._blocked_urls.match(url):
+            route.abort("blockedbyclient")
+            return
+
+        if self._cache is not None and request.method == "GET" and resource_type in CACHEABLE_TYPES:
+            self._serve_cached(route, url)
+            return
+
+        route.fallback()
+
+    def _serve_cached(self, route: Route, url: str) -> None:
+        assert self._cache is not None
+        cached = self._cache.get(url)
+        if cached is not None:
+            headers, body = cached
+            route.fulfill(status=200, headers=headers, body=body)
+            return
+        response = route.fetch()
+        body = response.body()
+        if response.status == 200:
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+            }
+            try:
+                self._cache.put(url, headers, body)
+            except OSError as exc:
+                logger.debug(f"Failed to cache {url}: {exc}")
+        route.fulfill(response=response, body=body)
+
+
+def build_route_handler(profile: RouteProfile) -> RouteHandler | None:
+    """Build handler for profile (None when profile routes nothing)."""
+    if not (
+        profile.block_resource_types
+        or profile.block_url_patterns
+        or profile.stub_hosts
+        or profile.cache_static
+    ):
+        return None
+    cache = StaticAssetCache(ttl=profile.cache_ttl) if profile.cache_static else None
+    return RouteHandler(profile, cache)
@@ -0,0 +1,221 @@
+import hashlib
+import io
+import os
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.utils.logger import logger
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # Optional "visual" extra: only byte-identical screenshots can be checked
+    np = None  # type: ignore[assignment,unused-ignore]
+    Image = None  # type: ignore[assignment,unused-ignore]
+
+if TYPE_CHECKING:
+    from config.settings import Settings
+
+# Ignore region in screenshot pixels: x, y, width, height
+Region = tuple[int, int, int, int]
+
+_UNSAFE_NAME_RE = re.compile(r"[^\w.-]+")
+_DIFF_COLOR = (255, 0, 0)
+
+
+@dataclass(frozen=True, slots=True)
+class _Decoded:
+    pixels: Any  # uint8 array, height x width x 3
+    phash: int
+
+
+@dataclass(frozen=True)
+class VisualResult:
+    """Outcome of comparing a screenshot with its baseline."""
+
+    name: str
+    passed: bool
+    reason: str
+    diff_ratio: float = 0.0
+    phash_distance: int = 0
+    diff_png: bytes | None = None
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _baseline_digest(path: Path, mtime_ns: int) -> str:
+    """Digest of baseline file, cached until file changes (mtime in the key)."""
+    return _digest(path.read_bytes())
+
+
+# Decoded full-HD baseline takes ~6 MB: keep only the latest few
+@lru_cache(maxsize=8)
+def _decode_baseline(path: Path, mtime_ns: int) -> _Decoded:
+    return _decode(path.read_bytes())
+
+
+def _decode(data: bytes) -> _Decoded:
+    if np is None or Image is None:
+        raise RuntimeError(
+            "Visual diff of changed screenshots requires numpy and pillow: "
+            "install the 'visual' extra (poetry install -E visual)"
+        )
+    with Image.open(io.BytesIO(data)) as image:
+        rgb = image.convert("RGB")
+    return _Decoded(np.asarray(rgb), _dhash(rgb))
+
+
+def _dhash(image: Any) -> int:
+    """64-bit difference hash: brightness gradients of a 9x8 grayscale thumbnail."""
+    thumb = np.asarray(image.convert("L").resize((9, 8), Image.Resampling.BOX), dtype=np.int16)
+    bits = np.packbits(thumb[:, 1:] > thumb[:, :-1])
+    return int.from_bytes(bits.tobytes(), "big")
+
+
+def _encode_png(pixels: Any) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class VisualBaselines:
+    """Baseline screenshots with fast pre-checks and vectorized pixel diff.
+
+    A screenshot whose PNG bytes equal the baseline passes without decoding
+    (Chromium encodes identical pixels identically). Otherwise both images
+    are decoded and compared per pixel with NumPy; a perceptual hash
+    distance is reported, and optionally limited, to tell rendering noise
+    from layout changes. A missing baseline fails the check unless updating
+    (``VISUAL_UPDATE=true``), which writes the screenshot as the new baseline.
+    """
+
+    def __init__(
+        self,
+        baseline_dir: Path,
+        update: bool = False,
+        max_diff_ratio: float = 0.001,
+        pixel_tolerance: int = 16,
+        max_phash_distance: int | None = None,
+    ) -> None:
+        """Initialize baseline store.
+
+        Args:
+            baseline_dir: Directory with baseline PNG files.
+            update: Overwrite baselines with new screenshots instead of comparing.
+            max_diff_ratio: Allowed share of changed pixels (outside ignored regions).
+            pixel_tolerance: Per-channel difference not counted as change (anti-aliasing).
+            max_phash_distance: Allowed perceptual hash distance (None: not checked).
+        """
+        self.baseline_dir = baseline_dir
+        self._update = update
+        self._max_diff_ratio = max_diff_ratio
+        self._pixel_tolerance = pixel_tolerance
+        self._max_phash_distance = max_phash_distance
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "VisualBaselines":
+        """Build store with baselines of the configured browser."""
+        return cls(
+            settings.visual_baseline_dir / settings.browser,
+            update=settings.visual_update,
+            max_diff_ratio=settings.visual_max_diff_ratio,
+            pixel_tolerance=settings.visual_pixel_tolerance,
+            max_phash_distance=settings.visual_max_phash_distance,
+        )
+
+    def path_for(self, name: str) -> Path:
+        """Build baseline file path from screenshot name."""
+        return self.baseline_dir / f"{_UNSAFE_NAME_RE.sub('_', name).strip('_')}.png"
+
+    def compare(self, name: str, actual: bytes, ignore: Sequence[Region] = ()) -> VisualResult:
+        """Compare PNG screenshot with its baseline.
+
+        Args:
+            name: Screenshot name (baseline file name).
+            actual: PNG screenshot bytes.
+            ignore: Regions excluded from pixel comparison.
+
+        Returns:
+            Comparison result; ``diff_png`` marks changed pixels when failed.
+        """
+        path = self.path_for(name)
+        if self._update:
+            self._save(path, actual)
+            return VisualResult(name, True, "baseline saved")
+        if not path.exists():
+            # Never create baselines implicitly: a typo or missing checkout would pass forever
+            return VisualResult(
+                name, False, f"baseline missing: {path} (run with VISUAL_UPDATE=true to create)"
+            )
+
+        mtime_ns = path.stat().st_mtime_ns
+        if _digest(actual) == _baseline_digest(path, mtime_ns):
+            return VisualResult(name, True, "identical")
+
+        expected = _decode_baseline(path, mtime_ns)
+        current = _decode(actual)
+        phash_distance = (expected.phash ^ current.phash).bit_count()
+        if expected.pixels.shape != current.pixels.shape:
+            return VisualResult(
+                name,
+                False,
+                f"size {current.pixels.shape[1::-1]} != baseline {expected.pixels.shape[1::-1]}",
+                diff_ratio=1.0,
+                phash_distance=phash_distance,
+            )
+
+        changed, compared = self._changed_pixels(expected.pixels, current.pixels, ignore)
+        diff_ratio = float(changed.sum()) / max(compared, 1)
+        failures = []
+        if diff_ratio > self._max_diff_ratio:
+            failures.append(f"{diff_ratio:.2%} pixels changed")
+        if self._max_phash_distance is not None and phash_distance > self._max_phash_distance:
+            failures.append(f"perceptual hash distance {phash_distance}")
+        if not failures:
+            return VisualResult(name, True, "within tolerance", diff_ratio, phash_distance)
+
+        diff = current.pixels.copy()
+        diff[changed] = _DIFF_COLOR
+        return VisualResult(
+            name, False, ", ".join(failures), diff_ratio, phash_distance, _encode_png(diff)
+        )
+
+    def _changed_pixels(
+        self, expected: Any, actual: Any, ignore: Sequence[Region]
+    ) -> tuple[Any, int]:
+        """Mask of changed pixels and number of pixels compared (outside ignored regions)."""
+        delta = np.abs(expected.astype(np.int16) - actual.astype(np.int16)).max(axis=2)
+        ignored = np.zeros(delta.shape, dtype=bool)
+        for x, y, width, height in ignore:
+            ignored[max(y, 0) : y + height, max(x, 0) : x + width] = True
+        changed = (delta > self._pixel_tolerance) & ~ignored
+        return changed, changed.size - int(ignored.sum())
+
+    @staticmethod
+    def _save(path: Path, data: bytes) -> None:
+        logger.info(f"Saving visual baseline: {path}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_bytes(data)
+        os.replace(temp, path)
+
+
+_visual_baselines: VisualBaselines | None = None
+
+
+def get_visual_baselines() -> VisualBaselines | None:
+    """Get baseline store of this session (None outside UI sessions)."""
+    return _visual_baselines
+
+
+def set_visual_baselines(baselines: VisualBaselines | None) -> None:
+    """Set baseline store used by page objects."""
+    global _visual_baselines
+    _visual_baselines = baselines
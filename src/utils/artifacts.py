@@ -0,0 +1,185 @@
+import os
+import shutil
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+from uuid import uuid4
+
+import allure
+from allure_commons import plugin_manager
+from allure_commons.types import AttachmentType
+
+from src.utils.logger import logger
+
+if TYPE_CHECKING:
+    from config.settings import Settings
+
+
+def _allure_targets() -> tuple[Any, Path] | None:
+    """Find Allure reporter and results dir of the running session (None if not reporting).
+
+    Relies on allure-pytest internals (pinned in pyproject.toml).
+    """
+    if not plugin_manager.hook.report_attached_file.get_hookimpls():
+        return None
+    reporter = report_dir = None
+    for plugin in plugin_manager.get_plugins():
+        reporter = reporter or getattr(plugin, "allure_logger", None)
+        report_dir = report_dir or getattr(plugin, "_report_dir", None)
+    if reporter is None or report_dir is None or not hasattr(reporter, "_attach"):
+        logger.warning("Allure reporter internals not found, attaching on the test thread")
+        return None
+    return reporter, Path(report_dir)
+
+
+class ArtifactWriter:
+    """Writes test artifacts to disk on a background thread.
+
+    The attachment is registered on the current Allure test immediately (on
+    the test thread), while its content is written by the background thread.
+    The test thread never copies large files, and buffers are released as
+    soon as they are written. Artifacts over ``max_bytes`` are dropped with a note.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 20 * 1024 * 1024,
+        screenshot_format: Literal["png", "jpeg"] = "png",
+        screenshot_quality: int = 80,
+        screenshot_full_page: bool = False,
+    ) -> None:
+        """Initialize artifact writer.
+
+        Args:
+            max_bytes: Size cap per artifact.
+            screenshot_format: Screenshot image format.
+            screenshot_quality: JPEG quality (0-100).
+            screenshot_full_page: Capture full scrollable page instead of viewport.
+        """
+        self._max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+        self.screenshot_options: dict[str, Any] = {
+            "type": screenshot_format,
+            "full_page": screenshot_full_page,
+        }
+        if screenshot_format == "jpeg":
+            self.screenshot_options["quality"] = screenshot_quality
+        self.screenshot_type = (
+            allure.attachment_type.JPG
+            if screenshot_format == "jpeg"
+            else allure.attachment_type.PNG
+        )
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "ArtifactWriter":
+        """Build writer from artifact policy settings."""
+        return cls(
+            max_bytes=settings.artifact_max_mb * 1024 * 1024,
+            screenshot_format=settings.screenshot_format,
+            screenshot_quality=settings.screenshot_quality,
+            screenshot_full_page=settings.screenshot_full_page,
+        )
+
+    def attach_bytes(self, data: bytes, name: str, attachment_type: AttachmentType) -> None:
+        """Attach in-memory artifact (e.g. screenshot).
+
+        Args:
+            data: Artifact content.
+            name: Attachment name.
+            attachment_type: Allure attachment type.
+        """
+        if self._over_cap(len(data), name):
+            return
+        target = self._register(name, attachment_type)
+        if target is None:
+            allure.attach(data, name=name, attachment_type=attachment_type)
+            return
+        self._submit(self._write_bytes, data, target)
+
+    def attach_file(
+        self, source: Path, name: str, attachment_type: AttachmentType, move: bool = True
+    ) -> None:
+        """Attach artifact file produced by the browser (trace, video).
+
+        Args:
+            source: Artifact file.
+            name: Attachment name.
+            attachment_type: Allure attachment type.
+            move: Remove source once it is attached.
+        """
+        if self._over_cap(source.stat().st_size, name):
+            if move:
+                source.unlink(missing_ok=True)
+            return
+        target = self._register(name, attachment_type)
+        if target is None:
+            allure.attach.file(str(source), name=name, attachment_type=attachment_type)
+            if move:
+                source.unlink(missing_ok=True)
+            return
+        self._submit(self._write_file, source, target, move)
+
+    def close(self) -> None:
+        """Write pending artifacts and stop background thread."""
+        self._executor.shutdown(wait=True)
+
+    def _over_cap(self, size: int, name: str) -> bool:
+        if size <= self._max_bytes:
+            return False
+        mb = 1024 * 1024
+        note = f"{name} skipped: {size / mb:.1f} MB exceeds cap of {self._max_bytes / mb:.1f} MB"
+        logger.warning(note)
+        allure.attach(note, name=name, attachment_type=allure.attachment_type.TEXT)
+        return True
+
+    @staticmethod
+    def _register(name: str, attachment_type: AttachmentType) -> Path | None:
+        """Add attachment entry to current Allure test; return path its content goes to."""
+        targets = _allure_targets()
+        if targets is None:
+            return None
+        reporter, report_dir = targets
+        try:
+            file_name: str = reporter._attach(uuid4(), name=name, attachment_type=attachment_type)
+        except (KeyError, IndexError):
+            # No running test item (e.g. session teardown)
+            return None
+        return report_dir / file_name
+
+    def _submit(self, func: Callable[..., None], *args: object) -> None:
+        self._executor.submit(func, *args).add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(future: Future[None]) -> None:
+        if future.exception():
+            logger.warning(f"Failed to write artifact: {future.exception()}")
+
+    @staticmethod
+    def _write_bytes(data: bytes, target: Path) -> None:
+        temp = target.with_suffix(".tmp")
+        temp.write_bytes(data)
+        os.replace(temp, target)
+
+    @staticmethod
+    def _write_file(source: Path, target: Path, move: bool) -> None:
+        temp = target.with_suffix(".tmp")
+        if move:
+            shutil.move(source, temp)
+        else:
+            shutil.copy2(source, temp)
+        os.replace(temp, target)
+
+
+_artifact_writer: ArtifactWriter | None = None
+
+
+def get_artifact_writer() -> ArtifactWriter | None:
+    """Get artifact writer of this session (None outside UI sessions)."""
+    return _artifact_writer
+
+
+def set_artifact_writer(writer: ArtifactWriter | None) -> None:
+    """Set artifact writer used by page objects."""
+    global _artifact_writer
+    _artifact_writer = writer
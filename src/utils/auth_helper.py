@@ -6,21 +6,29 @@ from config.settings import Settings
 from src.api.client import APIClient
 from src.api.endpoints.auth import AuthAPI
 from src.utils.logger import logger
+from src.utils.token_cache import TokenCache
 
 
 class AuthHelper:
     """Helper class for authentication operations."""
 
-    def __init__(self, settings: Settings, api_client: APIClient | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        api_client: APIClient | None = None,
+        token_cache: TokenCache | None = None,
+    ) -> None:
         """Initialize auth helper.
 
         Args:
             settings: Settings instance.
             api_client: Optional API client. Creates new one if not provided.
+            token_cache: Optional token cache. Without it every login hits the API.
         """
         self._settings = settings
         self._client = api_client or APIClient(settings=settings)
         self._auth_api = AuthAPI(self._client, settings)
+        self._token_cache = token_cache
         self._token: str | None = None
 
     @property
@@ -48,6 +56,8 @@ class AuthHelper:
     def login(self, email: str, password: str) -> str:
         """Login with provided credentials.
 
+        Reuses a cached token while it is not close to expiry.
+
         Args:
             email: User email.
             password: User password.
@@ -55,10 +65,28 @@ class AuthHelper:
         Returns:
             Access token.
         """
-        logger.info(f"Authenticating user: {email}")
-        token = cast(str, self._auth_api.login(email, password))
+        if self._token_cache is None:
+            token = self._login(email, password)
+        else:
+            key = TokenCache.key(self._settings.api_url, email, password)
+            token = self._token_cache.get(key, lambda: self._login(email, password))
         self._token = token
         self._client.set_token(token)
+        return token
+
+    def invalidate_cached_token(self, email: str, password: str) -> None:
+        """Drop cached token for credentials (e.g. after server rejected it).
+
+        Args:
+            email: User email.
+            password: User password.
+        """
+        if self._token_cache is not None:
+            self._token_cache.invalidate(TokenCache.key(self._settings.api_url, email, password))
+
+    def _login(self, email: str, password: str) -> str:
+        logger.info(f"Authenticating user: {email}")
+        token = cast(str, self._auth_api.login(email, password))
         logger.info("Authentication successful")
         return token
 
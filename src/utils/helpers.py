@@ -2,7 +2,9 @@ import json
 import random
 import re
 import string
+from collections.abc import Hashable, Iterable, Iterator
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 
 def generate_random_string(length: int = 10, chars: str | None = None) -> str:
@@ -109,6 +111,11 @@ SENSITIVE_KEYS = {
 }
 
 
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: Hashable) -> bool:
+    return str(key).lower() in SENSITIVE_KEYS
+
+
 def _mask_value(value: object) -> object:
     if isinstance(value, str):
         return mask_sensitive_data(value)
@@ -116,31 +123,131 @@ def _mask_value(value: object) -> object:
 
 
 def sanitize_payload(payload: object) -> object:
-    """Sanitize dict/list payloads for safe logging."""
+    """Sanitize dict/list payloads for safe logging.
+
+    Copy-on-write: containers without sensitive keys are returned as is,
+    so the result must not be mutated.
+    """
     if isinstance(payload, dict):
-        sanitized: dict[object, object] = {}
+        sanitized: dict[object, object] | None = None
         for key, value in payload.items():
-            key_str = str(key).lower()
-            if key_str in SENSITIVE_KEYS:
-                sanitized[key] = _mask_value(value)
+            if _is_sensitive_key(key):
+                new_value = _mask_value(value)
             else:
-                sanitized[key] = sanitize_payload(value)
-        return sanitized
-    if isinstance(payload, list):
-        return [sanitize_payload(item) for item in payload]
-    if isinstance(payload, tuple):
-        return tuple(sanitize_payload(item) for item in payload)
+                new_value = sanitize_payload(value)
+                if new_value is value:
+                    continue
+            if sanitized is None:
+                sanitized = dict(payload)
+            sanitized[key] = new_value
+        return payload if sanitized is None else sanitized
+    if isinstance(payload, list | tuple):
+        items: list[object] | None = None
+        for index, item in enumerate(payload):
+            new_item = sanitize_payload(item)
+            if new_item is item:
+                continue
+            if items is None:
+                items = list(payload)
+            items[index] = new_item
+        if items is None:
+            return payload
+        return items if isinstance(payload, list) else tuple(items)
     return payload
 
 
-_JSON_KV_RE = re.compile(
-    r'(?i)("?(?:access_token|refresh_token|token|jwt-token|password|client_secret|authorization)"?\s*[:=]\s*")([^"]+)(")'
+_SENSITIVE_KEYS_PATTERN = "|".join(
+    re.escape(key) for key in sorted(SENSITIVE_KEYS, key=len, reverse=True)
+)
+# Single pass over text: key/value pairs or bearer tokens. Quoted values may contain
+# JSON escapes and be cut off at the end; unquoted scalars (numbers, form values) are
+# masked whole, except a bearer scheme that the bearer branch masks instead
+_SENSITIVE_TEXT_PATTERN = (
+    rf'(?P<key>"?(?:{_SENSITIVE_KEYS_PATTERN})"?\s*[:=]\s*)'
+    r'(?:(?P<quote>")(?P<value>[^"\\]*(?:\\.[^"\\]*)*\\?)(?P<end>"|\Z)'
+    r'|(?!bearer\s)(?P<scalar>[^\s"{\[,;&}\]]+))'
+    r"|(?P<bearer>Bearer\s+)(?P<token>[A-Za-z0-9\-\._~\+\/]+=*)"
 )
-_BEARER_RE = re.compile(r"(?i)(Bearer\s+)([A-Za-z0-9\-\._~\+\/]+=*)")
+_SENSITIVE_TEXT_RE = re.compile(_SENSITIVE_TEXT_PATTERN, re.IGNORECASE)
+_SENSITIVE_BYTES_RE = re.compile(_SENSITIVE_TEXT_PATTERN.encode(), re.IGNORECASE)
+# Literal markers covering every sensitive key (e.g. "pass" covers "password"); a
+# lowercase find() is much faster than the regex, so text without markers skips it
+_SENSITIVE_MARKERS = ("pass", "secret", "token", "authorization", "api_key", "apikey", "bearer")
+_SENSITIVE_BYTE_MARKERS = tuple(marker.encode() for marker in _SENSITIVE_MARKERS)
+_SENSITIVE_MARKER_RE = re.compile("|".join(_SENSITIVE_MARKERS), re.IGNORECASE)
+# Distance from a marker back to the start of its key, plus an opening quote
+_MARKER_LOOKBACK = 1 + max(
+    key.find(marker) for key in SENSITIVE_KEYS for marker in _SENSITIVE_MARKERS if marker in key
+)
+
+
+def _first_marker(lowered: str | bytes) -> int:
+    """Return offset of the first sensitive marker or -1."""
+    first = -1
+    if isinstance(lowered, bytes):
+        for byte_marker in _SENSITIVE_BYTE_MARKERS:
+            index = lowered.find(byte_marker)
+            if index != -1 and (first == -1 or index < first):
+                first = index
+        return first
+    for marker in _SENSITIVE_MARKERS:
+        index = lowered.find(marker)
+        if index != -1 and (first == -1 or index < first):
+            first = index
+    return first
+
+
+def _first_text_marker(text: str) -> int:
+    """Return offset of the first sensitive marker in text or -1.
+
+    ``str.lower()`` may change the length of non-ASCII text ('İ' becomes two
+    characters), so offsets found in lowered text are only valid for ASCII.
+    """
+    if text.isascii():
+        return _first_marker(text.lower())
+    match = _SENSITIVE_MARKER_RE.search(text)
+    return match.start() if match else -1
+
+
+def _mask_text_match(match: re.Match[str]) -> str:
+    if match.group("bearer"):
+        return f"{match.group('bearer')}{mask_sensitive_data(match.group('token'))}"
+    if match.group("scalar"):
+        return f"{match.group('key')}***"
+    return (
+        f"{match.group('key')}{match.group('quote')}"
+        f"{mask_sensitive_data(match.group('value'))}{match.group('end')}"
+    )
+
+
+def _mask_bytes(value: bytes, visible_chars: int = 4) -> bytes:
+    if len(value) <= visible_chars:
+        return b"*" * len(value)
+    return value[:visible_chars] + b"*" * (len(value) - visible_chars)
+
+
+def _mask_bytes_match(match: re.Match[bytes]) -> bytes:
+    if match.group("bearer"):
+        return match.group("bearer") + _mask_bytes(match.group("token"))
+    if match.group("scalar"):
+        return match.group("key") + b"***"
+    return (
+        match.group("key")
+        + match.group("quote")
+        + _mask_bytes(match.group("value"))
+        + match.group("end")
+    )
 
 
 def sanitize_text(text: str) -> str:
-    """Sanitize sensitive values inside free-form text."""
+    """Sanitize sensitive values inside free-form text.
+
+    Text without any sensitive key or bearer token is returned unchanged
+    without being parsed.
+    """
+    if _first_text_marker(text) == -1:
+        return text
+
     try:
         parsed = json.loads(text)
     except Exception:
@@ -149,11 +256,80 @@ def sanitize_text(text: str) -> str:
     if parsed is not None:
         return json.dumps(sanitize_payload(parsed))
 
-    def _mask_json_kv(match: re.Match[str]) -> str:
-        return f"{match.group(1)}{mask_sensitive_data(match.group(2))}{match.group(3)}"
+    return _mask_sensitive_text(text)
 
-    sanitized = _JSON_KV_RE.sub(_mask_json_kv, text)
-    sanitized = _BEARER_RE.sub(
-        lambda m: f"{m.group(1)}{mask_sensitive_data(m.group(2))}", sanitized
-    )
-    return sanitized
+
+def _mask_sensitive_text(text: str) -> str:
+    """Mask sensitive values in a single regex pass starting at the first marker."""
+    first = _first_text_marker(text)
+    if first == -1:
+        return text
+    start = max(first - _MARKER_LOOKBACK, 0)
+    return text[:start] + _SENSITIVE_TEXT_RE.sub(_mask_text_match, text[start:])
+
+
+def sanitize_text_prefix(text: str | bytes, limit: int = 500, encoding: str = "utf-8") -> str:
+    """Sanitize only the part of text that will be logged.
+
+    Unlike ``sanitize_text`` the body is never parsed as a whole, so the cost
+    does not grow with body size. Values cut off at the limit are still masked.
+
+    Args:
+        text: Text or raw bytes (e.g. ``response.content``).
+        limit: Maximum number of characters to keep.
+        encoding: Encoding used to decode bytes.
+
+    Returns:
+        Sanitized text of at most ``limit`` characters.
+    """
+    if isinstance(text, bytes):
+        # A character takes at most 4 bytes, so this slice always covers the limit
+        text = text[: limit * 4].decode(encoding, errors="ignore")
+    return _mask_sensitive_text(text[:limit])
+
+
+def sanitize_stream(chunks: Iterable[bytes], overlap: int = 64) -> Iterator[bytes]:
+    """Sanitize byte stream chunk by chunk without decoding it.
+
+    Works on ASCII-compatible encodings (UTF-8, Latin-1). The last ``overlap``
+    bytes of each chunk and any value that may continue in the next chunk are
+    held back, so keys and values split across chunks are still masked.
+
+    Args:
+        chunks: Byte chunks (e.g. ``response.iter_bytes()``).
+        overlap: Bytes held back to catch keys split between chunks.
+
+    Yields:
+        Sanitized byte chunks.
+    """
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        safe = max(len(pending) - overlap, 0)
+        parts: list[bytes] = []
+        emitted = 0
+        # bytes.lower() only folds ASCII letters, so offsets stay valid
+        first = _first_marker(pending.lower())
+        matches = (
+            _SENSITIVE_BYTES_RE.finditer(pending, max(first - _MARKER_LOOKBACK, 0))
+            if first != -1
+            else ()
+        )
+        for match in matches:
+            if match.start() >= safe:
+                break
+            if match.end() == len(pending):
+                # Value may continue in the next chunk
+                safe = match.start()
+                break
+            parts.append(pending[emitted : match.start()])
+            parts.append(_mask_bytes_match(match))
+            emitted = match.end()
+        cut = max(safe, emitted)
+        parts.append(pending[emitted:cut])
+        pending = pending[cut:]
+        output = b"".join(parts)
+        if output:
+            yield output
+    if pending:
+        yield _SENSITIVE_BYTES_RE.sub(_mask_bytes_match, pending)
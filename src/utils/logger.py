@@ -1,30 +1,166 @@
+import heapq
+import re
 import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
-# Remove default handler
-logger.remove()
+if TYPE_CHECKING:
+    from config.settings import Settings
 
-# Console handler with colored output
-logger.add(
-    sys.stdout,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="INFO",
-    colorize=True,
-)
-
-# File handler for debug logs
 LOG_DIR = Path(__file__).resolve().parent.parent.parent / "logs"
-LOG_DIR.mkdir(exist_ok=True)
-
-logger.add(
-    LOG_DIR / "test_{time:YYYY-MM-DD}.log",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="DEBUG",
-    rotation="1 day",
-    retention="7 days",
-    compression="zip",
-)
-
-__all__ = ["logger"]
+
+CONSOLE_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
+
+# Start of a record written with FILE_FORMAT; other lines continue the previous record
+_RECORD_START_RE = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3} \|")
+
+
+class FailureLogBuffer:
+    """In-memory sink holding current test logs until its outcome is known."""
+
+    def __init__(self) -> None:
+        self._messages: list[str] = []
+
+    def write(self, message: str) -> None:
+        self._messages.append(message)
+
+    def drain(self) -> str:
+        """Return buffered logs and clear buffer."""
+        logger.complete()
+        text = "".join(self._messages)
+        self._messages.clear()
+        return text
+
+    def clear(self) -> None:
+        """Discard buffered logs."""
+        logger.complete()
+        self._messages.clear()
+
+
+_failure_log_buffer: FailureLogBuffer | None = None
+_configured: tuple[object, ...] | None = None
+
+
+def get_failure_log_buffer() -> FailureLogBuffer | None:
+    """Get active failure log buffer (None unless buffered mode is on)."""
+    return _failure_log_buffer
+
+
+def configure_logging(settings: "Settings", worker_id: str | None = None) -> None:
+    """Configure console and file sinks from settings.
+
+    Importing this module has no side effects: sinks and the log directory are
+    created here. Repeated calls with the same configuration are no-ops.
+
+    Args:
+        settings: Settings with ``log_level``, ``log_enqueue`` and ``log_failed_only``.
+        worker_id: xdist worker id. Each worker writes its own file, merged at session end.
+    """
+    global _configured, _failure_log_buffer
+
+    config = (worker_id, settings.log_level, settings.log_enqueue, settings.log_failed_only)
+    if config == _configured:
+        return
+    _configured = config
+    console_level = settings.log_level
+    enqueue = settings.log_enqueue
+
+    logger.remove()
+    LOG_DIR.mkdir(exist_ok=True)
+
+    if settings.log_failed_only:
+        _failure_log_buffer = FailureLogBuffer()
+        logger.add(
+            _failure_log_buffer.write,
+            format=FILE_FORMAT,
+            level=console_level,
+            enqueue=enqueue,
+        )
+    else:
+        _failure_log_buffer = None
+        logger.add(
+            sys.stdout,
+            format=CONSOLE_FORMAT,
+            level=console_level,
+            colorize=True,
+            enqueue=enqueue,
+        )
+
+    if worker_id:
+        # Per-worker file: no cross-process contention, merged by merge_worker_logs()
+        log_path = LOG_DIR / f"test_{{time:YYYY-MM-DD}}.worker-{worker_id}.log"
+    else:
+        log_path = LOG_DIR / "test_{time:YYYY-MM-DD}.log"
+    # Same rotation and retention for worker files left behind by interrupted runs
+    logger.add(
+        log_path,
+        format=FILE_FORMAT,
+        level="DEBUG",
+        rotation="1 day",
+        retention="7 days",
+        compression="zip",
+        enqueue=enqueue,
+    )
+
+
+def shutdown_logging() -> None:
+    """Flush queued messages and close all sinks."""
+    global _configured
+
+    logger.complete()
+    logger.remove()
+    _configured = None
+
+
+def _read_records(path: Path) -> Iterator[str]:
+    record = ""
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if record and _RECORD_START_RE.match(line):
+                yield record
+                record = ""
+            record += line
+    if record:
+        yield record
+
+
+def merge_worker_logs(log_dir: Path = LOG_DIR) -> list[Path]:
+    """Merge per-worker log files into daily log files ordered by timestamp.
+
+    Args:
+        log_dir: Directory with worker log files.
+
+    Returns:
+        Paths of merged log files.
+    """
+    by_day: dict[str, list[Path]] = {}
+    for path in sorted(log_dir.glob("test_*.worker-*.log")):
+        day = path.name.split(".", 1)[0]
+        by_day.setdefault(day, []).append(path)
+
+    merged: list[Path] = []
+    for day, paths in by_day.items():
+        target = log_dir / f"{day}.log"
+        # Controller records already in the daily file are merged too, not followed by workers
+        sources = [target, *paths] if target.exists() else paths
+        partial = target.with_name(f"{target.name}.merging")
+        with partial.open("w", encoding="utf-8") as output:
+            output.writelines(heapq.merge(*(_read_records(path) for path in sources)))
+        partial.replace(target)
+        for path in paths:
+            path.unlink()
+        merged.append(target)
+    return merged
+
+
+__all__ = [
+    "configure_logging",
+    "get_failure_log_buffer",
+    "logger",
+    "merge_worker_logs",
+    "shutdown_logging",
+]
@@ -0,0 +1,237 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any
+
+import httpx
+
+from src.api.sdk import ApiContext
+from src.utils.logger import logger
+
+# Journals hold tokens/credentials of test accounts: keep the directory out of VCS
+JOURNAL_DIR = Path(__file__).resolve().parent.parent.parent / ".journal"
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """Resource created by a test run and not yet deleted."""
+
+    kind: str
+    resource_id: str
+    data: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+
+
+Deleter = Callable[[JournalEntry], None]
+
+
+class ResourceJournal:
+    """Append-only JSONL journal of created and deleted resources.
+
+    Every record is flushed immediately, so it survives the process being
+    killed. One journal file is written per process (xdist worker).
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize journal.
+
+        Args:
+            path: Journal file path. Created on first write.
+        """
+        self.path = path
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_path(journal_dir: Path = JOURNAL_DIR) -> Path:
+        """Build unique journal path for current process."""
+        return journal_dir / f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}.jsonl"
+
+    def record_created(
+        self,
+        kind: str,
+        resource_id: str,
+        data: dict[str, Any] | None = None,
+        attempts: int = 0,
+    ) -> None:
+        """Record created resource.
+
+        Args:
+            kind: Resource kind (e.g. ``account``), used to pick a deleter.
+            resource_id: Resource identifier unique within kind.
+            data: Data needed to delete resource later (e.g. token).
+            attempts: Failed sweep attempts so far.
+        """
+        self._write(
+            {
+                "event": "created",
+                "kind": kind,
+                "id": resource_id,
+                "data": data or {},
+                "attempts": attempts,
+            }
+        )
+
+    def record_deleted(self, kind: str, resource_id: str) -> None:
+        """Record resource as deleted."""
+        self._write({"event": "deleted", "kind": kind, "id": resource_id})
+
+    def close(self) -> None:
+        """Close journal file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+
+def _owner_alive(path: Path) -> bool:
+    """Check if the process that wrote a journal (pid in its file name) is still running."""
+    pid = path.name.split(".", 1)[0].rpartition("-")[2]
+    if not pid.isdigit() or os.name == "nt":
+        # Signal 0 is CTRL_C_EVENT on Windows: rely on min_age there
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def load_orphans(
+    journal_dir: Path = JOURNAL_DIR, min_age: float = 0
+) -> tuple[list[JournalEntry], list[Path]]:
+    """Read journals and return resources created but never deleted.
+
+    Args:
+        journal_dir: Directory with journal files.
+        min_age: Skip journals modified less than this many seconds ago
+            (they may belong to a run still in progress on another host).
+
+    Journals whose writing process is still running are skipped as well.
+
+    Returns:
+        Orphaned entries and journal files they were read from.
+    """
+    if not journal_dir.is_dir():
+        return [], []
+    now = time.time()
+    orphans: dict[tuple[str, str], JournalEntry] = {}
+    paths: list[Path] = []
+    for path in sorted(journal_dir.glob("*.jsonl")):
+        if now - path.stat().st_mtime < min_age or _owner_alive(path):
+            continue
+        paths.append(path)
+        with path.open(encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line of a killed process
+                    continue
+                key = (record["kind"], record["id"])
+                if record["event"] == "created":
+                    orphans[key] = JournalEntry(
+                        kind=record["kind"],
+                        resource_id=record["id"],
+                        data=record.get("data", {}),
+                        attempts=record.get("attempts", 0),
+                    )
+                else:
+                    orphans.pop(key, None)
+    return list(orphans.values()), paths
+
+
+def sweep_orphans(
+    deleters: Mapping[str, Deleter],
+    journal_dir: Path = JOURNAL_DIR,
+    max_workers: int = 8,
+    min_age: float = 0,
+    max_attempts: int = 3,
+) -> int:
+    """Delete resources left by earlier runs concurrently.
+
+    Swept journals are removed. Failed deletions are carried over to a new
+    journal and retried by the next sweep, up to ``max_attempts`` times.
+
+    Args:
+        deleters: Resource kind -> deleter.
+        journal_dir: Directory with journal files.
+        max_workers: Maximum number of concurrent deletions.
+        min_age: Skip journals modified less than this many seconds ago.
+            Journals of running processes are always skipped.
+        max_attempts: Attempts after which a resource is given up.
+
+    Returns:
+        Number of deleted resources.
+    """
+    orphans, paths = load_orphans(journal_dir, min_age)
+    if not paths:
+        return 0
+
+    def _delete(entry: JournalEntry) -> bool:
+        deleter = deleters.get(entry.kind)
+        if deleter is None:
+            return False
+        try:
+            deleter(entry)
+        except Exception as exc:
+            logger.warning(f"Orphan sweep failed for {entry.kind} {entry.resource_id}: {exc}")
+            return False
+        return True
+
+    deleted = 0
+    if orphans:
+        logger.info(f"Sweeping {len(orphans)} orphaned resources")
+        with ThreadPoolExecutor(max_workers=min(len(orphans), max_workers)) as executor:
+            results = list(executor.map(_delete, orphans))
+        deleted = sum(results)
+        leftovers = [
+            entry
+            for entry, ok in zip(orphans, results, strict=True)
+            if not ok and entry.attempts + 1 < max_attempts
+        ]
+        if leftovers:
+            journal = ResourceJournal(
+                ResourceJournal.new_path(journal_dir).with_suffix(".sweep.jsonl")
+            )
+            for entry in leftovers:
+                journal.record_created(
+                    entry.kind, entry.resource_id, entry.data, attempts=entry.attempts + 1
+                )
+            journal.close()
+
+    for path in paths:
+        path.unlink(missing_ok=True)
+    return deleted
+
+
+def account_deleter(context: ApiContext) -> Deleter:
+    """Build deleter for ``account`` entries (re-login if stored token expired)."""
+
+    def _delete(entry: JournalEntry) -> None:
+        try:
+            context.services.account.delete_current(token=entry.data["token"])
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code not in (401, 403) or "password" not in entry.data:
+                raise
+            token = context.services.auth.login(entry.resource_id, entry.data["password"])
+            context.services.account.delete_current(token=token)
+
+    return _delete
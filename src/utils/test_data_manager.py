@@ -1,23 +1,315 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
 
 from src.utils.logger import logger
+from src.utils.resource_journal import ResourceJournal
+
+
+@dataclass(frozen=True)
+class CleanupTask:
+    """Cleanup action tagged with resource key and dependencies.
+
+    Actions of ``AsyncTestDataManager`` return awaitables.
+    """
+
+    action: Callable[[], Any]
+    key: str | None = None
+    depends_on: tuple[str, ...] = ()
+
+
+def _run_action(task: CleanupTask) -> None:
+    try:
+        task.action()
+    except Exception as exc:
+        logger.warning(f"Cleanup failed ({task.key or 'untagged'}): {exc}")
+
+
+def run_cleanup_graph(
+    tasks: list[CleanupTask], successors: dict[int, set[int]], max_workers: int
+) -> None:
+    """Run cleanup tasks on a bounded pool respecting ordering edges.
+
+    Args:
+        tasks: Cleanup tasks.
+        successors: Task index -> indexes of tasks that may start only after it.
+        max_workers: Maximum number of concurrent cleanups.
+    """
+    pending = dict.fromkeys(range(len(tasks)), 0)
+    for targets in successors.values():
+        for target in targets:
+            pending[target] += 1
+
+    if max_workers <= 1 or len(tasks) == 1:
+        ready = [index for index, count in pending.items() if count == 0]
+        while ready:
+            index = ready.pop()
+            _run_action(tasks[index])
+            del pending[index]
+            for target in successors.get(index, ()):
+                pending[target] -= 1
+                if pending[target] == 0:
+                    ready.append(target)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cleanup") as pool:
+            running: dict[Future[None], int] = {}
+            for index, count in pending.items():
+                if count == 0:
+                    running[pool.submit(_run_action, tasks[index])] = index
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    del pending[index]
+                    for target in successors.get(index, ()):
+                        pending[target] -= 1
+                        if pending[target] == 0:
+                            running[pool.submit(_run_action, tasks[target])] = target
+
+    if pending:
+        # Dependency cycle: fall back to reverse registration order
+        logger.warning(f"Cleanup dependency cycle between: {[tasks[i].key for i in pending]}")
+        for index in sorted(pending, reverse=True):
+            _run_action(tasks[index])
+
+
+class DeferredCleanupQueue:
+    """Background executor for cleanups deferred past teardown, drained at session end."""
+
+    def __init__(self, max_workers: int = 4) -> None:
+        """Initialize deferred cleanup queue.
+
+        Args:
+            max_workers: Maximum number of concurrent cleanups per batch.
+        """
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deferred-cleanup")
+
+    def submit(self, tasks: list[CleanupTask], successors: dict[int, set[int]]) -> None:
+        """Schedule batch of cleanups to run in background."""
+        self._executor.submit(run_cleanup_graph, tasks, successors, self._max_workers)
+
+    def drain(self) -> None:
+        """Wait until all scheduled cleanups finished."""
+        self._executor.shutdown(wait=True)
 
 
 class TestDataManager:
-    """Manage cleanup actions for test data."""
+    """Manage cleanup actions for test data.
+
+    Cleanups tagged with a resource key and dependencies run concurrently on a
+    bounded pool: a resource is cleaned up before the resources it depends on.
+    Untagged cleanups keep LIFO order relative to everything registered before them.
+    With a deferred queue, cleanups run in background instead of during teardown.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        deferred: DeferredCleanupQueue | None = None,
+        journal: ResourceJournal | None = None,
+    ) -> None:
+        """Initialize test data manager.
+
+        Args:
+            max_workers: Maximum number of concurrent cleanups (1 runs them inline).
+            deferred: Queue running cleanups in background. Their actions must not use
+                resources released with the test (e.g. function-scoped clients).
+            journal: Journal recording tracked resources, so they can be swept after a crash.
+        """
+        self._tasks: list[CleanupTask] = []
+        self._max_workers = max_workers
+        self._deferred = deferred
+        self._journal = journal
+
+    def register_cleanup(
+        self,
+        action: Callable[[], None],
+        key: str | None = None,
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        """Register cleanup action.
+
+        Args:
+            action: Cleanup callable.
+            key: Resource key. Untagged cleanups run in LIFO order.
+            depends_on: Keys of resources this resource depends on; they are cleaned up after it.
+        """
+        self._tasks.append(CleanupTask(action, key, tuple(depends_on)))
+
+    def track_resource(
+        self,
+        kind: str,
+        resource_id: str,
+        cleanup: Callable[[], None],
+        data: dict[str, Any] | None = None,
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        """Journal created resource and register its cleanup.
+
+        The resource is marked deleted in the journal once cleanup succeeds.
 
-    def __init__(self) -> None:
-        self._cleanup_stack: list[Callable[[], None]] = []
+        Args:
+            kind: Resource kind (e.g. ``account``).
+            resource_id: Resource identifier, also used as cleanup key.
+            cleanup: Callable deleting resource.
+            data: Data needed to delete resource from another process (e.g. token).
+            depends_on: Keys of resources this resource depends on.
+        """
+        journal = self._journal
+        if journal is None:
+            self.register_cleanup(cleanup, resource_id, depends_on)
+            return
 
-    def register_cleanup(self, action: Callable[[], None]) -> None:
-        """Register cleanup action (LIFO)."""
-        self._cleanup_stack.append(action)
+        journal.record_created(kind, resource_id, data)
+
+        def _cleanup() -> None:
+            cleanup()
+            journal.record_deleted(kind, resource_id)
+
+        self.register_cleanup(_cleanup, resource_id, depends_on)
 
     def cleanup_all(self) -> None:
-        """Execute all cleanup actions in reverse order."""
-        while self._cleanup_stack:
-            action = self._cleanup_stack.pop()
-            try:
-                action()
-            except Exception as exc:
-                logger.warning(f"Cleanup failed: {exc}")
+        """Execute all cleanup actions respecting dependencies."""
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
+        successors = self._build_successors(tasks)
+        if self._deferred is not None:
+            self._deferred.submit(tasks, successors)
+        else:
+            run_cleanup_graph(tasks, successors, self._max_workers)
+
+    @staticmethod
+    def _build_successors(tasks: list[CleanupTask]) -> dict[int, set[int]]:
+        """Build edges: successors[a] holds tasks that may start only after task a."""
+        by_key: dict[str, list[int]] = {}
+        for index, task in enumerate(tasks):
+            if task.key is not None:
+                by_key.setdefault(task.key, []).append(index)
+
+        successors: dict[int, set[int]] = {index: set() for index in range(len(tasks))}
+        for index, task in enumerate(tasks):
+            if task.key is None:
+                # Untagged: everything registered earlier is cleaned up after it (LIFO)
+                successors[index].update(range(index))
+            for dependency in task.depends_on:
+                successors[index].update(by_key.get(dependency, ()))
+        return successors
+
+
+async def _run_async_action(task: CleanupTask, limit: asyncio.Semaphore) -> None:
+    async with limit:
+        try:
+            await task.action()
+        except Exception as exc:
+            logger.warning(f"Cleanup failed ({task.key or 'untagged'}): {exc}")
+
+
+async def run_async_cleanup_graph(
+    tasks: list[CleanupTask], successors: dict[int, set[int]], max_workers: int
+) -> None:
+    """Await async cleanup tasks concurrently respecting ordering edges.
+
+    Args:
+        tasks: Cleanup tasks whose actions return awaitables.
+        successors: Task index -> indexes of tasks that may start only after it.
+        max_workers: Maximum number of cleanups in flight.
+    """
+    pending = dict.fromkeys(range(len(tasks)), 0)
+    for targets in successors.values():
+        for target in targets:
+            pending[target] += 1
+
+    limit = asyncio.Semaphore(max(max_workers, 1))
+    running: dict[asyncio.Task[None], int] = {}
+    for index, count in pending.items():
+        if count == 0:
+            running[asyncio.create_task(_run_async_action(tasks[index], limit))] = index
+    while running:
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            index = running.pop(future)
+            del pending[index]
+            for target in successors.get(index, ()):
+                pending[target] -= 1
+                if pending[target] == 0:
+                    running[asyncio.create_task(_run_async_action(tasks[target], limit))] = target
+
+    if pending:
+        logger.warning(f"Cleanup dependency cycle between: {[tasks[i].key for i in pending]}")
+        for index in sorted(pending, reverse=True):
+            await _run_async_action(tasks[index], limit)
+
+
+class AsyncTestDataManager:
+    """Manage async cleanup actions for test data of async tests.
+
+    Same ordering rules as ``TestDataManager``; cleanups are coroutines awaited
+    concurrently on the running event loop, so there is no deferred queue.
+    """
+
+    def __init__(self, max_workers: int = 1, journal: ResourceJournal | None = None) -> None:
+        """Initialize async test data manager.
+
+        Args:
+            max_workers: Maximum number of cleanups in flight.
+            journal: Journal recording tracked resources, so they can be swept after a crash.
+        """
+        self._tasks: list[CleanupTask] = []
+        self._max_workers = max_workers
+        self._journal = journal
+
+    def register_cleanup(
+        self,
+        action: Callable[[], Awaitable[None]],
+        key: str | None = None,
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        """Register async cleanup action.
+
+        Args:
+            action: Coroutine function performing cleanup.
+            key: Resource key. Untagged cleanups run in LIFO order.
+            depends_on: Keys of resources this resource depends on; they are cleaned up after it.
+        """
+        self._tasks.append(CleanupTask(action, key, tuple(depends_on)))
+
+    def track_resource(
+        self,
+        kind: str,
+        resource_id: str,
+        cleanup: Callable[[], Awaitable[None]],
+        data: dict[str, Any] | None = None,
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        """Journal created resource and register its async cleanup.
+
+        Args:
+            kind: Resource kind (e.g. ``account``).
+            resource_id: Resource identifier, also used as cleanup key.
+            cleanup: Coroutine function deleting resource.
+            data: Data needed to delete resource from another process (e.g. token).
+            depends_on: Keys of resources this resource depends on.
+        """
+        journal = self._journal
+        if journal is None:
+            self.register_cleanup(cleanup, resource_id, depends_on)
+            return
+
+        journal.record_created(kind, resource_id, data)
+
+        async def _cleanup() -> None:
+            await cleanup()
+            journal.record_deleted(kind, resource_id)
+
+        self.register_cleanup(_cleanup, resource_id, depends_on)
+
+    async def cleanup_all(self) -> None:
+        """Await all cleanup actions respecting dependencies."""
+        tasks, self._tasks = self._tasks, []
+        if tasks:
+            successors = TestDataManager._build_successors(tasks)
+            await run_async_cleanup_graph(tasks, successors, self._max_workers)
@@ -0,0 +1,165 @@
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from src.utils.logger import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: shared tier is disabled
+    fcntl = None  # type: ignore[assignment]
+
+# Shared token file holds live tokens: keep the directory out of VCS
+TOKEN_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / ".tokens"
+
+
+def jwt_expiry(token: str) -> float | None:
+    """Read ``exp`` claim from JWT without verifying signature.
+
+    Args:
+        token: JWT string.
+
+    Returns:
+        Expiry as UNIX timestamp, or None if token has no readable ``exp``.
+    """
+    try:
+        segment = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except (IndexError, ValueError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, int | float) else None
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    token: str
+    expires_at: float
+
+
+class TokenCache:
+    """Token cache keyed by credentials, refreshed shortly before JWT expiry.
+
+    The in-memory tier is shared by all helpers of one process. The optional
+    file tier is shared by xdist workers on one machine: the first worker logs
+    in under an exclusive file lock, the others reuse its token.
+    """
+
+    def __init__(
+        self,
+        refresh_margin: float = 60,
+        default_ttl: float = 300,
+        shared_dir: Path | None = None,
+    ) -> None:
+        """Initialize token cache.
+
+        Args:
+            refresh_margin: Seconds before expiry when token is refreshed.
+            default_ttl: Lifetime assumed for tokens without ``exp`` claim.
+            shared_dir: Directory for cross-process token file. None disables it.
+        """
+        self._refresh_margin = refresh_margin
+        self._default_ttl = default_ttl
+        self._shared_path = shared_dir / "tokens.json" if shared_dir and fcntl else None
+        self._memory: dict[str, CachedToken] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    @staticmethod
+    def key(base_url: str, email: str, password: str) -> str:
+        """Build cache key without keeping raw password."""
+        return hashlib.sha256(f"{base_url}\0{email}\0{password}".encode()).hexdigest()
+
+    def get(self, key: str, login: Callable[[], str]) -> str:
+        """Return valid cached token or obtain a new one via ``login``.
+
+        Args:
+            key: Cache key (see ``TokenCache.key``).
+            login: Performs real login and returns token.
+
+        Returns:
+            Token valid for at least ``refresh_margin`` seconds.
+        """
+        with self._lock_for(key):
+            cached = self._memory.get(key)
+            if cached is None or not self._is_fresh(cached):
+                if self._shared_path is not None:
+                    cached = self._get_shared(key, login)
+                else:
+                    cached = self._login(login)
+                self._memory[key] = cached
+            return cached.token
+
+    def invalidate(self, key: str) -> None:
+        """Drop cached token from all tiers (e.g. after it was rejected)."""
+        with self._lock_for(key):
+            self._memory.pop(key, None)
+        if self._shared_path is not None:
+            with self._shared_lock():
+                tokens = self._read_shared()
+                if tokens.pop(key, None) is not None:
+                    self._write_shared(tokens)
+
+    def clear_shared(self) -> None:
+        """Remove shared token file, so live tokens do not outlive the test run."""
+        if self._shared_path is not None and self._shared_path.exists():
+            with self._shared_lock():
+                self._shared_path.unlink(missing_ok=True)
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _is_fresh(self, cached: CachedToken) -> bool:
+        return cached.expires_at - time.time() > self._refresh_margin
+
+    def _login(self, login: Callable[[], str]) -> CachedToken:
+        token = login()
+        expires_at = jwt_expiry(token) or time.time() + self._default_ttl
+        return CachedToken(token=token, expires_at=expires_at)
+
+    def _get_shared(self, key: str, login: Callable[[], str]) -> CachedToken:
+        with self._shared_lock():
+            tokens = self._read_shared()
+            cached = tokens.get(key)
+            if cached is not None and self._is_fresh(cached):
+                return cached
+            cached = self._login(login)
+            tokens[key] = cached
+            self._write_shared(tokens)
+            return cached
+
+    @contextlib.contextmanager
+    def _shared_lock(self) -> Iterator[None]:
+        assert self._shared_path is not None
+        self._shared_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._shared_path.with_suffix(".lock").open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_shared(self) -> dict[str, CachedToken]:
+        assert self._shared_path is not None
+        try:
+            data = json.loads(self._shared_path.read_text(encoding="utf-8"))
+            return {key: CachedToken(**raw) for key, raw in data.items()}
+        except (FileNotFoundError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def _write_shared(self, tokens: dict[str, CachedToken]) -> None:
+        assert self._shared_path is not None
+        now = time.time()
+        live = {key: asdict(cached) for key, cached in tokens.items() if cached.expires_at > now}
+        temp_path = self._shared_path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(live), encoding="utf-8")
+        os.replace(temp_path, self._shared_path)
+        logger.debug(f"Shared token cache updated ({len(live)} tokens)")
@@ -0,0 +1,135 @@
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from src.api.sdk import ApiContext
+from src.utils.logger import logger
+from src.utils.resource_journal import ResourceJournal
+from testdata.factories.auth_user_factory import AuthUserData
+
+
+@dataclass(frozen=True)
+class RegisteredUser:
+    user: AuthUserData
+    token: str
+
+
+ResetHook = Callable[[RegisteredUser], None]
+
+
+class UserPool:
+    """Pool of registered users reused by tests of one session (xdist worker).
+
+    Users are registered on demand and deleted in bulk by ``close()``.
+    """
+
+    def __init__(
+        self,
+        api_context: ApiContext,
+        user_factory: Callable[[], AuthUserData],
+        max_size: int = 4,
+        max_workers: int = 8,
+        journal: ResourceJournal | None = None,
+    ) -> None:
+        """Initialize user pool.
+
+        Args:
+            api_context: API context used to register and delete users.
+            user_factory: Builds data for a new user.
+            max_size: Maximum number of idle users kept in pool.
+            max_workers: Thread count for bulk registration and deletion.
+            journal: Journal recording pooled accounts for crash recovery.
+        """
+        self._context = api_context
+        self._user_factory = user_factory
+        self._max_size = max_size
+        self._max_workers = max_workers
+        self._idle: list[RegisteredUser] = []
+        self._owned: list[RegisteredUser] = []
+        self._reset_hooks: list[ResetHook] = []
+        self._lock = threading.Lock()
+        self._journal = journal
+
+    def add_reset_hook(self, hook: ResetHook) -> None:
+        """Register hook restoring user state on checkin.
+
+        A failing hook discards the user instead of returning it to pool.
+        """
+        self._reset_hooks.append(hook)
+
+    def prefill(self, count: int) -> None:
+        """Register users concurrently until pool holds ``count`` idle users."""
+        with self._lock:
+            missing = min(count, self._max_size) - len(self._idle)
+        if missing <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=min(missing, self._max_workers)) as executor:
+            users = list(executor.map(lambda _: self._register(), range(missing)))
+        with self._lock:
+            self._idle.extend(users)
+
+    def checkout(self) -> RegisteredUser:
+        """Take idle user from pool or register a new one."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._register()
+
+    def checkin(self, registered: RegisteredUser, discard: bool = False) -> None:
+        """Return user to pool after running reset hooks.
+
+        Args:
+            registered: User taken with ``checkout()``.
+            discard: Delete user instead of reusing it (e.g. state was changed).
+        """
+        if not discard:
+            try:
+                for hook in self._reset_hooks:
+                    hook(registered)
+            except Exception as exc:
+                logger.warning(f"User reset failed, discarding: {exc}")
+                discard = True
+        with self._lock:
+            if not discard and len(self._idle) < self._max_size:
+                self._idle.append(registered)
+                return
+            self._owned.remove(registered)
+        self._delete(registered)
+
+    def close(self) -> None:
+        """Delete all users registered by pool."""
+        with self._lock:
+            users, self._owned, self._idle = self._owned, [], []
+        if not users:
+            return
+        logger.info(f"Deleting {len(users)} pooled users")
+        with ThreadPoolExecutor(max_workers=min(len(users), self._max_workers)) as executor:
+            list(executor.map(self._delete, users))
+
+    def _register(self) -> RegisteredUser:
+        user = self._user_factory()
+        token = self._context.services.auth.register(
+            email=user.email,
+            password=user.password,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            date_of_birth=user.date_of_birth,
+        )
+        registered = RegisteredUser(user=user, token=token)
+        if self._journal:
+            self._journal.record_created(
+                "account", user.email, {"token": token, "password": user.password}
+            )
+        with self._lock:
+            self._owned.append(registered)
+        return registered
+
+    def _delete(self, registered: RegisteredUser) -> None:
+        try:
+            self._context.services.account.delete_current(token=registered.token)
+        except Exception as exc:
+            logger.warning(f"Failed to delete pooled user {registered.user.email}: {exc}")
+            return
+        if self._journal:
+            self._journal.record_deleted("account", registered.user.email)
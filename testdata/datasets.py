@@ -0,0 +1,128 @@
+"""Lazy data-driven parametrization from large JSONL/CSV files."""
+
+import csv
+import json
+import mmap
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+DATASET_DIR = Path(__file__).resolve().parent / "datasets"
+
+_CR = ord("\r")
+_WHITESPACE = b" \t\r"
+
+
+class DatasetIndex:
+    """Byte offsets of records in a JSONL or CSV file (one record per line).
+
+    Building the index scans the file once without parsing it; records are
+    parsed on access. The file is memory-mapped, so workers that read only
+    their shard touch only those pages.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Index dataset file.
+
+        Args:
+            path: ``.jsonl`` or ``.csv`` file. CSV header names the fields.
+        """
+        if path.suffix not in (".jsonl", ".csv"):
+            raise ValueError(f"Unsupported dataset format: {path}")
+        self.path = path
+        self._file: IO[bytes] | None = None
+        self._data: mmap.mmap | bytes = b""
+        self._starts = array("q")
+        self._ends = array("q")
+        self._header: list[str] = []
+        self._scan()
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _load(path: Path, mtime_ns: int) -> "DatasetIndex":
+        return DatasetIndex(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "DatasetIndex":
+        """Get index of dataset file, cached until the file changes."""
+        return cls._load(path, path.stat().st_mtime_ns)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, position: int) -> dict[str, Any]:
+        """Parse record at position."""
+        line = self._data[self._starts[position] : self._ends[position]].decode("utf-8")
+        if self._header:
+            return dict(zip(self._header, next(csv.reader([line])), strict=False))
+        record: dict[str, Any] = json.loads(line)
+        return record
+
+    def _scan(self) -> None:
+        if self.path.stat().st_size:
+            self._file = self.path.open("rb")
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self._data
+        size = len(data)
+        start = 0
+        while start < size:
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = size
+            # Strip CR of Windows line endings, skip blank lines
+            stop = end - 1 if end > start and data[end - 1] == _CR else end
+            if stop > start and (data[start] not in _WHITESPACE or data[start:stop].strip()):
+                self._starts.append(start)
+                self._ends.append(stop)
+            start = end + 1
+        if self.path.suffix == ".csv" and self._starts:
+            header = self._data[self._starts[0] : self._ends[0]].decode("utf-8-sig")
+            self._header = next(csv.reader([header]))
+            del self._starts[0], self._ends[0]
+
+
+class DatasetRecord:
+    """Reference to one dataset record, parsed only when loaded."""
+
+    __slots__ = ("_index", "_position")
+
+    def __init__(self, index: DatasetIndex, position: int) -> None:
+        self._index = index
+        self._position = position
+
+    def load(self) -> dict[str, Any]:
+        """Parse record."""
+        return self._index[self._position]
+
+    def __repr__(self) -> str:
+        return f"{self._index.path.name}[{self._position}]"
+
+
+def dataset_params(path: Path | str, argname: str = "data_record") -> pytest.MarkDecorator:
+    """Parametrize test with every record of a JSONL/CSV dataset.
+
+    Collection only indexes the file and creates ids like ``logins-17``;
+    the ``data_record`` fixture parses the record when the test runs, so
+    each xdist worker reads only records of its own tests::
+
+        @dataset_params("logins.jsonl")
+        def test_login(data_record): ...
+
+    Args:
+        path: Dataset file, relative to ``testdata/datasets`` or absolute.
+        argname: Indirect fixture receiving the record.
+
+    Returns:
+        Parametrize marker.
+    """
+    index = DatasetIndex.load(DATASET_DIR / path)
+    stem = index.path.stem
+    return pytest.mark.parametrize(
+        argname,
+        [DatasetRecord(index, position) for position in range(len(index))],
+        ids=[f"{stem}-{position}" for position in range(len(index))],
+        indirect=True,
+    )
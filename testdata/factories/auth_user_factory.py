@@ -1,10 +1,7 @@
 from dataclasses import dataclass
 
-from faker import Faker
-
 from config.settings import Settings
-
-fake = Faker()
+from testdata.factories.data_pool import get_data_pool
 
 
 @dataclass(frozen=True)
@@ -21,15 +18,33 @@ class AuthUserFactory:
 
     @staticmethod
     def build(settings: Settings) -> AuthUserData:
-        email = settings.test_user_email or fake.email(domain="example.com")
+        return AuthUserFactory.build_batch(settings, 1)[0]
+
+    @staticmethod
+    def build_batch(settings: Settings, n: int) -> list[AuthUserData]:
+        """Build auth users in bulk; settings values override generated ones.
+
+        Emails are unique across xdist workers of the run.
+
+        Args:
+            settings: Settings with test user overrides.
+            n: Number of users.
+
+        Returns:
+            Auth user data.
+        """
+        pool = get_data_pool()
+        names = pool.names(n)
+        emails = [settings.test_user_email] * n if settings.test_user_email else pool.emails(names)
         password = settings.test_user_password.get_secret_value() or "Password123"
-        first_name = settings.test_user_first_name or fake.first_name()
-        last_name = settings.test_user_last_name or fake.last_name()
         date_of_birth = settings.test_user_date_of_birth or "01.08.2001"
-        return AuthUserData(
-            email=email,
-            password=password,
-            first_name=first_name,
-            last_name=last_name,
-            date_of_birth=date_of_birth,
-        )
+        return [
+            AuthUserData(
+                email=email,
+                password=password,
+                first_name=settings.test_user_first_name or first,
+                last_name=settings.test_user_last_name or last,
+                date_of_birth=date_of_birth,
+            )
+            for (first, last), email in zip(names, emails, strict=True)
+        ]
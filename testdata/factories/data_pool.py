@@ -0,0 +1,134 @@
+import os
+import random
+import re
+import string
+import uuid
+from itertools import count
+
+from faker import Faker
+
+from src.utils.logger import logger
+
+fake = Faker()
+
+NAME_TABLE_SIZE = 512
+PASSWORD_LENGTH = 12
+
+_SLUG_RE = re.compile(r"[^a-z]+")
+_PASSWORD_CHARS = string.ascii_letters + string.digits
+
+
+def worker_index(worker_id: str | None = None) -> int:
+    """Number of xdist worker (``gw3`` -> 3), 0 without xdist."""
+    worker_id = worker_id or os.environ.get("PYTEST_XDIST_WORKER", "")
+    digits = worker_id.removeprefix("gw")
+    return int(digits) if digits.isdigit() else 0
+
+
+def _run_id() -> str:
+    # Same for all workers of one xdist run, so no coordination is needed
+    run_uid = os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+    return run_uid[:6]
+
+
+class DataPool:
+    """Pooled name tables and counters for bulk test data generation.
+
+    Faker fills the name tables once; records are then assembled with plain
+    ``random.Random`` picks. Values are deterministic for a seed. Emails are
+    unique across the run without coordination: each carries the run id,
+    the worker number and a per-process counter.
+    """
+
+    def __init__(self, seed: int, worker: int = 0, run_id: str | None = None) -> None:
+        """Initialize data pool.
+
+        Args:
+            seed: Seed of name tables and picks.
+            worker: xdist worker number, part of every email.
+            run_id: Test run id shared by workers (random if not given).
+        """
+        self.seed = seed
+        self._rng = random.Random(seed)
+        faker = Faker()
+        faker.seed_instance(seed)
+        self._first_names = [faker.first_name() for _ in range(NAME_TABLE_SIZE)]
+        self._last_names = [faker.last_name() for _ in range(NAME_TABLE_SIZE)]
+        self._namespace = f"{run_id or _run_id()}w{worker}"
+        self._counter = count(1)
+
+    def names(self, n: int) -> list[tuple[str, str]]:
+        """Pick ``n`` first and last name pairs."""
+        return list(
+            zip(
+                self._rng.choices(self._first_names, k=n),
+                self._rng.choices(self._last_names, k=n),
+                strict=True,
+            )
+        )
+
+    def emails(self, names: list[tuple[str, str]], domain: str = "example.com") -> list[str]:
+        """Build unique emails for name pairs.
+
+        Args:
+            names: First and last name pairs.
+            domain: Email domain.
+
+        Returns:
+            Email per name pair.
+        """
+        return [
+            f"{_SLUG_RE.sub('', first.lower())}.{_SLUG_RE.sub('', last.lower())}"
+            f".{self._namespace}.{next(self._counter)}@{domain}"
+            for first, last in names
+        ]
+
+    def passwords(self, n: int) -> list[str]:
+        """Generate ``n`` passwords with upper case, lower case, digit and special char."""
+        body_length = PASSWORD_LENGTH - 4
+        chars = self._rng.choices(_PASSWORD_CHARS, k=n * body_length)
+        return [
+            "".join(chars[i * body_length : (i + 1) * body_length])
+            + self._rng.choice(string.ascii_uppercase)
+            + self._rng.choice(string.ascii_lowercase)
+            + self._rng.choice(string.digits)
+            + self._rng.choice("!@#$%^&*")
+            for i in range(n)
+        ]
+
+
+_data_pool: DataPool | None = None
+
+
+def random_seed() -> int:
+    """Draw a fresh base seed (logged by ``seed_data_pool`` to reproduce the run)."""
+    return random.SystemRandom().randrange(2**32)
+
+
+def seed_data_pool(seed: int | None = None) -> DataPool:
+    """Create data pool of this process, seeded per xdist worker.
+
+    Worker N uses ``seed + N``, so every worker generates its own
+    reproducible sequence. The module Faker instance is seeded the same way.
+    Under pytest the base seed is drawn once on the controller and handed
+    to workers with the settings snapshot.
+
+    Args:
+        seed: Base seed (random if not given); logged to reproduce a run.
+
+    Returns:
+        Data pool used by factories.
+    """
+    global _data_pool
+    if seed is None:
+        seed = random_seed()
+    worker = worker_index()
+    logger.info(f"Test data seed: {seed} (worker {worker})")
+    fake.seed_instance(seed + worker)
+    _data_pool = DataPool(seed + worker, worker=worker)
+    return _data_pool
+
+
+def get_data_pool() -> DataPool:
+    """Get data pool of this process, seeding it randomly on first use."""
+    return _data_pool or seed_data_pool()
@@ -1,8 +1,5 @@
-from faker import Faker
-
 from src.api.models.users import UserCreate, UserResponse, UserUpdate
-
-fake = Faker()
+from testdata.factories.data_pool import fake, get_data_pool
 
 
 class UserFactory:
@@ -10,7 +7,7 @@ class UserFactory:
 
     @staticmethod
     def build_email(domain: str = "test.com") -> str:
-        """Generate random email.
+        """Generate random email, unique across xdist workers of the run.
 
         Args:
             domain: Email domain.
@@ -18,7 +15,8 @@ class UserFactory:
         Returns:
             Random email address.
         """
-        return str(fake.email(domain=domain))
+        pool = get_data_pool()
+        return pool.emails(pool.names(1), domain)[0]
 
     @staticmethod
     def build_password(length: int = 12) -> str:
@@ -50,13 +48,41 @@ class UserFactory:
         Returns:
             User creation model.
         """
+        user = UserFactory.build_batch(1)[0]
         return UserCreate(
-            email=email or fake.email(),
-            first_name=first_name or fake.first_name(),
-            last_name=last_name or fake.last_name(),
-            password=password or fake.password(length=12),
+            email=email or user.email,
+            first_name=first_name or user.first_name,
+            last_name=last_name or user.last_name,
+            password=password or user.password,
         )
 
+    @staticmethod
+    def build_batch(
+        n: int, domain: str = "example.com", validate: bool = False
+    ) -> list[UserCreate]:
+        """Build user creation data in bulk from pooled names.
+
+        Emails are unique across xdist workers of the run.
+
+        Args:
+            n: Number of users.
+            domain: Email domain.
+            validate: Validate models; generated data is trusted and built
+                with ``model_construct`` by default.
+
+        Returns:
+            User creation models.
+        """
+        pool = get_data_pool()
+        names = pool.names(n)
+        build = UserCreate if validate else UserCreate.model_construct
+        return [
+            build(email=email, first_name=first, last_name=last, password=password)
+            for (first, last), email, password in zip(
+                names, pool.emails(names, domain), pool.passwords(n), strict=True
+            )
+        ]
+
     @staticmethod
     def build_update(
         first_name: str | None = None,
@@ -121,9 +147,11 @@ class UserFactory:
         Returns:
             Admin user creation model.
         """
+        pool = get_data_pool()
+        ((_, last_name),) = pool.names(1)
         return UserCreate(
-            email=email or f"admin_{fake.user_name()}@test.com",
+            email=email or pool.emails([("admin", last_name)], "test.com")[0],
             first_name="Admin",
-            last_name=fake.last_name(),
+            last_name=last_name,
             password=password or fake.password(length=16),
         )
@@ -1,24 +1,19 @@
 import contextlib
 from collections.abc import Generator
-from dataclasses import dataclass
 
 import pytest
 
 from config.settings import Settings
+from src.api.aio.sdk import AsyncApiContext
 from src.api.client import APIClient
-from src.api.contracts.registry import build_default_registry
 from src.api.endpoints.auth import AuthAPI
 from src.api.endpoints.users import UsersAPI
 from src.api.models.users import UserCreate, UserResponse
 from src.api.sdk import ApiContext
-from src.utils.test_data_manager import TestDataManager
-from testdata.factories.auth_user_factory import AuthUserData, AuthUserFactory
-
-
-@dataclass(frozen=True)
-class RegisteredUser:
-    user: AuthUserData
-    token: str
+from src.utils.resource_journal import ResourceJournal
+from src.utils.test_data_manager import AsyncTestDataManager, TestDataManager
+from src.utils.user_pool import RegisteredUser, UserPool
+from testdata.factories.auth_user_factory import AuthUserFactory
 
 
 @pytest.fixture
@@ -84,17 +79,62 @@ def registered_user(
         date_of_birth=user.date_of_birth,
     )
     registered = RegisteredUser(user=user, token=token)
+    test_data_manager.track_resource(
+        "account",
+        user.email,
+        lambda: api_context.services.account.delete_current(token=token),
+        data={"token": token, "password": user.password},
+    )
+    return registered
 
-    def _cleanup() -> None:
-        cleanup_client = APIClient(settings=settings)
-        try:
-            cleanup_client.set_token(token)
-            contracts = build_default_registry(settings)
-            from src.api.services.account_service import AccountService
 
-            AccountService(cleanup_client, contracts).delete_current()
-        finally:
-            cleanup_client.close()
+@pytest.fixture
+async def async_registered_user(
+    settings: Settings,
+    async_api_context: AsyncApiContext,
+    async_test_data_manager: AsyncTestDataManager,
+) -> RegisteredUser:
+    """Register a user from async tests and cleanup after test."""
+    user = AuthUserFactory.build(settings)
+    token = await async_api_context.services.auth.register(
+        email=user.email,
+        password=user.password,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        date_of_birth=user.date_of_birth,
+    )
+    async_test_data_manager.track_resource(
+        "account",
+        user.email,
+        lambda: async_api_context.services.account.delete_current(token=token),
+        data={"token": token, "password": user.password},
+    )
+    return RegisteredUser(user=user, token=token)
 
-    test_data_manager.register_cleanup(_cleanup)
-    return registered
+
+@pytest.fixture(scope="session")
+def user_pool(
+    settings: Settings, resource_journal: ResourceJournal
+) -> Generator[UserPool, None, None]:
+    """Pool of registered users for this session (one per xdist worker).
+
+    Users are deleted in bulk when the session ends.
+    """
+    context = ApiContext(settings)
+    pool = UserPool(
+        context,
+        user_factory=lambda: AuthUserFactory.build(settings),
+        max_size=settings.user_pool_size,
+        journal=resource_journal,
+    )
+    yield pool
+    pool.close()
+    context.close()
+
+
+@pytest.fixture
+def pooled_user(user_pool: UserPool) -> Generator[RegisteredUser, None, None]:
+    """Registered user taken from pool; use when any valid user will do."""
+    registered = user_pool.checkout()
+    yield registered
+    user_pool.checkin(registered)
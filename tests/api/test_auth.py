@@ -1,7 +1,11 @@
+import asyncio
+
 import allure
 import pytest
 
+from src.api.aio.sdk import AsyncApiContext
 from src.api.sdk import ApiContext
+from src.utils.user_pool import RegisteredUser
 
 
 @allure.epic("API")
@@ -24,8 +28,23 @@ class TestDemoAPI:
     def test_secured_health_with_token(
         self,
         api_context: ApiContext,
-        registered_user,
+        pooled_user,
     ) -> None:
-        """Register, login, and access secured endpoint."""
-        body = api_context.services.health.secured_health(registered_user.token)
+        """Access secured endpoint with a registered user's token."""
+        body = api_context.services.health.secured_health(pooled_user.token)
         assert body != ""
+
+    @allure.story("Secured")
+    @allure.title("Secured health checks run concurrently from an async test")
+    async def test_secured_health_async(
+        self,
+        async_api_context: AsyncApiContext,
+        async_registered_user: RegisteredUser,
+    ) -> None:
+        """Await several secured health checks at once with a fresh user's token."""
+        health = async_api_context.services.health
+        bodies = await asyncio.gather(
+            health.public_health(),
+            *(health.secured_health(async_registered_user.token) for _ in range(3)),
+        )
+        assert all(bodies)
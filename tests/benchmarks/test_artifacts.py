@@ -0,0 +1,69 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import allure
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Run under Allure: attachments written by the background thread must reach the results
+ATTACH_PROBE = """
+from pathlib import Path
+
+import allure
+
+from src.utils import artifacts
+from src.utils.artifacts import ArtifactWriter
+
+
+def test_attach(tmp_path: Path) -> None:
+    assert artifacts._allure_targets() is not None, "Allure reporter internals not found"
+    writer = ArtifactWriter()
+    writer.attach_bytes(b"in memory", "from_bytes", allure.attachment_type.TEXT)
+    source = tmp_path / "trace.txt"
+    source.write_bytes(b"on disk")
+    writer.attach_file(source, "from_file", allure.attachment_type.TEXT)
+    writer.close()
+    assert not source.exists()
+"""
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestArtifacts:
+    """Background artifact writes on the pinned allure-pytest."""
+
+    @allure.title("Background writer attaches to the running Allure test")
+    def test_background_attachments(self, tmp_path: Path) -> None:
+        (tmp_path / "test_attach_probe.py").write_text(ATTACH_PROBE)
+        results_dir = tmp_path / "allure-results"
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                str(tmp_path / "test_attach_probe.py"),
+                f"--alluredir={results_dir}",
+                "-p",
+                "no:cacheprovider",
+                "-o",
+                "addopts=",
+            ],
+            cwd=ROOT_DIR,
+            env={**os.environ, "PYTHONPATH": str(ROOT_DIR)},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+
+        (result_file,) = results_dir.glob("*-result.json")
+        attachments = {
+            attachment["name"]: (results_dir / attachment["source"]).read_bytes()
+            for attachment in json.loads(result_file.read_text())["attachments"]
+        }
+        assert attachments == {"from_bytes": b"in memory", "from_file": b"on disk"}
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+import allure
+import httpx
+import pytest
+
+from config.settings import Settings
+from src.api.aio.sdk import AsyncApiContext
+from src.utils.test_data_manager import AsyncTestDataManager
+
+REQUESTS = 20
+LATENCY_S = 0.05
+
+
+async def _slow_health(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(LATENCY_S)
+    return httpx.Response(200, text="OK")
+
+
+@pytest.fixture(scope="session")
+async def mock_api() -> AsyncGenerator[tuple[AsyncApiContext, asyncio.AbstractEventLoop], None]:
+    """Session-scoped async context on a mock transport, with the loop it was created on."""
+    context = AsyncApiContext(Settings(), transport=httpx.MockTransport(_slow_health))
+    yield context, asyncio.get_running_loop()
+    await context.aclose()
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestAsyncApi:
+    """Async tests and fixtures on the shared event loop."""
+
+    @pytest.fixture
+    async def bound_marker(self) -> AsyncGenerator[str, None]:
+        """Class fixture: must run bound to the instance of the requesting test."""
+        self.marker = "set by fixture"
+        yield self.marker
+        assert self.marker == "set by fixture"
+
+    @allure.title("Concurrent async requests overlap their latency")
+    async def test_concurrent_requests(
+        self, mock_api: tuple[AsyncApiContext, asyncio.AbstractEventLoop]
+    ) -> None:
+        context, fixture_loop = mock_api
+        assert asyncio.get_running_loop() is fixture_loop
+
+        started = time.perf_counter()
+        bodies = await asyncio.gather(
+            *(context.services.health.public_health() for _ in range(REQUESTS))
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        results = {"requests": REQUESTS, "latency_ms": LATENCY_S * 1000, "elapsed_ms": elapsed_ms}
+        allure.attach(
+            json.dumps(results, indent=2),
+            name="async_api",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        assert bodies == ["OK"] * REQUESTS
+        assert elapsed_ms < REQUESTS * LATENCY_S * 1000 / 4, results
+
+    @allure.title("Async cleanups run concurrently in dependency order")
+    async def test_async_cleanup_order(
+        self, mock_api: tuple[AsyncApiContext, asyncio.AbstractEventLoop]
+    ) -> None:
+        _, fixture_loop = mock_api
+        assert asyncio.get_running_loop() is fixture_loop
+        order: list[str] = []
+
+        async def delete(key: str) -> None:
+            await asyncio.sleep(LATENCY_S)
+            order.append(key)
+
+        def deleter(key: str) -> Callable[[], Awaitable[None]]:
+            return lambda: delete(key)
+
+        manager = AsyncTestDataManager(max_workers=4)
+        manager.register_cleanup(deleter("course"), key="course")
+        for index in range(3):
+            key = f"enrollment-{index}"
+            manager.register_cleanup(deleter(key), key=key, depends_on=["course"])
+
+        started = time.perf_counter()
+        await manager.cleanup_all()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        assert order[-1] == "course"
+        assert len(order) == 4
+        assert elapsed_ms < 3 * LATENCY_S * 1000, elapsed_ms
+
+    @allure.title("Async fixture methods are bound to the test instance")
+    async def test_class_fixture_binding(self, bound_marker: str) -> None:
+        assert self.marker == bound_marker
@@ -0,0 +1,145 @@
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+import allure
+import pytest
+
+from src.utils.test_data_manager import (
+    AsyncTestDataManager,
+    DeferredCleanupQueue,
+    TestDataManager,
+)
+
+LATENCY_S = 0.05
+ENROLLMENTS = 4
+
+
+class CleanupLog:
+    """Thread-safe record of executed cleanups."""
+
+    def __init__(self) -> None:
+        self.order: list[str] = []
+        self._lock = threading.Lock()
+
+    def action(self, key: str, delay: float = 0.0, error: bool = False) -> Callable[[], None]:
+        def _cleanup() -> None:
+            time.sleep(delay)
+            with self._lock:
+                self.order.append(key)
+            if error:
+                raise RuntimeError(f"{key} cleanup failed")
+
+        return _cleanup
+
+
+def _register_course(manager: TestDataManager, log: CleanupLog, delay: float = 0.0) -> None:
+    """Course with enrollments depending on it: enrollments must be cleaned up first."""
+    manager.register_cleanup(log.action("course", delay), key="course")
+    for index in range(ENROLLMENTS):
+        key = f"enrollment-{index}"
+        manager.register_cleanup(log.action(key, delay), key=key, depends_on=["course"])
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestCleanup:
+    """Dependency-ordered, concurrent and deferred test data cleanup."""
+
+    @allure.title("Dependents are cleaned up concurrently before their dependency")
+    def test_dependency_order(self) -> None:
+        log = CleanupLog()
+        manager = TestDataManager(max_workers=ENROLLMENTS)
+        _register_course(manager, log, delay=LATENCY_S)
+
+        started = time.perf_counter()
+        manager.cleanup_all()
+        elapsed = time.perf_counter() - started
+
+        assert sorted(log.order[:-1]) == [f"enrollment-{i}" for i in range(ENROLLMENTS)]
+        assert log.order[-1] == "course"
+        # Enrollments overlap: two rounds of latency, not one per cleanup
+        assert elapsed < 3 * LATENCY_S, elapsed
+
+    @allure.title("Untagged cleanups run in LIFO order")
+    def test_untagged_lifo(self) -> None:
+        log = CleanupLog()
+        manager = TestDataManager(max_workers=4)
+        for key in ("first", "second", "third"):
+            manager.register_cleanup(log.action(key))
+
+        manager.cleanup_all()
+
+        assert log.order == ["third", "second", "first"]
+
+    @allure.title("Failed cleanup does not stop the others")
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_failure_isolated(self, max_workers: int) -> None:
+        log = CleanupLog()
+        manager = TestDataManager(max_workers=max_workers)
+        manager.register_cleanup(log.action("course"), key="course")
+        manager.register_cleanup(
+            log.action("enrollment", error=True), key="enrollment", depends_on=["course"]
+        )
+        manager.register_cleanup(log.action("report", error=True), key="report")
+
+        manager.cleanup_all()
+
+        assert sorted(log.order) == ["course", "enrollment", "report"]
+        assert log.order.index("enrollment") < log.order.index("course")
+
+    @allure.title("Dependency cycle falls back to reverse registration order")
+    def test_dependency_cycle(self) -> None:
+        log = CleanupLog()
+        manager = TestDataManager(max_workers=4)
+        manager.register_cleanup(log.action("a"), key="a", depends_on=["b"])
+        manager.register_cleanup(log.action("b"), key="b", depends_on=["a"])
+
+        manager.cleanup_all()
+
+        assert log.order == ["b", "a"]
+
+    @allure.title("Deferred cleanups run in background and finish on drain")
+    def test_deferred_queue(self) -> None:
+        log = CleanupLog()
+        release = threading.Event()
+        queue = DeferredCleanupQueue(max_workers=ENROLLMENTS)
+        manager = TestDataManager(deferred=queue)
+        _register_course(manager, log)
+
+        def blocked() -> None:
+            release.wait(timeout=5)
+
+        manager.register_cleanup(blocked, key="blocked", depends_on=["course"])
+
+        manager.cleanup_all()
+        # Teardown returned although the course still waits for the blocked cleanup
+        assert "course" not in log.order
+        release.set()
+        queue.drain()
+
+        assert len(log.order) == ENROLLMENTS + 1
+        assert log.order[-1] == "course"
+
+    @allure.title("Failed async cleanup does not stop its dependency")
+    async def test_async_failure_isolated(self) -> None:
+        order: list[str] = []
+
+        def action(key: str, error: bool = False) -> Callable[[], Awaitable[None]]:
+            async def _cleanup() -> None:
+                order.append(key)
+                if error:
+                    raise RuntimeError(f"{key} cleanup failed")
+
+            return _cleanup
+
+        manager = AsyncTestDataManager(max_workers=4)
+        manager.register_cleanup(action("course"), key="course")
+        manager.register_cleanup(
+            action("enrollment", error=True), key="enrollment", depends_on=["course"]
+        )
+
+        await manager.cleanup_all()
+
+        assert order == ["enrollment", "course"]
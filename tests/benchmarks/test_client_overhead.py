@@ -0,0 +1,60 @@
+import timeit
+from collections.abc import Callable, Generator
+
+import allure
+import httpx
+import pytest
+
+from config.settings import Settings
+from src.api.client import APIClient
+from src.api.middleware import ApiRequest, Middleware, build_chain
+
+ROUNDS = 5
+
+
+def _best_per_call(func: Callable[[], object], calls: int) -> float:
+    """Return best per-call time in microseconds."""
+    return min(timeit.repeat(func, number=calls, repeat=ROUNDS)) / calls * 1_000_000
+
+
+@pytest.fixture
+def mock_client() -> Generator[APIClient, None, None]:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"status": "ok"}))
+    client = APIClient(settings=Settings(), base_url="https://api.test", transport=transport)
+    yield client
+    client.close()
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestClientOverhead:
+    """Per-request overhead of the APIClient middleware chain."""
+
+    @allure.title("No-op middleware adds flat per-request overhead")
+    def test_noop_middleware_overhead(self) -> None:
+        response = httpx.Response(200)
+        request = ApiRequest("GET", "/health")
+
+        def terminal(_: ApiRequest) -> httpx.Response:
+            return response
+
+        bare = build_chain([], terminal)
+        layered = build_chain([Middleware() for _ in range(10)], terminal)
+
+        bare_us = _best_per_call(lambda: bare(request), calls=10000)
+        layered_us = _best_per_call(lambda: layered(request), calls=10000)
+        per_layer_us = (layered_us - bare_us) / 10
+
+        assert per_layer_us < 5, f"Middleware layer costs {per_layer_us:.2f} us"
+
+    @allure.title("Built-in chain overhead over raw httpx")
+    def test_builtin_chain_overhead(self, mock_client: APIClient) -> None:
+        raw = mock_client.client
+
+        raw_us = _best_per_call(lambda: raw.get("/health"), calls=200)
+        chain_us = _best_per_call(lambda: mock_client.get("/health"), calls=200)
+
+        assert chain_us - raw_us < 1000, (
+            f"Built-in chain adds {chain_us - raw_us:.1f} us per request (raw {raw_us:.1f} us)"
+        )
@@ -0,0 +1,75 @@
+import json
+import time
+
+import allure
+import pytest
+
+from src.api.models.users import UserCreate
+from testdata.factories.data_pool import DataPool, fake
+from testdata.factories.user_factory import UserFactory
+
+USERS = 5000
+
+
+def _faker_user() -> UserCreate:
+    """Per-object Faker build, as factories did before pooling."""
+    return UserCreate(
+        email=fake.email(),
+        first_name=fake.first_name(),
+        last_name=fake.last_name(),
+        password=fake.password(length=12),
+    )
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestDataFactories:
+    """Cost of generating test data in bulk."""
+
+    @allure.title("build_batch is faster than per-object Faker calls")
+    def test_batch_throughput(self) -> None:
+        started = time.perf_counter()
+        for _ in range(USERS):
+            _faker_user()
+        faker_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        users = UserFactory.build_batch(USERS)
+        batch_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        UserFactory.build_batch(USERS, validate=True)
+        validated_ms = (time.perf_counter() - started) * 1000
+
+        results = {
+            "users": USERS,
+            "faker_ms": faker_ms,
+            "batch_ms": batch_ms,
+            "batch_validated_ms": validated_ms,
+        }
+        allure.attach(
+            json.dumps(results, indent=2),
+            name="data_factories",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        assert len({user.email for user in users}) == USERS
+        assert batch_ms * 5 < faker_ms, results
+
+    @allure.title("Workers generate reproducible data and disjoint emails")
+    def test_worker_seeding(self) -> None:
+        first_run = [DataPool(100 + worker, worker=worker, run_id="run1") for worker in range(4)]
+        second_run = [DataPool(100 + worker, worker=worker, run_id="run1") for worker in range(4)]
+
+        emails: set[str] = set()
+        for worker, (pool, replay) in enumerate(zip(first_run, second_run, strict=True)):
+            names = pool.names(1000)
+            assert replay.names(1000) == names, f"worker {worker} is not reproducible"
+            assert replay.passwords(10) == pool.passwords(10)
+            emails.update(pool.emails(names))
+        assert len(emails) == 4000
+        # Same seed in the next run: same names, new emails
+        names = [("Ann", "Lee")]
+        assert DataPool(100, run_id="run1").emails(names) != DataPool(100, run_id="run2").emails(
+            names
+        )
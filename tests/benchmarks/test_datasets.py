@@ -0,0 +1,58 @@
+import json
+import time
+from pathlib import Path
+
+import allure
+import pytest
+
+from testdata.datasets import DatasetIndex, DatasetRecord, dataset_params
+
+RECORDS = 200_000
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestDatasets:
+    """Collection cost of dataset-driven parametrization."""
+
+    @allure.title("Large JSONL dataset is indexed without parsing records")
+    def test_index_throughput(self, tmp_path: Path) -> None:
+        path = tmp_path / "payloads.jsonl"
+        with path.open("w", encoding="utf-8") as file:
+            for i in range(RECORDS):
+                payload = {"email": f"user{i}@example.com", "password": "x" * 40}
+                file.write(json.dumps({"payload": payload, "expected_status": 400}) + "\n")
+
+        started = time.perf_counter()
+        marker = dataset_params(path)
+        collect_ms = (time.perf_counter() - started) * 1000
+
+        values = marker.args[1]
+        results = {
+            "records": RECORDS,
+            "file_mb": path.stat().st_size / 1024 / 1024,
+            "collect_ms": collect_ms,
+        }
+        allure.attach(
+            json.dumps(results, indent=2),
+            name="dataset_index",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        assert len(values) == RECORDS
+        assert marker.kwargs["ids"][17] == "payloads-17"
+        assert isinstance(values[17], DatasetRecord)
+        assert values[RECORDS - 1].load()["payload"]["email"] == f"user{RECORDS - 1}@example.com"
+        assert collect_ms < 3000, results
+
+    @allure.title("CSV header, blank lines and CRLF line endings are handled")
+    def test_csv_records(self, tmp_path: Path) -> None:
+        path = tmp_path / "logins.csv"
+        path.write_bytes(
+            b'\xef\xbb\xbfemail,password,status\r\n\r\na@example.com,"p,1",200\r\n  \r\nb@example.com,p2,401'
+        )
+        index = DatasetIndex.load(path)
+        assert len(index) == 2
+        assert index[0] == {"email": "a@example.com", "password": "p,1", "status": "200"}
+        assert index[1]["status"] == "401"
+        assert DatasetIndex.load(path) is index
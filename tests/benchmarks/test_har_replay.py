@@ -0,0 +1,134 @@
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+import allure
+import pytest
+
+from src.ui.har import HarIndex, HarReplayer
+
+if TYPE_CHECKING:
+    # Type only: API-only sessions must not import Playwright
+    from playwright.sync_api import Route
+
+API = "https://api.example.com"
+ENTRIES = 20000
+
+
+def _entry(url: str, body: str, method: str = "GET", post: str | None = None) -> dict[str, Any]:
+    request: dict[str, Any] = {"method": method, "url": url, "headers": []}
+    if post is not None:
+        request["postData"] = {"mimeType": "application/json", "text": post}
+    return {
+        "request": request,
+        "response": {
+            "status": 200,
+            "headers": [
+                {"name": "content-type", "value": "application/json"},
+                {"name": "content-length", "value": str(len(body))},
+            ],
+            "content": {"mimeType": "application/json", "text": body},
+        },
+    }
+
+
+def _write_har(path: Path, entries: list[dict[str, Any]]) -> Path:
+    path.write_text(json.dumps({"log": {"version": "1.2", "entries": entries}}))
+    return path
+
+
+class FakeRoute:
+    def __init__(self, method: str, url: str, body: bytes | None = None) -> None:
+        self.request = SimpleNamespace(method=method, url=url, post_data_buffer=body)
+        self.fulfilled: dict[str, Any] | None = None
+        self.aborted = False
+        self.fell_back = False
+
+    def fulfill(self, **kwargs: Any) -> None:
+        self.fulfilled = kwargs
+
+    def abort(self, error_code: str | None = None) -> None:
+        self.aborted = True
+
+    def fallback(self) -> None:
+        self.fell_back = True
+
+    def as_route(self) -> "Route":
+        """Typed view for handlers expecting a Playwright route."""
+        return cast("Route", self)
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestHarReplay:
+    """HAR replay lookup cost on large recordings."""
+
+    @allure.title("Indexed HAR lookup stays constant on a large HAR")
+    def test_lookup_throughput(self, tmp_path: Path) -> None:
+        entries = [_entry(f"{API}/api/items/{i}?b=2&a=1", f'{{"id": {i}}}') for i in range(ENTRIES)]
+        path = _write_har(tmp_path / "big.har", entries)
+
+        started = time.perf_counter()
+        index = HarIndex.load(path)
+        build_ms = (time.perf_counter() - started) * 1000
+        assert len(index) == ENTRIES
+
+        replayer = HarReplayer(index)
+        routes = [FakeRoute("GET", f"{API}/api/items/{i}?a=1&b=2") for i in range(0, ENTRIES, 10)]
+        started = time.perf_counter()
+        for route in routes:
+            replayer(route.as_route())
+        lookup_us = (time.perf_counter() - started) / len(routes) * 1_000_000
+
+        results = {"entries": ENTRIES, "index_build_ms": build_ms, "lookup_us": lookup_us}
+        allure.attach(
+            json.dumps(results, indent=2),
+            name="har_lookup",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        assert all(route.fulfilled for route in routes)
+        assert HarIndex.load(path) is index
+        assert lookup_us < 200, results
+
+    @allure.title("Repeated requests replay in recorded order, POST bodies are matched")
+    def test_replay_order_and_body_match(self, tmp_path: Path) -> None:
+        path = _write_har(
+            tmp_path / "flow.har",
+            [
+                _entry(f"{API}/api/poll", '{"n": 1}'),
+                _entry(f"{API}/api/poll", '{"n": 2}'),
+                _entry(f"{API}/api/login", '{"ok": false}', "POST", '{"p": "bad"}'),
+                _entry(f"{API}/api/login", '{"ok": true}', "POST", '{"p": "good"}'),
+            ],
+        )
+        replayer = HarReplayer(HarIndex.load(path))
+
+        bodies = []
+        for _ in range(3):
+            route = FakeRoute("GET", f"{API}/api/poll")
+            replayer(route.as_route())
+            assert route.fulfilled is not None
+            bodies.append(route.fulfilled["body"])
+        assert bodies == [b'{"n": 1}', b'{"n": 2}', b'{"n": 2}']
+
+        route = FakeRoute("POST", f"{API}/api/login", b'{"p": "good"}')
+        replayer(route.as_route())
+        assert route.fulfilled is not None
+        assert route.fulfilled["body"] == b'{"ok": true}'
+        assert "content-length" not in route.fulfilled["headers"]
+
+    @allure.title("Strict mode aborts and reports unrecorded requests")
+    def test_strict_misses(self, tmp_path: Path) -> None:
+        path = _write_har(tmp_path / "empty.har", [])
+        route = FakeRoute("GET", f"{API}/api/unknown")
+        HarReplayer(HarIndex.load(path))(route.as_route())
+        assert route.fell_back
+
+        strict = HarReplayer(HarIndex.load(path), strict=True)
+        route = FakeRoute("GET", f"{API}/api/unknown")
+        strict(route.as_route())
+        assert route.aborted
+        assert strict.misses == [f"GET {API}/api/unknown"]
@@ -0,0 +1,122 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import allure
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Fails on any directory creation, reports import time and logger state
+IMPORT_PROBE = """
+import importlib
+import pathlib
+import time
+
+def _forbid_mkdir(*args, **kwargs):
+    raise AssertionError("directory created at import time")
+
+pathlib.Path.mkdir = _forbid_mkdir
+started = time.perf_counter()
+import src.api
+logger_module = importlib.import_module("src.utils.logger")
+elapsed = time.perf_counter() - started
+print(elapsed, logger_module._configured is None)
+"""
+
+# Loaded with -p into every process of a pytest run: reports startup cost per worker
+SESSION_PROBE = """
+import json
+import os
+import sys
+import time
+
+_started = time.perf_counter()
+
+
+def pytest_collection_finish(session):
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "controller")
+    result = {
+        "collect_seconds": time.perf_counter() - _started,
+        "items": len(session.items),
+        "playwright_imported": any(name.startswith("playwright") for name in sys.modules),
+    }
+    with open(os.path.join(os.environ["PROBE_DIR"], worker + ".json"), "w") as file:
+        json.dump(result, file)
+"""
+WORKERS = 2
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestImportTime:
+    """Import cost and side effects of framework modules."""
+
+    @allure.title("Importing src has no logging side effects")
+    def test_import_has_no_side_effects(self) -> None:
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+        elapsed, not_configured = result.stdout.split()
+        allure.attach(elapsed, name="import_seconds", attachment_type=allure.attachment_type.TEXT)
+
+        assert not_configured == "True"
+        assert float(elapsed) < 2.0, f"Importing src took {float(elapsed):.2f}s"
+
+    @allure.title("API-only session does not import Playwright on any xdist worker")
+    def test_api_session_startup(self, tmp_path: Path) -> None:
+        (tmp_path / "session_probe.py").write_text(SESSION_PROBE)
+        env = {
+            **os.environ,
+            "PROBE_DIR": str(tmp_path),
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [str(tmp_path), os.environ.get("PYTHONPATH")])
+            ),
+        }
+        # Deselect everything: workers only start up and collect
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "-m",
+                "api",
+                "-k",
+                "no_such_test",
+                "-n",
+                str(WORKERS),
+                "-p",
+                "session_probe",
+                "-p",
+                "no:cacheprovider",
+                "-o",
+                "addopts=",
+            ],
+            cwd=ROOT_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        # Exit code 5: no tests ran
+        assert result.returncode == 5, result.stdout + result.stderr
+
+        workers = {
+            path.stem: json.loads(path.read_text()) for path in sorted(tmp_path.glob("gw*.json"))
+        }
+        allure.attach(
+            json.dumps(workers, indent=2),
+            name="api_session_startup",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        assert len(workers) == WORKERS, result.stdout + result.stderr
+        for worker, stats in workers.items():
+            assert not stats["playwright_imported"], f"{worker} imported Playwright"
@@ -0,0 +1,123 @@
+import json
+import time
+from collections.abc import Callable
+
+import allure
+import pytest
+
+from src.utils.helpers import (
+    sanitize_payload,
+    sanitize_stream,
+    sanitize_text,
+    sanitize_text_prefix,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _course(index: int) -> dict[str, object]:
+    return {
+        "name": f"Course {index}",
+        "country": "Poland",
+        "language": "English",
+        "type": "Automation QA",
+        "startDate": "01.09.2026",
+    }
+
+
+def _courses_body(count: int) -> dict[str, object]:
+    return {"courses": [_course(index) for index in range(count)]}
+
+
+PAYLOADS = {
+    "login_1kb": {"email": "user@example.com", "password": "Password123", "jwt-token": "a" * 800},
+    "courses_100kb": _courses_body(800),
+    "courses_5mb": _courses_body(40000),
+}
+
+
+def _best_ms(func: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestSanitizerThroughput:
+    """Sanitizer throughput over realistic API payload sizes."""
+
+    @allure.title("Sanitizer throughput: {name}")
+    @pytest.mark.parametrize("name", list(PAYLOADS))
+    def test_sanitizer_throughput(self, name: str) -> None:
+        payload = PAYLOADS[name]
+        text = json.dumps(payload)
+        body = text.encode()
+        chunks = [body[i : i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+
+        results = {
+            "size_kb": round(len(body) / 1024, 1),
+            "payload_ms": _best_ms(lambda: sanitize_payload(payload)),
+            "text_ms": _best_ms(lambda: sanitize_text(text)),
+            "prefix_ms": _best_ms(lambda: sanitize_text_prefix(body)),
+            "stream_ms": _best_ms(lambda: b"".join(sanitize_stream(chunks))),
+        }
+        allure.attach(
+            json.dumps(results, indent=2),
+            name=f"sanitizer_{name}",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+        stream_mb_per_s = len(body) / 1024 / 1024 / (results["stream_ms"] / 1000)
+        assert results["prefix_ms"] < 1, results
+        assert stream_mb_per_s > 20, results
+
+    @allure.title("Payload without sensitive keys is not copied")
+    def test_copy_on_write(self) -> None:
+        payload = PAYLOADS["courses_5mb"]
+        assert sanitize_payload(payload) is payload
+
+    @allure.title("Streaming mode matches text mode across chunk boundaries")
+    def test_stream_matches_text(self) -> None:
+        body = json.dumps(PAYLOADS["login_1kb"]).encode()
+        for size in (1, 7, 64, 1024):
+            chunks = [body[i : i + size] for i in range(0, len(body), size)]
+            streamed = b"".join(sanitize_stream(chunks)).decode()
+            assert streamed == sanitize_text_prefix(body, limit=len(body))
+            assert "Password123" not in streamed
+
+    @allure.title("Non-ASCII text before a secret does not shift masking offsets")
+    def test_non_ascii_prefix(self) -> None:
+        text = "İ" * 20 + ' x password="abcdefghijkl"'
+        assert "abcdefghijkl" not in sanitize_text(text)
+        assert "abcdefghijkl" not in sanitize_text_prefix(text)
+        assert "abcdefghijkl" not in sanitize_text_prefix(text.encode())
+        streamed = b"".join(sanitize_stream([text.encode()[:30], text.encode()[30:]]))
+        assert b"abcdefghijkl" not in streamed
+
+    @allure.title("Prefixed token keys are masked in text mode")
+    def test_prefixed_token_keys(self) -> None:
+        text = 'id_token="abcdefghijkl" csrf_token="mnopqrstuvwx"'
+        sanitized = sanitize_text(text)
+        assert "abcdefghijkl" not in sanitized
+        assert "mnopqrstuvwx" not in sanitized
+
+    @allure.title("Response prefix masks non-string values")
+    def test_prefix_masks_scalars(self) -> None:
+        body = json.dumps({"api_key": 1234567, "token": None, "name": "ok"}).encode()
+        sanitized = sanitize_text_prefix(body)
+        assert "1234567" not in sanitized
+        assert '"name": "ok"' in sanitized
+        assert "hunter22" not in sanitize_text_prefix("password=hunter22&next=/")
+
+    @allure.title("Response prefix masks values with escaped quotes")
+    def test_prefix_masks_escaped_quotes(self) -> None:
+        body = json.dumps({"password": 'ab"cdefghij', "n": 2}).encode()
+        sanitized = sanitize_text_prefix(body)
+        assert "cdefghij" not in sanitized
+        assert sanitized.endswith('"n": 2}')
+        assert b"cdefghij" not in b"".join(sanitize_stream([body[:20], body[20:]]))
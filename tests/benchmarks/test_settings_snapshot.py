@@ -0,0 +1,50 @@
+import json
+import time
+from collections.abc import Callable
+
+import allure
+import pytest
+from pydantic import SecretStr
+
+from config.settings import Settings, get_settings
+
+ROUNDS = 50
+
+
+def _best_ms(func: Callable[[], object], repeat: int = ROUNDS) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestSettingsSnapshot:
+    """Cost of settings resolution in xdist workers."""
+
+    @allure.title("Worker settings from snapshot skip env file parsing")
+    def test_snapshot_is_cheaper_than_env_parsing(self) -> None:
+        resolved = get_settings("dev").with_overrides(
+            browser="firefox", headless=False, test_user_password=SecretStr("s3cret")
+        )
+        # Snapshot travels to workers through execnet: JSON-compatible values only
+        snapshot = json.loads(json.dumps(resolved.snapshot()))
+
+        env_ms = _best_ms(lambda: get_settings.__wrapped__("dev"))
+        snapshot_ms = _best_ms(lambda: Settings.from_snapshot(snapshot))
+
+        results = {"env_files_ms": env_ms, "snapshot_ms": snapshot_ms}
+        allure.attach(
+            json.dumps(results, indent=2),
+            name="settings_snapshot",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        rebuilt = Settings.from_snapshot(snapshot)
+        assert rebuilt == resolved
+        assert rebuilt.browser == "firefox"
+        assert rebuilt.test_user_password.get_secret_value() == "s3cret"
+        assert snapshot_ms * 10 < env_ms, results
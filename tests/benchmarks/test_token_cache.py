@@ -0,0 +1,132 @@
+import base64
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import allure
+import pytest
+
+from src.utils.token_cache import TokenCache, jwt_expiry
+
+KEY = TokenCache.key("http://api.test", "user@example.com", "secret")
+WORKERS = 8
+
+shared_tier = pytest.mark.skipif(sys.platform == "win32", reason="shared tier needs fcntl")
+
+
+def fake_jwt(**claims: object) -> str:
+    """Unsigned JWT with given claims."""
+
+    def segment(data: dict[str, object]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    return f"{segment({'alg': 'none'})}.{segment(claims)}.signature"
+
+
+class FakeLogin:
+    """Login callable issuing numbered tokens valid for ``ttl`` seconds (None: no exp)."""
+
+    def __init__(self, ttl: float | None = 3600, delay: float = 0.0) -> None:
+        self.calls = 0
+        self._ttl = ttl
+        self._delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        time.sleep(self._delay)
+        with self._lock:
+            self.calls += 1
+            claims: dict[str, object] = {"sub": f"login-{self.calls}"}
+        if self._ttl is not None:
+            claims["exp"] = int(time.time() + self._ttl)
+        return fake_jwt(**claims)
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestTokenCache:
+    """Token reuse, refresh and invalidation across cache tiers."""
+
+    @allure.title("jwt_expiry reads exp claim and ignores unreadable tokens")
+    def test_jwt_expiry(self) -> None:
+        assert jwt_expiry(fake_jwt(exp=1_900_000_000)) == 1_900_000_000
+        assert jwt_expiry(fake_jwt(sub="no-exp")) is None
+        assert jwt_expiry(fake_jwt(exp="soon")) is None
+        assert jwt_expiry("opaque-token") is None
+        assert jwt_expiry("a.%%%.c") is None
+
+    @allure.title("Token is reused until refresh margin before expiry")
+    def test_refresh_margin(self) -> None:
+        long_lived = FakeLogin(ttl=3600)
+        cache = TokenCache(refresh_margin=60)
+        first = cache.get(KEY, long_lived)
+        assert cache.get(KEY, long_lived) == first
+        assert long_lived.calls == 1
+
+        # Expires within the margin: every get logs in again
+        short_lived = FakeLogin(ttl=30)
+        cache = TokenCache(refresh_margin=60)
+        assert cache.get(KEY, short_lived) != cache.get(KEY, short_lived)
+        assert short_lived.calls == 2
+
+    @allure.title("Token without exp lives for default_ttl")
+    def test_default_ttl(self) -> None:
+        login = FakeLogin(ttl=None)
+        cache = TokenCache(refresh_margin=60, default_ttl=120)
+        cache.get(KEY, login)
+        cache.get(KEY, login)
+        assert login.calls == 1
+
+        login = FakeLogin(ttl=None)
+        cache = TokenCache(refresh_margin=60, default_ttl=30)
+        cache.get(KEY, login)
+        cache.get(KEY, login)
+        assert login.calls == 2
+
+    @shared_tier
+    @allure.title("Concurrent caches on one shared file log in once")
+    def test_shared_tier_single_login(self, tmp_path: Path) -> None:
+        # One cache per thread stands in for one xdist worker process
+        login = FakeLogin(delay=0.05)
+        tokens: list[str] = []
+
+        def worker() -> None:
+            tokens.append(TokenCache(shared_dir=tmp_path).get(KEY, login))
+
+        threads = [threading.Thread(target=worker) for _ in range(WORKERS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert login.calls == 1
+        assert len(set(tokens)) == 1 and len(tokens) == WORKERS
+
+    @shared_tier
+    @allure.title("invalidate drops token from memory and shared file")
+    def test_invalidate(self, tmp_path: Path) -> None:
+        login = FakeLogin()
+        cache = TokenCache(shared_dir=tmp_path)
+        first = cache.get(KEY, login)
+
+        cache.invalidate(KEY)
+
+        assert KEY not in json.loads((tmp_path / "tokens.json").read_text())
+        other_worker = TokenCache(shared_dir=tmp_path)
+        assert other_worker.get(KEY, login) != first
+        assert cache.get(KEY, login) != first
+        assert login.calls == 2
+
+    @shared_tier
+    @allure.title("clear_shared removes shared token file")
+    def test_clear_shared(self, tmp_path: Path) -> None:
+        cache = TokenCache(shared_dir=tmp_path)
+        cache.get(KEY, FakeLogin())
+        assert (tmp_path / "tokens.json").exists()
+
+        cache.clear_shared()
+
+        assert not (tmp_path / "tokens.json").exists()
@@ -0,0 +1,88 @@
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+import allure
+import pytest
+
+from src.ui.visual import VisualBaselines
+
+SCREENSHOTS = 500
+SCREENSHOT_KB = 100
+
+
+@allure.epic("Framework")
+@allure.feature("Benchmarks")
+@pytest.mark.benchmark
+class TestVisualDiff:
+    """Cost of comparing screenshots with visual baselines."""
+
+    @allure.title("Unchanged screenshots pass the hash pre-check without decoding")
+    def test_unchanged_precheck_throughput(self, tmp_path: Path) -> None:
+        baselines = VisualBaselines(tmp_path)
+        # Pre-check compares bytes only: content does not need to be a decodable PNG
+        screenshots = {f"page_{i}": os.urandom(SCREENSHOT_KB * 1024) for i in range(SCREENSHOTS)}
+        recorder = VisualBaselines(tmp_path, update=True)
+        for name, data in screenshots.items():
+            recorder.compare(name, data)
+
+        started = time.perf_counter()
+        results = [baselines.compare(name, data) for name, data in screenshots.items()]
+        per_compare_ms = (time.perf_counter() - started) / SCREENSHOTS * 1000
+
+        allure.attach(
+            json.dumps({"screenshots": SCREENSHOTS, "per_compare_ms": per_compare_ms}, indent=2),
+            name="visual_precheck",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        assert all(result.passed and result.reason == "identical" for result in results)
+        assert per_compare_ms < 1, per_compare_ms
+
+    @allure.title("Changed screenshot is diffed per pixel, ignore regions are excluded")
+    def test_pixel_diff(self, tmp_path: Path) -> None:
+        np = pytest.importorskip("numpy")
+        image_module = pytest.importorskip("PIL.Image")
+
+        def png(pixels: object) -> bytes:
+            buffer = io.BytesIO()
+            image_module.fromarray(pixels).save(buffer, format="PNG")
+            return buffer.getvalue()
+
+        rng = np.random.default_rng(0)
+        expected = rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8)
+        changed = expected.copy()
+        changed[100:150, 200:400] = 255 - changed[100:150, 200:400]
+        noisy = expected.copy()
+        noisy[::7, ::7] = np.clip(noisy[::7, ::7].astype(np.int16) + 8, 0, 255)
+
+        baselines = VisualBaselines(tmp_path, max_diff_ratio=0.001)
+        VisualBaselines(tmp_path, update=True).compare("page", png(expected))
+        changed_png = png(changed)
+
+        started = time.perf_counter()
+        result = baselines.compare("page", changed_png)
+        diff_ms = (time.perf_counter() - started) * 1000
+
+        allure.attach(
+            json.dumps({"pixels": expected.size // 3, "diff_ms": diff_ms}, indent=2),
+            name="visual_pixel_diff",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        assert not result.passed
+        assert result.diff_ratio == pytest.approx(50 * 200 / (720 * 1280), rel=0.01)
+        assert result.diff_png is not None
+        assert baselines.compare("page", changed_png, ignore=[(200, 100, 200, 50)]).passed
+        assert baselines.compare("page", png(noisy)).passed
+        assert diff_ms < 500, diff_ms
+
+    @allure.title("Missing baseline fails unless baselines are being updated")
+    def test_missing_baseline(self, tmp_path: Path) -> None:
+        result = VisualBaselines(tmp_path).compare("typo", b"png")
+        assert not result.passed
+        assert "baseline missing" in result.reason
+        assert not VisualBaselines(tmp_path).path_for("typo").exists()
+
+        assert VisualBaselines(tmp_path, update=True).compare("typo", b"png").passed
+        assert VisualBaselines(tmp_path).compare("typo", b"png").reason == "identical"
@@ -1,18 +1,45 @@
-from collections.abc import Generator
+import itertools
+import os
+import re
+from collections.abc import AsyncGenerator, Generator, Mapping
+from pathlib import Path
 from typing import Any
 
+import allure
 import pytest
 
 from config.settings import Settings, get_settings
-from src.utils.test_data_manager import TestDataManager
+from fixtures import SETTINGS_KEY
+from src.api.sdk import ApiContext
+from src.utils.logger import (
+    configure_logging,
+    get_failure_log_buffer,
+    merge_worker_logs,
+    shutdown_logging,
+)
+from src.utils.resource_journal import ResourceJournal, account_deleter, sweep_orphans
+from src.utils.test_data_manager import (
+    AsyncTestDataManager,
+    DeferredCleanupQueue,
+    TestDataManager,
+)
+from testdata.factories.data_pool import random_seed, seed_data_pool
 
-# Import all fixtures from fixtures module
+# Import all fixtures from fixtures module; UI fixtures are loaded on demand
 pytest_plugins = [
+    "fixtures.asyncio_plugin",
     "fixtures.api_fixtures",
-    "fixtures.ui_fixtures",
     "fixtures.data_fixtures",
 ]
 
+UI_PLUGIN = "fixtures.ui_fixtures"
+UI_TESTS_DIR = Path(__file__).resolve().parent / "ui"
+API_TESTS_DIR = Path(__file__).resolve().parent / "api"
+# Parentheses and mark names (pytest's identifier characters) of a -m expression
+_MARKEXPR_TOKEN_RE = re.compile(r"[()]|[\w:+\-.\[\]\\/]+")
+SUITE_MARKS = ("api", "ui")
+MAX_MARKEXPR_NAMES = 10
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add custom command line options."""
@@ -36,11 +63,174 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Run browser in headed mode",
     )
+    parser.addoption(
+        "--ui",
+        action="store_true",
+        default=False,
+        help="Load UI fixtures even if no UI tests are selected",
+    )
+
+
+def _evaluate_markexpr(tokens: list[str], marks: Mapping[str, bool]) -> bool:
+    """Evaluate tokenized ``-m`` expression for a test carrying ``marks``.
+
+    Raises:
+        SyntaxError: If tokens are not a boolean expression of mark names.
+    """
+    position = 0
+
+    def disjunction() -> bool:
+        nonlocal position
+        result = conjunction()
+        while position < len(tokens) and tokens[position] == "or":
+            position += 1
+            result = conjunction() or result
+        return result
+
+    def conjunction() -> bool:
+        nonlocal position
+        result = negation()
+        while position < len(tokens) and tokens[position] == "and":
+            position += 1
+            result = negation() and result
+        return result
+
+    def negation() -> bool:
+        nonlocal position
+        if position == len(tokens):
+            raise SyntaxError("unexpected end of expression")
+        token = tokens[position]
+        position += 1
+        if token == "not":
+            return not negation()
+        if token == "(":
+            result = disjunction()
+            if position == len(tokens) or tokens[position] != ")":
+                raise SyntaxError("expected ')'")
+            position += 1
+            return result
+        if token in ("and", "or", ")"):
+            raise SyntaxError(f"unexpected {token!r}")
+        return marks.get(token, False)
+
+    result = disjunction()
+    if position != len(tokens):
+        raise SyntaxError(f"unexpected {tokens[position]!r}")
+    return result
+
+
+def _marks_may_select(markexpr: str, mark: str) -> bool:
+    """Check if ``-m`` expression can match some test carrying ``mark``.
+
+    Suite marks are exclusive (a test is marked ``api`` or ``ui``, never both);
+    other marks named in the expression may be set or unset on that test, so
+    every combination of them is tried (expressions name only a few marks).
+    """
+    tokens = _MARKEXPR_TOKEN_RE.findall(markexpr)
+    if "".join(tokens) != "".join(markexpr.split()):
+        # Syntax beyond names, operators and parentheses (e.g. mark kwargs): assume it may
+        return True
+    suite = {name: name == mark for name in SUITE_MARKS}
+    others = sorted(set(tokens) - {"and", "or", "not", "(", ")", mark, *suite})
+    if len(others) > MAX_MARKEXPR_NAMES:
+        return True
+    try:
+        return any(
+            _evaluate_markexpr(
+                tokens, {**suite, mark: True, **dict(zip(others, values, strict=True))}
+            )
+            for values in itertools.product((False, True), repeat=len(others))
+        )
+    except SyntaxError:
+        # pytest reports the malformed expression itself
+        return True
+
+
+def _may_select(config: pytest.Config, tests_dir: Path, mark: str) -> bool:
+    """Check if the session may select tests marked ``mark`` under ``tests_dir``."""
+    markexpr = config.getoption("markexpr")
+    if markexpr and not _marks_may_select(markexpr, mark):
+        return False
+    for arg in config.args:
+        path = (config.invocation_params.dir / arg.split("::")[0]).resolve()
+        if path.is_relative_to(tests_dir) or tests_dir.is_relative_to(path):
+            return True
+    return False
+
+
+def _wants_ui(config: pytest.Config) -> bool:
+    """Check if the session may run UI tests: by --ui, -m expression and collection paths."""
+    return bool(config.getoption("--ui")) or _may_select(config, UI_TESTS_DIR, "ui")
+
+
+def _runs_api_tests(config: pytest.Config) -> bool:
+    """Check if the session may run (not only collect) API tests."""
+    return not config.getoption("collectonly") and _may_select(config, API_TESTS_DIR, "api")
+
+
+def _resolve_settings(config: pytest.Config) -> Settings:
+    """Build settings once on the controller; xdist workers rebuild them from its snapshot."""
+    snapshot = getattr(config, "workerinput", {}).get("settings")
+    if snapshot is not None:
+        return Settings.from_snapshot(snapshot)
+    resolved = get_settings(config.getoption("--env"))
+    overrides: dict[str, Any] = {"browser": config.getoption("--browser")}
+    if config.getoption("--headed"):
+        overrides["headless"] = False
+    if resolved.test_data_seed is None:
+        # One base seed for the whole run, so the logged seed reproduces every worker
+        overrides["test_data_seed"] = random_seed()
+    return resolved.with_overrides(**overrides)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node: Any) -> None:
+    """Hand resolved settings to an xdist worker (controller only)."""
+    node.workerinput["settings"] = node.config.stash[SETTINGS_KEY].snapshot()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Resolve settings, load UI plugin if needed, configure logging and test data seed."""
+    env_settings = config.stash[SETTINGS_KEY] = _resolve_settings(config)
+    # Playwright and page objects are imported only by sessions that may run UI tests
+    if _wants_ui(config):
+        config.pluginmanager.import_plugin(UI_PLUGIN)
+    configure_logging(env_settings, worker_id=os.environ.get("PYTEST_XDIST_WORKER"))
+    seed_data_pool(env_settings.test_data_seed)
+
+    # Controller (or single process) only; journals of running processes are skipped
+    if (
+        env_settings.sweep_orphans
+        and not hasattr(config, "workerinput")
+        and _runs_api_tests(config)
+    ):
+        context = ApiContext(env_settings)
+        try:
+            sweep_orphans(
+                {"account": account_deleter(context)},
+                min_age=env_settings.sweep_min_age_seconds,
+            )
+        finally:
+            context.close()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Flush logs; controller merges worker log files after all workers finished."""
+    shutdown_logging()
+    if not hasattr(config, "workerinput"):
+        merge_worker_logs()
+
+
+def pytest_ignore_collect(collection_path: Path, config: pytest.Config) -> bool | None:
+    """Skip UI test directory when UI plugin is not loaded (nothing there would run)."""
+    if collection_path == UI_TESTS_DIR and not config.pluginmanager.has_plugin(UI_PLUGIN):
+        return True
+    return None
 
 
 @pytest.fixture(scope="session")
 def settings(request: pytest.FixtureRequest) -> Settings:
-    """Get settings for current environment.
+    """Get settings for current environment, with CLI overrides applied.
 
     Args:
         request: Pytest request with CLI options.
@@ -48,42 +238,52 @@ def settings(request: pytest.FixtureRequest) -> Settings:
     Returns:
         Settings instance.
     """
-    env = request.config.getoption("--env")
-    # Clear cache to reload settings
-    get_settings.cache_clear()
-    loaded_settings = get_settings(env)
-    loaded_settings.validate_runtime()
-    return loaded_settings
+    resolved = request.config.stash[SETTINGS_KEY]
+    resolved.validate_runtime()
+    return resolved
 
 
-@pytest.fixture(scope="session", autouse=True)
-def configure_settings(request: pytest.FixtureRequest, settings: Settings) -> None:
-    """Configure settings from CLI options.
+@pytest.fixture(scope="session")
+def resource_journal() -> Generator[ResourceJournal, None, None]:
+    """Journal of resources created by this process (one file per xdist worker)."""
+    journal = ResourceJournal(ResourceJournal.new_path())
+    yield journal
+    journal.close()
 
-    Args:
-        request: Pytest request with CLI options.
-    """
-    # Override browser if specified
-    browser = request.config.getoption("--browser")
-    if browser:
-        object.__setattr__(settings, "browser", browser)
 
-    # Override headless if --headed specified
-    if request.config.getoption("--headed"):
-        object.__setattr__(settings, "headless", False)
+@pytest.fixture(scope="session")
+def deferred_cleanup(settings: Settings) -> Generator[DeferredCleanupQueue, None, None]:
+    """Queue for managers whose cleanups may run in background; drained at session end."""
+    queue = DeferredCleanupQueue(max_workers=settings.cleanup_workers)
+    yield queue
+    queue.drain()
 
 
 @pytest.fixture
-def test_data_manager() -> Generator[TestDataManager, None, None]:
+def test_data_manager(
+    settings: Settings,
+    resource_journal: ResourceJournal,
+) -> Generator[TestDataManager, None, None]:
     """Create test data manager and cleanup after test."""
-    manager = TestDataManager()
+    manager = TestDataManager(max_workers=settings.cleanup_workers, journal=resource_journal)
     yield manager
     manager.cleanup_all()
 
 
+@pytest.fixture
+async def async_test_data_manager(
+    settings: Settings,
+    resource_journal: ResourceJournal,
+) -> AsyncGenerator[AsyncTestDataManager, None]:
+    """Create async test data manager and await cleanups after test."""
+    manager = AsyncTestDataManager(max_workers=settings.cleanup_workers, journal=resource_journal)
+    yield manager
+    await manager.cleanup_all()
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item: pytest.Item) -> Generator[None, Any, None]:
-    """Store test result for fixture access (screenshot on failure).
+    """Store test result for fixture access (screenshot on failure) and emit buffered logs.
 
     Args:
         item: Test item.
@@ -91,3 +291,15 @@ def pytest_runtest_makereport(item: pytest.Item) -> Generator[None, Any, None]:
     outcome: Any = yield
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
+
+    # Buffered logging: emit logs only for failed tests
+    buffer = get_failure_log_buffer()
+    if buffer is None:
+        return
+    if rep.failed:
+        text = buffer.drain()
+        if text:
+            rep.sections.append(("Captured loguru", text))
+            allure.attach(text, name=f"log_{rep.when}", attachment_type=allure.attachment_type.TEXT)
+    elif rep.when == "teardown":
+        buffer.clear()
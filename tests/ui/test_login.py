@@ -1,6 +1,8 @@
 import allure
 import pytest
 
+from config.settings import Settings
+from src.ui.aio import AsyncBrowserSession, AsyncLoginPage
 from src.ui.pages.login_page import LoginPage
 
 
@@ -18,3 +20,18 @@ class TestLogin:
         login_page.open()
 
         login_page.assert_login_page_loaded()
+
+    @allure.story("Login")
+    @allure.title("Login page loads in concurrent browser contexts")
+    @pytest.mark.regression
+    def test_login_page_loads_concurrently(
+        self, settings: Settings, async_ui: AsyncBrowserSession
+    ) -> None:
+        """Test that login page loads for several users at once."""
+
+        async def open_login_page() -> None:
+            async with async_ui.new_page() as page:
+                login_page = await AsyncLoginPage(page, settings.base_url).open()
+                await login_page.assert_login_page_loaded()
+
+        async_ui.run(async_ui.gather(*(open_login_page() for _ in range(3))))